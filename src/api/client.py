@@ -2,61 +2,608 @@
 UEFA API Client for fetching Champions League data
 """
 
+import copy
 import http.client
 import json
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from src.api.competitions import DEFAULT_COMPETITION, Competition
+from src.api.hedging import HedgePolicy
+from src.api.response_cache import ResponseCache
+from src.core.metrics import METRICS
+from src.core.singleflight import SingleFlight
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip/deflate are negotiated
+    brotli = None
+
+
+class _Decoder:
+    """Incremental decoder for one Content-Encoding"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding in ("gzip", "x-gzip", "deflate"):
+            # wbits 32 + MAX_WBITS accepts both gzip and zlib headers
+            self._zlib = zlib.decompressobj(32 + zlib.MAX_WBITS)
+            self._brotli = None
+        elif encoding == "br" and brotli is not None:
+            self._zlib = None
+            self._brotli = brotli.Decompressor()
+        elif encoding == "identity":
+            self._zlib = self._brotli = None
+        else:
+            raise ValueError(f"Unsupported Content-Encoding '{encoding}'")
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._zlib is not None:
+            return self._zlib.decompress(chunk)
+        if self._brotli is not None:
+            return self._brotli.process(chunk)
+        return chunk
+
+    def flush(self) -> bytes:
+        if self._zlib is not None:
+            return self._zlib.flush()
+        return b""
+
+
+class ConnectionPool:
+    """One keep-alive connection per thread to a single host, shareable between clients"""
+
+    def __init__(self, host: str, port: Optional[int] = None, use_https: bool = True):
+        """
+        Args:
+            host: API host
+            port: API port (default: 443 for HTTPS, 80 for HTTP)
+            use_https: Open HTTPS connections
+        """
+        self.host = host
+        self.port = port
+        self.use_https = use_https
+        self._local = threading.local()
+        self._connections: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> http.client.HTTPConnection:
+        """Return this thread's keep-alive connection, opening it if needed"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if self.use_https
+                else http.client.HTTPConnection
+            )
+            conn = connection_class(self.host, self.port)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def drop(self) -> None:
+        """Close and forget this thread's connection so the next request reconnects"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+    def close(self) -> None:
+        """Close all connections"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
 
 class UEFAApiClient:
     """Client for communicating with UEFA's fantasy football API"""
 
     BASE_HOST = "gaming.uefa.com"
-    FIXTURES_ENDPOINT = "/en/uclfantasy/services/feeds/fixtures/fixtures_80_en.json"
-    PLAYERS_ENDPOINT = "/en/uclfantasy/services/feeds/players/players_80_en_2.json"
+    # JSON compresses 5-10x; brotli is only offered when the module is installed
+    ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+    # Bytes read from the socket per decompression step
+    READ_CHUNK_SIZE = 64 * 1024
+    # Default seconds allowed to open a connection / for each socket read
+    CONNECT_TIMEOUT = 5.0
+    READ_TIMEOUT = 30.0
+    # Concurrent background requests when a cached payload may be served
+    REVALIDATE_WORKERS = 32
+    # Concurrent requests (and their duplicates) when hedging is enabled
+    HEDGE_WORKERS = 64
+    # Endpoints of the default competition
+    FIXTURES_ENDPOINT = DEFAULT_COMPETITION.fixtures_endpoint
+    PLAYERS_ENDPOINT = DEFAULT_COMPETITION.players_endpoint
+
+    # Browser-like headers the Gameplay API expects for opponent-team requests
+    TEAM_HEADERS = {
+        "accept": "application/json",
+        "accept-language": "en-US,en;q=0.9",
+        "access-control-expose-headers": "Date",
+        "dnt": "1",
+        "entity": "ed0t4n$3!",
+        "priority": "u=1, i",
+        "referer": "https://gaming.uefa.com/en/uclfantasy/team/18034ca6-8818-11f0-801e-7568b2125093/0041006200640065006c006c00610068/0/0/0/00330030003100360033003300300038",
+        "sec-ch-ua": '"Not=A?Brand";v="24", "Chromium";v="140"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "sec-fetch-dest": "empty",
+        "sec-fetch-mode": "cors",
+        "sec-fetch-site": "same-origin",
+        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+        # Note: Not including cookies as they contain sensitive session data
+        # User will need to provide authentication if needed
+    }
 
-    def __init__(self):
+    def __init__(
+        self,
+        base_host: Optional[str] = None,
+        port: Optional[int] = None,
+        use_https: bool = True,
+        competition: Optional[Competition] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            base_host: API host (default: gaming.uefa.com)
+            port: API port (default: 443 for HTTPS, 80 for HTTP)
+            use_https: Use HTTPS; disable to talk to a local replay server
+            competition: Game, season and language of the feeds (default: UCL)
+            connect_timeout: Seconds allowed to open a connection (default: 5)
+            read_timeout: Seconds allowed for each socket read (default: 30)
+        """
         self.logger = logging.getLogger(__name__)
+        self.base_host = base_host or self.BASE_HOST
+        self.port = port
+        self.use_https = use_https
+        self.competition = competition or DEFAULT_COMPETITION
+        # One keep-alive connection per thread, reused across requests
+        self._pool = ConnectionPool(self.base_host, port, use_https)
+        # Concurrent requests for the same path share one HTTP call
+        self._flights = SingleFlight("http_request")
+        self.connect_timeout = connect_timeout or self.CONNECT_TIMEOUT
+        self.read_timeout = read_timeout or self.READ_TIMEOUT
+        # Monotonic time after which no request is started; see set_deadline()
+        self.deadline: Optional[float] = None
+        # Last good payloads for stale-while-revalidate; see enable_response_cache()
+        self.response_cache: Optional[ResponseCache] = None
+        self.stale_after = 0.0
+        self._revalidator: Optional[ThreadPoolExecutor] = None
+        # Tail-latency hedging; see enable_hedging()
+        self.hedging: Optional[HedgePolicy] = None
+        self._hedger: Optional[ThreadPoolExecutor] = None
+        # Per-request timelines, collected only once enable_trace() is called
+        self.trace: Optional[List[Dict[str, Any]]] = None
+        self._trace_lock = threading.Lock()
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return this thread's keep-alive connection, opening it if needed"""
+        return self._pool.get()
+
+    def _drop_connection(self) -> None:
+        """Close and forget this thread's connection so the next request reconnects"""
+        self._pool.drop()
+
+    def for_competition(self, competition: Competition) -> "UEFAApiClient":
+        """
+        Client for another competition sharing this client's connection pool,
+        in-flight requests and trace
+
+        Args:
+            competition: Competition the new client fetches
+
+        Returns:
+            A new UEFAApiClient
+        """
+        client = copy.copy(self)
+        client.competition = competition
+        return client
+
+    def set_deadline(self, seconds: Optional[float]) -> None:
+        """
+        Bound the whole run: requests fail fast once the deadline has passed,
+        and socket timeouts never extend beyond it
+
+        Args:
+            seconds: Seconds from now, or None to remove the deadline
+        """
+        self.deadline = time.monotonic() + seconds if seconds else None
+
+    def _remaining(self) -> Optional[float]:
+        """Seconds left before the run deadline, or None without one"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def enable_response_cache(self, directory: str, stale_after: float = 2.0) -> None:
+        """
+        Keep the last good payload of every endpoint and serve it when the API is slow or failing
+
+        With a cached payload available, a request waits at most stale_after
+        seconds for the API. If the API is slower, or fails, the cached
+        payload is returned (as a CachedPayload with stale=True) while the
+        request carries on in the background and refreshes the cache.
+
+        Args:
+            directory: Cache directory
+            stale_after: Seconds to wait for the API before serving the cached payload;
+                0 always serves the cache first and revalidates in the background
+        """
+        self.response_cache = ResponseCache(directory)
+        self.stale_after = stale_after
+        if self._revalidator is None:
+            self._revalidator = ThreadPoolExecutor(
+                max_workers=self.REVALIDATE_WORKERS, thread_name_prefix="revalidate"
+            )
+
+    def enable_hedging(self, percentile: float = 95.0, max_rate: float = 0.05) -> None:
+        """
+        Send a duplicate of any request still running after the observed
+        percentile latency of its endpoint, and use whichever answers first
+
+        All API requests are idempotent GETs, so a duplicate is harmless
+        beyond the extra load, which max_rate bounds.
+
+        Args:
+            percentile: Latency percentile after which a request is duplicated
+            max_rate: Maximum duplicates as a fraction of requests
+        """
+        self.hedging = HedgePolicy(percentile=percentile, max_rate=max_rate)
+        if self._hedger is None:
+            self._hedger = ThreadPoolExecutor(
+                max_workers=self.HEDGE_WORKERS, thread_name_prefix="hedge"
+            )
+
+    def enable_trace(self) -> None:
+        """Start recording a start/connect/TTFB/done timeline for every request"""
+        self.trace = []
+
+    def _record_trace(
+        self,
+        endpoint: str,
+        attempt: int,
+        reused: bool,
+        started: float,
+        connected: float,
+        first_byte: float,
+        done: float,
+        status: int,
+        size: int,
+        encoding: str = "identity",
+        decoded_size: Optional[int] = None,
+    ) -> None:
+        entry = {
+            "start": started,
+            "thread": threading.current_thread().name,
+            "endpoint": endpoint,
+            "attempt": attempt,
+            "reused_connection": reused,
+            "connect_ms": round((connected - started) * 1000, 3),
+            "ttfb_ms": round((first_byte - started) * 1000, 3),
+            "done_ms": round((done - started) * 1000, 3),
+            "status": status,
+            "bytes": size,
+            "encoding": encoding,
+            "decoded_bytes": size if decoded_size is None else decoded_size,
+        }
+        with self._trace_lock:
+            self.trace.append(entry)
+
+    def write_trace(self, path: str) -> int:
+        """
+        Write the recorded request timeline as JSON lines, ordered by start time
+
+        Start times are written as milliseconds since the first request.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Number of requests written
+        """
+        with self._trace_lock:
+            entries = sorted(self.trace or [], key=lambda entry: entry["start"])
+        origin = entries[0]["start"] if entries else 0.0
+
+        with open(path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                line = dict(entry, start=round((entry["start"] - origin) * 1000, 3))
+                f.write(json.dumps(line) + "\n")
+
+        self.logger.info(f"Wrote timeline of {len(entries)} requests to {path}")
+        return len(entries)
+
+    def close(self) -> None:
+        """Close all pooled connections, after background revalidations and hedges finish"""
+        if self._revalidator is not None:
+            self._revalidator.shutdown(wait=True)
+            self._revalidator = None
+        if self._hedger is not None:
+            self._hedger.shutdown(wait=True)
+            self._hedger = None
+        self._pool.close()
 
-    def _make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def endpoint_name(endpoint: str) -> str:
+        """Short endpoint family used as a metrics label (e.g. 'popupstats')"""
+        path = endpoint.split("?", 1)[0]
+        for name in ("fixtures", "players", "popupstats", "opponent-team"):
+            if f"/{name}" in path:
+                return name
+        return "other"
+
+    def _read_body(self, response: http.client.HTTPResponse, endpoint_name: str):
+        """
+        Read a response body, decompressing chunk by chunk as it arrives
+
+        Args:
+            response: Response whose headers have been read
+            endpoint_name: Endpoint family for metrics
+
+        Returns:
+            Tuple of (decoded body, bytes on the wire, content encoding)
+        """
+        encoding = (response.getheader("Content-Encoding") or "identity").strip().lower()
+        decoder = _Decoder(encoding)
+        body = bytearray()
+        wire_bytes = 0
+        decompress_seconds = 0.0
+
+        while True:
+            chunk = response.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            wire_bytes += len(chunk)
+            start = time.perf_counter()
+            body += decoder.decompress(chunk)
+            decompress_seconds += time.perf_counter() - start
+        body += decoder.flush()
+
+        if encoding != "identity":
+            METRICS.observe("decompress_seconds", decompress_seconds, endpoint=endpoint_name)
+        return bytes(body), wire_bytes, encoding
+
+    def _make_request(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Make HTTP request to UEFA API
+        Make HTTP request to UEFA API, sharing the call with concurrent
+        requests for the same endpoint
+
+        The parsed payload is shared between coalesced callers and must not
+        be mutated. With the response cache enabled, a slow or failed request
+        may be answered with the last good payload (a CachedPayload).
 
         Args:
             endpoint: API endpoint to call
+            headers: Optional request headers
 
         Returns:
             Parsed JSON response or None if failed
         """
-        start_time = time.time()
+        endpoint_name = self.endpoint_name(endpoint)
+        cached = self.response_cache.load(endpoint) if self.response_cache else None
+        if cached is None:
+            return self._flights.do(
+                endpoint, lambda: self._call(endpoint, headers), endpoint=endpoint_name
+            )
 
+        # Stale-while-revalidate: give the API stale_after seconds, then fall
+        # back to the cached payload and let the request finish in the background
+        future = self._revalidator.submit(
+            self._flights.do,
+            endpoint,
+            lambda: self._call(endpoint, headers),
+            endpoint=endpoint_name,
+        )
         try:
-            conn = http.client.HTTPSConnection(self.BASE_HOST)
-            conn.request("GET", endpoint)
+            payload = future.result(timeout=self.stale_after) if self.stale_after > 0 else None
+        except FutureTimeoutError:
+            payload = None
+        if payload is not None:
+            return payload
 
-            response = conn.getresponse()
+        METRICS.incr("http_stale_served", endpoint=endpoint_name)
+        self.logger.warning(
+            f"Serving cached {endpoint_name} payload from {cached.age:.0f}s ago "
+            f"while {endpoint} revalidates"
+        )
+        return cached
 
-            if response.status != 200:
-                self.logger.error(f"HTTP {response.status}: {response.reason}")
-                return None
+    async def request_async(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Asyncio variant of _make_request
 
-            data = response.read()
-            parsed_data = json.loads(data.decode("utf-8"))
+        The request runs in the event loop's default executor and is shared
+        with concurrent callers for the same endpoint, threaded or not.
 
-            end_time = time.time()
-            self.logger.debug(
-                f"Request completed in {end_time - start_time:.2f} seconds"
-            )
+        Args:
+            endpoint: API endpoint to call
+            headers: Optional request headers
+
+        Returns:
+            Parsed JSON response or None if failed
+        """
+        return await self._flights.do_async(
+            endpoint,
+            lambda: self._call(endpoint, headers),
+            endpoint=self.endpoint_name(endpoint),
+        )
+
+    def _call(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch an endpoint, hedged if enabled"""
+        if self.hedging is None:
+            return self._fetch(endpoint, headers)
+
+        endpoint_name = self.endpoint_name(endpoint)
+        delay = self.hedging.delay(endpoint_name)
+        if delay is None:
+            # Too few latencies observed yet to know what a straggler is
+            return self._timed_fetch(endpoint, headers, endpoint_name)
+
+        # The caller waits on futures so it can take whichever attempt
+        # answers first; each worker thread has its own pooled connection
+        primary = self._hedger.submit(self._timed_fetch, endpoint, headers, endpoint_name)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        if not self.hedging.acquire():
+            METRICS.incr("http_hedges_capped", endpoint=endpoint_name)
+            return primary.result()
+
+        METRICS.incr("http_hedges", endpoint=endpoint_name)
+        self.logger.debug(f"Hedging {endpoint} after {delay * 1000:.0f} ms")
+        hedge = self._hedger.submit(self._timed_fetch, endpoint, headers, endpoint_name)
+        pending = {primary, hedge}
+        result = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    if future is hedge:
+                        METRICS.incr("http_hedge_wins", endpoint=endpoint_name)
+                    # The slower attempt finishes in the background and is discarded
+                    return result
+        return result
+
+    def _timed_fetch(
+        self, endpoint: str, headers: Optional[Dict[str, str]], endpoint_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """_fetch that feeds the latency of successful requests to the hedge policy"""
+        start = time.perf_counter()
+        result = self._fetch(endpoint, headers)
+        if result is not None:
+            self.hedging.record(endpoint_name, time.perf_counter() - start)
+        return result
+
+    def _fetch(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make HTTP request to UEFA API over a pooled keep-alive connection
 
-            return parsed_data
+        Compression is negotiated with Accept-Encoding and the body is
+        decompressed incrementally while it is read.
 
-        except Exception as e:
-            self.logger.error(f"Error making request to {endpoint}: {str(e)}")
+        Args:
+            endpoint: API endpoint to call
+            headers: Optional request headers
+
+        Returns:
+            Parsed JSON response or None if failed
+        """
+        start_time = time.time()
+        endpoint_name = self.endpoint_name(endpoint)
+        remaining = self._remaining()
+        if remaining is not None and remaining <= 0:
+            METRICS.incr("http_deadline_exceeded", endpoint=endpoint_name)
+            self.logger.error(f"Run deadline exceeded, not requesting {endpoint}")
             return None
-        finally:
-            if "conn" in locals():
-                conn.close()
+        request_headers = {"Accept-Encoding": self.ACCEPT_ENCODING}
+        request_headers.update(headers or {})
+
+        # A pooled connection may have been closed by the server while idle,
+        # so retry once on a fresh connection before giving up
+        for attempt in range(2):
+            try:
+                with METRICS.span("http_request", endpoint=endpoint_name):
+                    conn = self._get_connection()
+                    started = time.perf_counter()
+                    reused = conn.sock is not None
+                    remaining = self._remaining()
+                    if not reused:
+                        conn.timeout = self._clamp(self.connect_timeout, remaining)
+                        # Connect explicitly so the timeline separates TCP/TLS setup
+                        conn.connect()
+                    conn.sock.settimeout(self._clamp(self.read_timeout, remaining))
+                    connected = time.perf_counter()
+                    conn.request("GET", endpoint, headers=request_headers)
+
+                    response = conn.getresponse()
+                    first_byte = time.perf_counter()
+                    # Always drain the body so the connection can be reused
+                    data, wire_bytes, encoding = self._read_body(response, endpoint_name)
+
+                if self.trace is not None:
+                    self._record_trace(
+                        endpoint, attempt, reused, started, connected,
+                        first_byte, time.perf_counter(), response.status, wire_bytes,
+                        encoding, len(data),
+                    )
+
+                METRICS.incr("http_responses", endpoint=endpoint_name, status=response.status)
+                METRICS.observe("http_response_bytes", wire_bytes, endpoint=endpoint_name)
+                METRICS.incr("http_wire_bytes", wire_bytes, endpoint=endpoint_name, encoding=encoding)
+                METRICS.incr("http_decoded_bytes", len(data), endpoint=endpoint_name, encoding=encoding)
+
+                if response.status != 200:
+                    self.logger.error(f"HTTP {response.status}: {response.reason}")
+                    if response.status in [401, 403]:
+                        self.logger.warning(
+                            "Authentication required: check the request's auth headers and the "
+                            "user GUID. The last good payload is served if one is cached."
+                        )
+                    return None
+
+                with METRICS.span("decode", endpoint=endpoint_name):
+                    parsed_data = json.loads(data)
+
+                if self.response_cache is not None:
+                    self.response_cache.store(endpoint, parsed_data)
+
+                end_time = time.time()
+                self.logger.debug(
+                    f"Request completed in {end_time - start_time:.2f} seconds "
+                    f"({wire_bytes} bytes {encoding}, {len(data)} decoded)"
+                )
+
+                return parsed_data
+
+            except (http.client.HTTPException, ConnectionError) as e:
+                self._drop_connection()
+                if attempt == 0:
+                    METRICS.incr("http_retries", endpoint=endpoint_name)
+                    self.logger.debug(f"Retrying {endpoint} on a new connection: {e}")
+                    continue
+                self.logger.error(f"Error making request to {endpoint}: {str(e)}")
+                return None
+
+            except TimeoutError as e:
+                # Not retried: a hung request already cost a full timeout
+                self._drop_connection()
+                METRICS.incr("http_timeouts", endpoint=endpoint_name)
+                self.logger.error(f"Timed out requesting {endpoint}: {str(e) or 'timeout'}")
+                return None
+
+            except Exception as e:
+                self._drop_connection()
+                self.logger.error(f"Error making request to {endpoint}: {str(e)}")
+                return None
+
+        return None
+
+    @staticmethod
+    def _clamp(timeout: float, remaining: Optional[float]) -> float:
+        """Timeout shortened to the time left before the run deadline"""
+        if remaining is None:
+            return timeout
+        return max(0.001, min(timeout, remaining))
 
     def fetch_fixtures_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -65,8 +612,8 @@ class UEFAApiClient:
         Returns:
             Raw fixtures data from API
         """
-        self.logger.info("Fetching UEFA fixtures data")
-        return self._make_request(self.FIXTURES_ENDPOINT)
+        self.logger.info(f"Fetching UEFA fixtures data ({self.competition.key})")
+        return self._make_request(self.competition.fixtures_endpoint)
 
     def fetch_players_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -75,8 +622,8 @@ class UEFAApiClient:
         Returns:
             Raw players data from API
         """
-        self.logger.info("Fetching UEFA players data")
-        return self._make_request(self.PLAYERS_ENDPOINT)
+        self.logger.info(f"Fetching UEFA players data ({self.competition.key})")
+        return self._make_request(self.competition.players_endpoint)
 
     def fetch_player_fantasy_data(self, player_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -88,8 +635,24 @@ class UEFAApiClient:
         Returns:
             Raw player fantasy data from API
         """
-        endpoint = (
-            f"/en/uclfantasy/services/feeds/popupstats/popupstats_80_{player_id}.json"
-        )
+        endpoint = self.competition.popupstats_endpoint(player_id)
         self.logger.debug(f"Fetching fantasy data for player {player_id}")
         return self._make_request(endpoint)
+
+    def fetch_team_data(
+        self, user_guid: str, matchday_id, phase_id: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a user's fantasy team (opponent-team endpoint) from UEFA API
+
+        Args:
+            user_guid: User GUID for the team
+            matchday_id: Matchday ID
+            phase_id: Phase ID (default: 0)
+
+        Returns:
+            Raw team data from API
+        """
+        endpoint = self.competition.team_endpoint(user_guid, matchday_id, phase_id)
+        self.logger.info(f"Fetching team data from {self.base_host}{endpoint}")
+        return self._make_request(endpoint, headers=self.TEAM_HEADERS)
@@ -0,0 +1,98 @@
+"""
+Competition/season/language parameters for the UEFA fantasy feeds
+"""
+
+from typing import NamedTuple
+
+
+class Competition(NamedTuple):
+    """
+    Identifies one UEFA fantasy game and season
+
+    Attributes:
+        game: Game slug used in feed paths (e.g. 'uclfantasy')
+        feed_id: Numeric feed ID of the game season (e.g. 80)
+        language: Feed language (e.g. 'en')
+        players_version: Version suffix of the players feed file
+        name: Short name used to label outputs (defaults to game-feed_id)
+    """
+
+    game: str
+    feed_id: int
+    language: str = "en"
+    players_version: int = 2
+    name: str = ""
+
+    @property
+    def key(self) -> str:
+        """Short label used in output names, metrics and logs"""
+        if self.name:
+            return self.name
+        key = f"{self.game}-{self.feed_id}"
+        return key if self.language == "en" else f"{key}-{self.language}"
+
+    @property
+    def fixtures_endpoint(self) -> str:
+        return (
+            f"/{self.language}/{self.game}/services/feeds/fixtures/"
+            f"fixtures_{self.feed_id}_{self.language}.json"
+        )
+
+    @property
+    def players_endpoint(self) -> str:
+        return (
+            f"/{self.language}/{self.game}/services/feeds/players/"
+            f"players_{self.feed_id}_{self.language}_{self.players_version}.json"
+        )
+
+    def popupstats_endpoint(self, player_id) -> str:
+        return (
+            f"/{self.language}/{self.game}/services/feeds/popupstats/"
+            f"popupstats_{self.feed_id}_{player_id}.json"
+        )
+
+    def team_endpoint(self, user_guid: str, matchday_id, phase_id: int = 0) -> str:
+        return (
+            f"/{self.language}/{self.game}/services/api/Gameplay/user/{user_guid}/opponent-team"
+            f"?matchdayId={matchday_id}&phaseId={phase_id}&opponentguid={user_guid}"
+        )
+
+    @classmethod
+    def parse(cls, spec: str) -> "Competition":
+        """
+        Parse a competition from a preset name or 'GAME:FEED_ID[:LANGUAGE[:PLAYERS_VERSION]]'
+
+        Args:
+            spec: e.g. 'ucl' or 'uclfantasy:80:en'
+
+        Returns:
+            Competition
+
+        Raises:
+            ValueError: If the spec is neither a preset nor a valid GAME:FEED_ID spec
+        """
+        if spec in COMPETITIONS:
+            return COMPETITIONS[spec]
+
+        parts = spec.split(":")
+        if len(parts) < 2 or len(parts) > 4 or not parts[0]:
+            raise ValueError(
+                f"Invalid competition '{spec}', expected one of {sorted(COMPETITIONS)} "
+                "or GAME:FEED_ID[:LANGUAGE[:PLAYERS_VERSION]]"
+            )
+        try:
+            feed_id = int(parts[1])
+            players_version = int(parts[3]) if len(parts) > 3 else 2
+        except ValueError:
+            raise ValueError(f"Invalid competition '{spec}': feed ID and version must be numbers")
+
+        language = parts[2] if len(parts) > 2 and parts[2] else "en"
+        return cls(parts[0], feed_id, language, players_version)
+
+
+# Known games, selectable by name with --competition
+COMPETITIONS = {
+    "ucl": Competition("uclfantasy", 80, "en", 2, name="ucl"),
+}
+
+DEFAULT_COMPETITION = COMPETITIONS["ucl"]
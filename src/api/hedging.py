@@ -0,0 +1,85 @@
+"""
+Hedged requests: duplicate a request that is slower than the observed tail latency
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class HedgePolicy:
+    """
+    Decides when a request should be hedged and caps how often
+
+    Latencies of successful requests are kept in a rolling window per
+    endpoint family. A request still running after the window's percentile
+    latency gets one duplicate, as long as hedges stay under max_rate of
+    all requests seen so far.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_rate: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+    ):
+        """
+        Args:
+            percentile: Latency percentile after which a duplicate is sent
+            max_rate: Maximum duplicates as a fraction of requests
+            min_samples: Latencies needed before an endpoint is hedged
+            window: Recent latencies kept per endpoint family
+        """
+        self.percentile = percentile
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.window = window
+        self.requests = 0
+        self.hedges = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint_name: str, seconds: float) -> None:
+        """Add the latency of a successful request"""
+        with self._lock:
+            samples = self._latencies.get(endpoint_name)
+            if samples is None:
+                samples = self._latencies[endpoint_name] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def delay(self, endpoint_name: str) -> Optional[float]:
+        """
+        Seconds to wait before hedging a new request
+
+        Also counts the request towards the duplicate budget.
+
+        Args:
+            endpoint_name: Endpoint family (e.g. 'popupstats')
+
+        Returns:
+            The percentile latency, or None while too few latencies are known
+        """
+        with self._lock:
+            self.requests += 1
+            samples = self._latencies.get(endpoint_name)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        # Nearest rank, as in the metrics histograms
+        rank = min(len(ordered), max(1, math.ceil(self.percentile / 100 * len(ordered)))) - 1
+        return ordered[rank]
+
+    def acquire(self) -> bool:
+        """Take one duplicate from the budget; False once max_rate is reached"""
+        with self._lock:
+            if self.hedges + 1 > self.max_rate * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    @property
+    def hedge_rate(self) -> float:
+        """Duplicates sent as a fraction of requests"""
+        return self.hedges / self.requests if self.requests else 0.0
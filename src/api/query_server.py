@@ -0,0 +1,327 @@
+"""
+Read-only JSON HTTP API over in-memory indexes of processed data
+"""
+
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.core.metrics import METRICS
+from src.core.query_index import POINTS_FIELD, IndexLoader, QueryError, QueryIndex
+
+
+class QueryServer:
+    """
+    Serves players, teams, fixtures and the opponents table from a QueryIndex
+
+    Routes (all GET, JSON responses):
+        /health                 index generation, load time and sizes
+        /players                filter, sort and paginate players
+        /players/top            top-k players by a field
+        /players/<id>           one player
+        /players/<id>/similar   nearest neighbours (?k=, ?min_value=, ?max_value=, ?any_position=1)
+        /teams                  teams and their player counts
+        /opponents[/<team>]     opponents table
+        /fixtures               fixtures (?matchday=, ?team=)
+
+    Player filters: ``team``, ``position`` or any field for equality
+    (comma-separated values are ORed), ``min_<field>``/``max_<field>`` for
+    numeric ranges. Paging: ``sort``, ``order`` (asc/desc), ``offset``,
+    ``limit``; ``fields`` selects the returned fields.
+
+    A background thread polls the sources and swaps in a freshly built
+    index when a run rewrites them. Requests in progress keep using the
+    index they started with.
+    """
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 500
+    # Query parameters that are not player filters
+    RESERVED_PARAMS = ("sort", "order", "offset", "limit", "fields", "by", "k")
+
+    def __init__(
+        self,
+        loader: IndexLoader,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        reload_interval: float = 2.0,
+    ):
+        """
+        Args:
+            loader: Builds indexes from the run's outputs
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            reload_interval: Seconds between checks for new data (0 disables hot reload)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.loader = loader
+        self.reload_interval = reload_interval
+        self.generation = 0
+        self.index: QueryIndex = QueryIndex([])
+        self._signature = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self.reload(force=True)
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuild the index if a source changed since the last load
+
+        A failed load (e.g. a file being replaced) keeps the current index
+        and is retried on the next check.
+
+        Args:
+            force: Rebuild even if nothing changed
+
+        Returns:
+            True if a new index was swapped in
+        """
+        with self._reload_lock:
+            signature = self.loader.signature()
+            if not force and signature == self._signature:
+                return False
+            try:
+                with METRICS.span("serve_reload"):
+                    index = self.loader.load()
+            except Exception as e:
+                self.logger.error(f"Error reloading data, keeping the current index: {str(e)}")
+                return False
+            self.index = index
+            self._signature = signature
+            self.generation += 1
+        self.logger.info(f"Serving index generation {self.generation} ({len(index)} players)")
+        return True
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.reload_interval):
+            self.reload()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def _int_param(self, params: Dict[str, List[str]], name: str, default: int, maximum: int) -> int:
+        value = params.get(name, [None])[-1]
+        if value is None:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            raise QueryError(f"'{name}' must be an integer")
+        if number < 0:
+            raise QueryError(f"'{name}' must not be negative")
+        return min(number, maximum)
+
+    def _float_param(self, params: Dict[str, List[str]], name: str) -> Optional[float]:
+        value = params.get(name, [None])[-1]
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            raise QueryError(f"'{name}' must be a number")
+
+    def _player_filters(self, params: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+        equals: Dict[str, List[str]] = {}
+        ranges: Dict[str, List[Optional[float]]] = {}
+        for name, values in params.items():
+            if name in self.RESERVED_PARAMS:
+                continue
+            bound = name[:4]
+            if bound in ("min_", "max_"):
+                try:
+                    number = float(values[-1])
+                except ValueError:
+                    raise QueryError(f"'{name}' must be a number")
+                field_range = ranges.setdefault(name[4:], [None, None])
+                field_range[0 if bound == "min_" else 1] = number
+            else:
+                equals[name] = [value for joined in values for value in joined.split(",")]
+        return equals, {field: tuple(bounds) for field, bounds in ranges.items()}
+
+    @staticmethod
+    def _fields(params: Dict[str, List[str]]) -> Optional[List[str]]:
+        fields = params.get("fields")
+        return [field for joined in fields for field in joined.split(",")] if fields else None
+
+    def route(self, path: str, query: str) -> Tuple[int, Any]:
+        """
+        Answer one request against the current index
+
+        Args:
+            path: URL path
+            query: URL query string
+
+        Returns:
+            Tuple of (HTTP status, JSON-serializable body)
+        """
+        index = self.index
+        params = parse_qs(query)
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+
+        try:
+            if parts == ["health"]:
+                return 200, {
+                    "status": "ok",
+                    "generation": self.generation,
+                    "loaded_at": index.loaded_at,
+                    "players": len(index),
+                    "opponents": len(index.opponents),
+                    "fixture_matchdays": len(index.fixtures),
+                    "sources": index.sources,
+                }
+
+            if parts == ["players"]:
+                equals, ranges = self._player_filters(params)
+                order = params.get("order", ["desc"])[-1]
+                if order not in ("asc", "desc"):
+                    raise QueryError("'order' must be 'asc' or 'desc'")
+                result = index.find_players(
+                    equals,
+                    ranges,
+                    sort_by=params.get("sort", [None])[-1],
+                    descending=order == "desc",
+                    offset=self._int_param(params, "offset", 0, len(index)),
+                    limit=self._int_param(params, "limit", self.DEFAULT_LIMIT, self.MAX_LIMIT),
+                    fields=self._fields(params),
+                )
+                return 200, dict(result, generation=self.generation)
+
+            if parts == ["players", "top"]:
+                equals, ranges = self._player_filters(params)
+                players = index.top_players(
+                    by=params.get("by", [POINTS_FIELD])[-1],
+                    k=self._int_param(params, "k", 10, self.MAX_LIMIT),
+                    equals=equals,
+                    ranges=ranges,
+                    fields=self._fields(params),
+                )
+                return 200, {"players": players, "generation": self.generation}
+
+            if len(parts) == 2 and parts[0] == "players":
+                player = index.get_player(parts[1])
+                if player is None:
+                    return 404, {"error": f"Player '{parts[1]}' not found"}
+                return 200, player
+
+            if len(parts) == 3 and parts[0] == "players" and parts[2] == "similar":
+                if index.get_player(parts[1]) is None:
+                    return 404, {"error": f"Player '{parts[1]}' not found"}
+                players = index.similarity.similar(
+                    parts[1],
+                    k=self._int_param(params, "k", 5, self.MAX_LIMIT),
+                    min_value=self._float_param(params, "min_value"),
+                    max_value=self._float_param(params, "max_value"),
+                    same_position=params.get("any_position", ["0"])[-1] in ("0", "false", ""),
+                )
+                return 200, {"players": players, "generation": self.generation}
+
+            if parts == ["teams"]:
+                return 200, {"teams": index.teams()}
+
+            if parts == ["opponents"]:
+                return 200, {"opponents": index.opponents}
+
+            if len(parts) == 2 and parts[0] == "opponents":
+                if parts[1] not in index.opponents:
+                    return 404, {"error": f"Team '{parts[1]}' not found"}
+                return 200, {"team": parts[1], "opponents": index.opponents[parts[1]]}
+
+            if parts == ["fixtures"]:
+                return 200, {
+                    "fixtures": index.fixtures_for(
+                        params.get("matchday", [None])[-1], params.get("team", [None])[-1]
+                    )
+                }
+
+        except QueryError as e:
+            return 400, {"error": str(e)}
+
+        return 404, {"error": f"Unknown path '{path}'"}
+
+    def _make_handler(self):
+        server = self
+
+        class QueryHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                route = url.path.strip("/").split("/", 1)[0] or "root"
+                with METRICS.span("serve_request", route=route):
+                    status, body = server.route(url.path, url.query)
+                    payload = json.dumps(body, separators=(",", ":"), default=str).encode("utf-8")
+                METRICS.incr("serve_responses", route=route, status=status)
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("X-Index-Generation", str(server.generation))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                server.logger.debug(format % args)
+
+        return QueryHandler
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "QueryServer":
+        """Serve in background threads"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="query-server", daemon=True
+        )
+        self._thread.start()
+        if self.reload_interval > 0:
+            self._stop.clear()
+            self._watcher = threading.Thread(
+                target=self._watch, name="query-reload", daemon=True
+            )
+            self._watcher.start()
+        self.logger.info(f"Query API listening on http://{self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and reloading"""
+        self._stop.set()
+        if self._watcher:
+            self._watcher.join()
+            self._watcher = None
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted"""
+        with self:
+            while True:
+                time.sleep(3600)
+
+    def __enter__(self) -> "QueryServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
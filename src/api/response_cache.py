@@ -0,0 +1,103 @@
+"""
+On-disk cache of the last good API payload per endpoint, for stale-while-revalidate
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+
+class CachedPayload(dict):
+    """
+    A payload served from the response cache instead of the live API
+
+    Behaves like the parsed JSON dict; ``stale`` and ``fetched_at`` tell
+    callers it may be out of date.
+    """
+
+    stale = True
+
+    def __init__(self, payload: Dict[str, Any], fetched_at: float):
+        super().__init__(payload)
+        self.fetched_at = fetched_at
+
+    @property
+    def age(self) -> float:
+        """Seconds since the payload was fetched"""
+        return time.time() - self.fetched_at
+
+
+class ResponseCache:
+    """Stores one JSON file per endpoint under a directory"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Cache directory (created on first store)
+        """
+        self.directory = directory
+        self.logger = logging.getLogger(__name__)
+
+    def _path(self, endpoint: str) -> str:
+        digest = hashlib.sha1(endpoint.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def load(self, endpoint: str) -> Optional[CachedPayload]:
+        """
+        Last good payload of an endpoint
+
+        Args:
+            endpoint: Request path
+
+        Returns:
+            CachedPayload or None if nothing usable is cached
+        """
+        try:
+            with open(self._path(endpoint), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry for {endpoint}: {str(e)}")
+            return None
+
+        if entry.get("endpoint") != endpoint or not isinstance(entry.get("payload"), dict):
+            return None
+        return CachedPayload(entry["payload"], entry.get("fetched_at", 0.0))
+
+    def store(self, endpoint: str, payload: Dict[str, Any]) -> bool:
+        """
+        Save a freshly fetched payload
+
+        The file is written next to its final path and renamed, so readers
+        never see a partial entry.
+
+        Args:
+            endpoint: Request path
+            payload: Parsed JSON payload
+
+        Returns:
+            True if stored, False otherwise
+        """
+        path = self._path(endpoint)
+        tmp_path = f"{path}.{os.getpid()}.{id(payload)}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"endpoint": endpoint, "fetched_at": time.time(), "payload": payload},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Error caching response for {endpoint}: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
@@ -3,38 +3,155 @@ CLI Application for UEFA Champions League Fantasy Data Processor
 """
 
 import argparse
+import csv
 import logging
+import os
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from src.api.client import UEFAApiClient
-from src.core.processors import (
-    FixturesDataProcessor,
-    OpponentsTableBuilder,
-    PlayersDataProcessor,
-)
-from src.core.team_mapper import TeamMapper
-from src.core.team_analyzer import TeamAnalyzer
-from src.exporters.csv_exporter import CSVExporter
-from src.exporters.dynamodb_exporter import DynamoDBExporter
+from src.api.competitions import DEFAULT_COMPETITION, Competition
+
+# Components are imported and built on first use so each subcommand only pays
+# for what it needs (boto3 alone dominates the startup of a fixtures run).
 
 
 class CLIApp:
     """Main CLI application class"""
 
-    def __init__(self):
+    # Local caches (team indexes per competition)
+    CACHE_DIR = ".fapi_cache"
+
+    # Players export formats: default target and file extension
+    PLAYERS_TARGETS = {
+        "csv": "players_data.csv",
+        "ddb": "new-manual-fapi-ddb",
+        "sqlite": "players_data.db",
+        "parquet": "players_data.parquet",
+    }
+    EXPORT_EXTENSIONS = {"csv": ".csv", "ddb": "", "sqlite": ".db", "parquet": ".parquet"}
+    # Commands that call the API
+    API_COMMANDS = ("fixtures", "players", "watch", "team", "league")
+
+    def __init__(self, competition: Optional[Competition] = None):
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
+        # Set from the global --competition option; the first one drives
+        # single-competition commands (watch, history, team)
+        self.competitions: List[Competition] = [competition or DEFAULT_COMPETITION]
+        # Appended to output names when several competitions run together
+        self.output_suffix = ""
+        # Set from the global --metrics-json/--metrics-prom options
+        self.metrics_json: Optional[str] = None
+        self.metrics_prom: Optional[str] = None
+
+    @cached_property
+    def api_client(self):
+        from src.api.client import UEFAApiClient
+
+        return UEFAApiClient(competition=self.competitions[0])
+
+    @cached_property
+    def team_mapper(self):
+        from src.core.team_mapper import TeamMapper
+
+        mapper = TeamMapper()
+        mapper.load_cache(self.team_cache_path)
+        return mapper
+
+    @property
+    def team_cache_path(self) -> str:
+        return os.path.join(self.CACHE_DIR, f"teams_{self.competitions[0].key}.json")
+
+    @cached_property
+    def fixtures_processor(self):
+        from src.core.processors import FixturesDataProcessor
+
+        return FixturesDataProcessor(self.team_mapper)
+
+    @cached_property
+    def opponents_builder(self):
+        from src.core.processors import OpponentsTableBuilder
+
+        return OpponentsTableBuilder(self.team_mapper)
+
+    @cached_property
+    def players_processor(self):
+        from src.core.processors import PlayersDataProcessor
+
+        return PlayersDataProcessor(self.api_client, team_mapper=self.team_mapper)
+
+    @cached_property
+    def csv_exporter(self):
+        from src.exporters.csv_exporter import CSVExporter
+
+        return CSVExporter(self.team_mapper)
+
+    @cached_property
+    def dynamodb_exporter(self):
+        from src.exporters.dynamodb_exporter import DynamoDBExporter
+
+        return DynamoDBExporter()
+
+    @cached_property
+    def team_analyzer(self):
+        from src.core.team_analyzer import TeamAnalyzer
+
+        return TeamAnalyzer(self.dynamodb_exporter, self.csv_exporter, self.api_client)
+
+    def for_competition(self, competition: Competition) -> "CLIApp":
+        """
+        App for another competition, sharing this app's API connection pool
 
-        # Initialize components
-        self.api_client = UEFAApiClient()
-        self.team_mapper = TeamMapper()
-        self.fixtures_processor = FixturesDataProcessor(self.team_mapper)
-        self.opponents_builder = OpponentsTableBuilder(self.team_mapper)
-        self.players_processor = PlayersDataProcessor(self.api_client)
-        self.csv_exporter = CSVExporter(self.team_mapper)
-        self.dynamodb_exporter = DynamoDBExporter()
-        self.team_analyzer = TeamAnalyzer(self.dynamodb_exporter)
+        Its outputs are suffixed with the competition key.
+
+        Args:
+            competition: Competition to process
+
+        Returns:
+            A new CLIApp
+        """
+        app = CLIApp(competition)
+        app.api_client = self.api_client.for_competition(competition)
+        app.output_suffix = competition.key
+        return app
+
+    def run_competitions(self, command: Callable[["CLIApp"], bool]) -> bool:
+        """
+        Run a command for every selected competition
+
+        Several competitions are processed concurrently, one thread each,
+        over the shared connection pool.
+
+        Args:
+            command: Called with the app of each competition
+
+        Returns:
+            True if the command succeeded for every competition
+        """
+        if len(self.competitions) == 1:
+            return command(self)
+
+        apps = [self.for_competition(competition) for competition in self.competitions]
+        with ThreadPoolExecutor(
+            max_workers=len(apps), thread_name_prefix="competition"
+        ) as executor:
+            results = list(executor.map(command, apps))
+
+        for app, success in zip(apps, results):
+            if not success:
+                self.logger.error(f"Failed to process competition '{app.output_suffix}'")
+        return all(results)
+
+    def _scoped(self, name: Optional[str]) -> Optional[str]:
+        """Add this app's competition suffix to an output file, table or directory name"""
+        if not name or not self.output_suffix:
+            return name
+        root, ext = os.path.splitext(name)
+        if ext in (".csv", ".db", ".json", ".parquet"):
+            return f"{root}_{self.output_suffix}{ext}"
+        return f"{name}-{self.output_suffix}"
 
     def setup_logging(self):
         """Configure logging for the application"""
@@ -42,6 +159,13 @@ class CLIApp:
             level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
         )
 
+    @staticmethod
+    def _parse_competition(spec: str) -> Competition:
+        try:
+            return Competition.parse(spec)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
     def create_parser(self) -> argparse.ArgumentParser:
         """
         Create and configure argument parser
@@ -59,13 +183,119 @@ class CLIApp:
   uv run src/main.py players ddb                 # Process players data to DynamoDB
   uv run src/main.py players ddb -o my-table     # Export to custom DynamoDB table
   uv run src/main.py players ddb --region eu-west-1  # Use different AWS region
+  uv run src/main.py players sqlite              # Process players and per-match stats to SQLite
+  uv run src/main.py players csv ddb sqlite      # Fetch once, write all three in one pass
+  uv run src/main.py players csv -s stats.csv    # Also export per-match stats (long format)
+  uv run src/main.py players csv --snapshot-dir snapshots  # Also record a history snapshot
+  uv run src/main.py watch ddb                    # Keep polling and push changed players to DynamoDB
+  uv run src/main.py watch csv --interval 600    # Poll every 10 minutes outside live matches
+  uv run src/main.py history list                # List recorded snapshots
+  uv run src/main.py history diff <old> <new> -f value  # Price changes between two snapshots
+  uv run src/main.py serve --port 8000           # JSON API over players_data.csv, reloaded after runs
   uv run src/main.py team 3f10f14a-80b6-11f0-b138-750c902f7cf8  # Export your fantasy team to CSV
   uv run src/main.py team <guid> -o my_team_analysis.csv  # Export with custom filename
-  uv run src/main.py team <guid> -m 3 -j json/team.json  # Use matchday 3 with JSON fallback
+  uv run src/main.py team <guid> -m 3              # Use matchday 3
   uv run src/main.py team <guid> -m 3 -e my-fantasy-team  # Export team to DynamoDB table
+  uv run src/main.py league --guids-file league.txt -m 5 --from-matchday 1  # Mini-league standings
+  uv run src/main.py --metrics players csv       # Print per-stage timings after the run
+  uv run src/main.py --metrics-prom /var/lib/node_exporter/fapi.prom watch ddb  # Prometheus textfile
+  uv run src/main.py --profile players.folded players csv  # Sample all threads (flame graph input)
+  uv run src/main.py --competition ucl --competition uclfantasy:81 players csv  # Two games at once
+  uv run src/main.py --profile players.pstats --profile-mode cprofile players csv  # Main-thread cProfile
+  uv run src/main.py --trace-requests requests.jsonl players csv  # Per-request timeline
+  uv run src/main.py --deadline 300 --stale-after 1 players csv  # Bound the run, serve cache if slow
+  uv run src/main.py --hedge players csv         # Duplicate requests slower than the p95
+  uv run src/main.py --no-response-cache players csv  # Always wait for the live API
         """,
         )
 
+        parser.add_argument(
+            "--competition",
+            action="append",
+            type=self._parse_competition,
+            metavar="SPEC",
+            help="Competition to process: 'ucl' or GAME:FEED_ID[:LANGUAGE[:PLAYERS_VERSION]]. "
+            "Repeat to process several competitions concurrently (default: ucl)",
+        )
+        parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Print a per-stage timing and request summary when the run ends",
+        )
+        parser.add_argument(
+            "--metrics-json",
+            metavar="PATH",
+            help="Write run metrics as JSON",
+        )
+        parser.add_argument(
+            "--metrics-prom",
+            metavar="PATH",
+            help="Write run metrics as a Prometheus textfile (rewritten after every watch poll)",
+        )
+        parser.add_argument(
+            "--profile",
+            metavar="PATH",
+            help="Profile the command and write the result to PATH",
+        )
+        parser.add_argument(
+            "--profile-mode",
+            choices=["cprofile", "sample"],
+            default="sample",
+            help="sample writes collapsed stacks of all threads with low overhead; cprofile writes "
+            "pstats of the main thread only, missing work done on pool threads (default: sample)",
+        )
+        parser.add_argument(
+            "--trace-requests",
+            metavar="PATH",
+            help="Write a per-request timeline (start, connect, TTFB, done) as JSON lines",
+        )
+        parser.add_argument(
+            "--connect-timeout",
+            type=float,
+            metavar="SECONDS",
+            help="Seconds allowed to connect to the API (default: 5)",
+        )
+        parser.add_argument(
+            "--read-timeout",
+            type=float,
+            metavar="SECONDS",
+            help="Seconds allowed for each read from the API (default: 30)",
+        )
+        parser.add_argument(
+            "--deadline",
+            type=float,
+            metavar="SECONDS",
+            help="Stop starting API requests this many seconds into the run; "
+            "cached payloads are served instead where available",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=float,
+            default=2.0,
+            metavar="SECONDS",
+            help="With a cached copy of a payload, wait this long for the API before serving "
+            "the cached copy and refreshing it in the background; 0 serves the cache first (default: 2)",
+        )
+        parser.add_argument(
+            "--no-response-cache",
+            action="store_true",
+            help="Never answer from cached payloads: wait for the API and fail if it fails",
+        )
+
+        parser.add_argument(
+            "--hedge",
+            action="store_true",
+            help="Send a duplicate of any API request still running after the observed "
+            "p95 latency of its endpoint and use whichever answers first",
+        )
+        parser.add_argument(
+            "--hedge-max-rate",
+            type=float,
+            default=0.05,
+            metavar="FRACTION",
+            help="Maximum hedged duplicates as a fraction of requests (default: 0.05)",
+        )
+
         subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
         # Fixtures command
@@ -78,6 +308,10 @@ class CLIApp:
             default="uefa_opponents_table.csv",
             help="Output CSV filename (default: uefa_opponents_table.csv)",
         )
+        fixtures_parser.add_argument(
+            "--snapshot-dir",
+            help="Record the processed fixtures in this snapshot store directory",
+        )
 
         # Players command
         players_parser = subparsers.add_parser(
@@ -85,21 +319,230 @@ class CLIApp:
         )
         players_parser.add_argument(
             "format",
-            choices=["csv", "ddb"],
-            nargs="?",
-            default="csv",
-            help="Output format: csv for CSV file, ddb for DynamoDB (default: csv)",
+            choices=["csv", "ddb", "sqlite", "parquet"],
+            nargs="*",
+            help="Output format(s): csv for CSV file, ddb for DynamoDB, sqlite for a SQLite database, "
+            "parquet for a Parquet file (needs pyarrow). Several formats are written in one pass (default: csv)",
         )
         players_parser.add_argument(
             "--output",
             "-o",
-            help="Output filename for CSV (default: players_data.csv) or table name for DynamoDB (default: uefa-players)",
+            help="Output filename for CSV (default: players_data.csv), table name for DynamoDB (default: new-manual-fapi-ddb), "
+            "SQLite database (default: players_data.db) or Parquet file (default: players_data.parquet). "
+            "With several formats, used as a base name and each format adds its own extension",
+        )
+        players_parser.add_argument(
+            "--stats-output",
+            "-s",
+            help="Also export per-match stats: CSV filename for csv, table name for ddb (always written to the database for sqlite)",
+        )
+        players_parser.add_argument(
+            "--region",
+            default="eu-central-1",
+            help="AWS region for DynamoDB (default: eu-central-1)",
         )
         players_parser.add_argument(
+            "--snapshot-dir",
+            help="Record the processed players in this snapshot store directory",
+        )
+
+        # Watch command
+        watch_parser = subparsers.add_parser(
+            "watch", help="Keep polling the feeds and push only changed players"
+        )
+        watch_parser.add_argument(
+            "format",
+            choices=["csv", "ddb"],
+            nargs="?",
+            default="ddb",
+            help="Output format: csv rewrites the file on changes, ddb writes changed players only (default: ddb)",
+        )
+        watch_parser.add_argument(
+            "--output",
+            "-o",
+            help="Output filename for CSV (default: players_data.csv) or table name for DynamoDB (default: new-manual-fapi-ddb)",
+        )
+        watch_parser.add_argument(
             "--region",
             default="eu-central-1",
             help="AWS region for DynamoDB (default: eu-central-1)",
         )
+        watch_parser.add_argument(
+            "--interval",
+            type=float,
+            default=900,
+            help="Seconds between polls when no match is live (default: 900)",
+        )
+        watch_parser.add_argument(
+            "--live-interval",
+            type=float,
+            default=60,
+            help="Seconds between polls while matches are live (default: 60)",
+        )
+        watch_parser.add_argument(
+            "--max-polls",
+            type=int,
+            help="Stop after this many polls (default: run until interrupted)",
+        )
+
+        # History command
+        history_parser = subparsers.add_parser(
+            "history", help="Query recorded snapshots of previous runs"
+        )
+        history_parser.add_argument(
+            "action",
+            choices=["list", "show", "diff"],
+            help="list snapshots, show one snapshot, or diff two snapshots",
+        )
+        history_parser.add_argument(
+            "snapshot_ids",
+            nargs="*",
+            help="Snapshot ID(s) or unique prefixes (one for show, two for diff)",
+        )
+        history_parser.add_argument(
+            "--snapshot-dir",
+            default="snapshots",
+            help="Snapshot store directory (default: snapshots)",
+        )
+        history_parser.add_argument(
+            "--matchday",
+            "-m",
+            type=int,
+            help="Only list snapshots for this matchday",
+        )
+        history_parser.add_argument(
+            "--fields",
+            "-f",
+            help="Comma-separated fields to compare in diff (e.g. value,selected by (%%))",
+        )
+
+        # League command
+        league_parser = subparsers.add_parser(
+            "league", help="Compute mini-league standings over many managers' teams"
+        )
+        league_parser.add_argument(
+            "user_guids",
+            nargs="*",
+            help="Manager GUIDs in the league",
+        )
+        league_parser.add_argument(
+            "--guids-file",
+            help="File with one manager GUID per line",
+        )
+        league_parser.add_argument(
+            "--matchday",
+            "-m",
+            type=int,
+            default=3,
+            help="Latest matchday ID (default: 3)",
+        )
+        league_parser.add_argument(
+            "--from-matchday",
+            type=int,
+            help="Also fetch earlier matchdays from this one, for rank movements",
+        )
+        league_parser.add_argument(
+            "--phase",
+            "-p",
+            type=int,
+            default=0,
+            help="Phase ID (default: 0)",
+        )
+        league_parser.add_argument(
+            "--workers",
+            type=int,
+            default=16,
+            help="Concurrent team fetches (default: 16)",
+        )
+        league_parser.add_argument(
+            "--output",
+            "-o",
+            default="league_standings.csv",
+            help="Output CSV filename (default: league_standings.csv)",
+        )
+        league_parser.add_argument(
+            "--ownership",
+            metavar="CSV",
+            help="Also export league ownership, captaincy and effective ownership per player",
+        )
+
+        # Serve command
+        serve_parser = subparsers.add_parser(
+            "serve", help="Serve processed data over a read-only JSON HTTP API"
+        )
+        serve_parser.add_argument(
+            "--players",
+            default="players_data.csv",
+            help="Players CSV to serve (default: players_data.csv)",
+        )
+        serve_parser.add_argument(
+            "--opponents",
+            default="uefa_opponents_table.csv",
+            help="Opponents table CSV to serve (default: uefa_opponents_table.csv)",
+        )
+        serve_parser.add_argument(
+            "--snapshot-dir",
+            help="Serve players and fixtures from the latest snapshots in this store instead of the CSV",
+        )
+        serve_parser.add_argument(
+            "--host",
+            default="127.0.0.1",
+            help="Interface to bind (default: 127.0.0.1)",
+        )
+        serve_parser.add_argument(
+            "--port",
+            type=int,
+            default=8000,
+            help="Port to listen on (default: 8000)",
+        )
+        serve_parser.add_argument(
+            "--reload-interval",
+            type=float,
+            default=2.0,
+            help="Seconds between checks for new data; 0 disables hot reload (default: 2)",
+        )
+
+        # Similar command
+        similar_parser = subparsers.add_parser(
+            "similar", help="Find the players most similar to a player, as replacements"
+        )
+        similar_parser.add_argument("player_id", help="Player to find replacements for")
+        similar_parser.add_argument(
+            "-k",
+            type=int,
+            default=5,
+            help="Number of players to list (default: 5)",
+        )
+        similar_parser.add_argument(
+            "--players",
+            default="players_data.csv",
+            help="Players CSV to search (default: players_data.csv)",
+        )
+        similar_parser.add_argument(
+            "--snapshot-dir",
+            help="Search the latest players snapshot in this store instead of the CSV",
+        )
+        similar_parser.add_argument(
+            "--min-value", type=float, help="Cheapest price accepted"
+        )
+        similar_parser.add_argument(
+            "--max-value", type=float, help="Most expensive price accepted"
+        )
+        similar_parser.add_argument(
+            "--price-band",
+            type=float,
+            help="Only players priced within this much of the player (e.g. 0.5)",
+        )
+        similar_parser.add_argument(
+            "--any-position",
+            action="store_true",
+            help="Also consider players of other positions",
+        )
+        similar_parser.add_argument(
+            "--exclude-team",
+            action="store_true",
+            help="Skip players of the player's own club",
+        )
 
         # Team command
         team_parser = subparsers.add_parser(
@@ -133,11 +576,6 @@ class CLIApp:
             "-e",
             help="DynamoDB table name to export your team to (e.g., my-fantasy-team)",
         )
-        team_parser.add_argument(
-            "--json-fallback",
-            "-j",
-            help="Path to JSON file as fallback if API fails",
-        )
         team_parser.add_argument(
             "--output",
             "-o",
@@ -147,16 +585,41 @@ class CLIApp:
 
         return parser
 
-    def process_fixtures_command(self, output_filename: str) -> bool:
+    def _is_stale(self, payload: Any, feed: str) -> bool:
+        """
+        Report a feed answered from the response cache instead of the live API
+
+        Args:
+            payload: Payload returned by the API client
+            feed: Feed name used in the message
+
+        Returns:
+            True if the payload is a stale cached copy
+        """
+        if not getattr(payload, "stale", False):
+            return False
+        print(
+            f"⚠️  STALE: the API was slow or failing, {feed} data is a cached copy "
+            f"from {payload.age:.0f}s ago (use --no-response-cache to wait for the API)"
+        )
+        return True
+
+    def process_fixtures_command(
+        self, output_filename: str, snapshot_dir: Optional[str] = None
+    ) -> bool:
         """
         Process fixtures command
 
         Args:
             output_filename: Name of output CSV file
+            snapshot_dir: Optional snapshot store directory to record the fixtures in
 
         Returns:
             True if successful, False otherwise
         """
+        output_filename = self._scoped(output_filename)
+        snapshot_dir = self._scoped(snapshot_dir)
+
         try:
             self.logger.info("Starting UEFA fixtures processing")
 
@@ -165,6 +628,7 @@ class CLIApp:
             if not raw_data:
                 self.logger.error("Failed to fetch fixtures data")
                 return False
+            stale = self._is_stale(raw_data, "fixtures")
 
             # Process fixtures
             fixtures_by_matchday = self.fixtures_processor.process_fixtures(raw_data)
@@ -172,6 +636,18 @@ class CLIApp:
                 self.logger.error("No fixtures data to process")
                 return False
 
+            # Processing reloaded the team indexes from the feed
+            self.team_mapper.save_cache(self.team_cache_path)
+
+            if snapshot_dir and stale:
+                self.logger.warning("Not recording a snapshot of stale fixtures data")
+            elif snapshot_dir:
+                from src.core.snapshot_store import SnapshotStore
+
+                SnapshotStore(snapshot_dir).record(
+                    fixtures_by_matchday=fixtures_by_matchday
+                )
+
             # Build opponents table
             opponents_table = self.opponents_builder.build_opponents_table(
                 fixtures_by_matchday
@@ -206,31 +682,92 @@ class CLIApp:
             self.logger.error(f"Error processing fixtures: {str(e)}")
             return False
 
+    def load_fixture_index(self) -> bool:
+        """
+        Fetch fixtures and give the players processor the team x matchday index
+
+        Returns:
+            True if the index was built; otherwise players fall back to
+            their own upcomingMatchesList
+        """
+        raw_fixtures = self.api_client.fetch_fixtures_data()
+        fixtures_by_matchday = (
+            self.fixtures_processor.process_fixtures(raw_fixtures) if raw_fixtures else {}
+        )
+        if not fixtures_by_matchday:
+            self.logger.warning(
+                "Fixtures unavailable, using each player's upcoming matches list"
+            )
+            return False
+
+        self.players_processor.fixture_index = (
+            self.opponents_builder.build_fixture_index(fixtures_by_matchday)
+        )
+        return True
+
+    def _export_target(self, format_type: str, name: Optional[str], several: bool) -> str:
+        """
+        Output file or table name of one export format
+
+        Args:
+            format_type: Export format
+            name: Name given on the command line, if any
+            several: Whether several formats are written together; the name
+                is then a base name and each format adds its extension
+
+        Returns:
+            File or table name, scoped to this app's competition
+        """
+        if not name:
+            target = self.PLAYERS_TARGETS[format_type]
+        elif several:
+            root, ext = os.path.splitext(name)
+            if ext not in self.EXPORT_EXTENSIONS.values():
+                root = name
+            target = root + self.EXPORT_EXTENSIONS[format_type]
+        else:
+            target = name
+        return self._scoped(target)
+
     def process_players_command(
         self,
-        format_type: str,
+        format_type: Union[str, List[str]],
         output_target: Optional[str] = None,
         region: str = "eu-central-1",
+        stats_target: Optional[str] = None,
+        snapshot_dir: Optional[str] = None,
     ) -> bool:
         """
         Process players command with support for multiple output formats
 
+        Players are fetched and processed once, then written to every
+        requested format in a single pass.
+
         Args:
-            format_type: Output format ('csv' or 'ddb')
-            output_target: Output filename for CSV or table name for DynamoDB
+            format_type: Output format or formats ('csv', 'ddb', 'sqlite', 'parquet')
+            output_target: Output filename for CSV/Parquet, table name for DynamoDB or SQLite database
             region: AWS region for DynamoDB
+            stats_target: Output filename or table name for per-match stats
+            snapshot_dir: Optional snapshot store directory to record the players in
 
         Returns:
             True if successful, False otherwise
         """
+        formats = [format_type] if isinstance(format_type, str) else list(format_type)
+        several = len(formats) > 1
+        snapshot_dir = self._scoped(snapshot_dir)
+
         try:
             self.logger.info("Starting UEFA players processing")
 
+            self.load_fixture_index()
+
             # Fetch raw data
             raw_data = self.api_client.fetch_players_data()
             if not raw_data:
                 self.logger.error("Failed to fetch players data")
                 return False
+            stale = self._is_stale(raw_data, "players")
 
             # Process players with fantasy points
             # This is the entry point of the application
@@ -239,41 +776,97 @@ class CLIApp:
                 self.logger.error("No players data to process")
                 return False
 
-            # Export based on format type
-            if format_type == "csv":
-                output_filename = output_target or "players_data.csv"
-                success = self.csv_exporter.export_players_data(
-                    players_data, output_filename
+            # Processing added the players feed's clubs to the team indexes
+            self.team_mapper.save_cache(self.team_cache_path)
+
+            stale_players = self.players_processor.stale_players
+            if stale_players:
+                print(
+                    f"⚠️  STALE: the API was slow or failing, fantasy points of {stale_players} "
+                    "players are cached copies (use --no-response-cache to wait for the API)"
                 )
+                stale = True
 
-                if success:
-                    print("\n=== UEFA Champions League Players Data Created ===")
-                    print(f"Players processed: {len(players_data)}")
-                    print(f"CSV file '{output_filename}' created successfully!")
-
-            elif format_type == "ddb":
-                table_name = output_target or "new-manual-fapi-ddb"
-                # Update DynamoDB exporter region if needed
-                if region != "eu-central-1":
-                    self.dynamodb_exporter.region_name = region
-                    self.dynamodb_exporter._dynamodb = (
-                        None  # Reset client for new region
+            if snapshot_dir and stale:
+                self.logger.warning("Not recording a snapshot of stale players data")
+            elif snapshot_dir:
+                from src.core.snapshot_store import SnapshotStore
+
+                SnapshotStore(snapshot_dir).record(players_data=players_data)
+
+            from src.exporters.pipeline import ExportPipeline
+
+            match_stats = self.players_processor.match_stats
+            targets = {
+                fmt: self._export_target(fmt, output_target, several) for fmt in formats
+            }
+            sinks = []
+            sqlite_exporter = None
+            for fmt in formats:
+                if fmt == "csv":
+                    sinks.append(self.csv_exporter.sink(targets[fmt]))
+                elif fmt == "ddb":
+                    # Update DynamoDB exporter region if needed
+                    if region != "eu-central-1":
+                        self.dynamodb_exporter.region_name = region
+                        self.dynamodb_exporter._dynamodb = (
+                            None  # Reset client for new region
+                        )
+                    # Per-match stats go to their table in the same parallel pass
+                    stats_table = (
+                        self._export_target(fmt, stats_target, several)
+                        if stats_target
+                        else None
                     )
+                    sinks.append(
+                        self.dynamodb_exporter.sink(
+                            targets[fmt],
+                            match_stats=match_stats if stats_table else None,
+                            match_stats_table=stats_table or "uefa-players-match-stats",
+                        )
+                    )
+                elif fmt == "sqlite":
+                    from src.exporters.sqlite_exporter import SQLiteExporter
 
-                success = self.dynamodb_exporter.export_players_data(
-                    players_data, table_name
-                )
+                    sqlite_exporter = SQLiteExporter(targets[fmt])
+                    sinks.append(sqlite_exporter.sink())
+                elif fmt == "parquet":
+                    from src.exporters.parquet_exporter import ParquetSink
+
+                    sinks.append(ParquetSink(targets[fmt]))
 
+            pipeline = ExportPipeline(sinks)
+            success = pipeline.run(players_data)
+
+            if success and stats_target and "csv" in formats:
+                csv_stats_target = self._export_target("csv", stats_target, several)
+                success = self.csv_exporter.export_match_stats(match_stats, csv_stats_target)
                 if success:
+                    print(f"Per-match stats CSV '{csv_stats_target}' created successfully!")
+
+            if success and sqlite_exporter and len(match_stats):
+                success = sqlite_exporter.export_match_stats(match_stats)
+
+            if success:
+                print("\n=== UEFA Champions League Players Data Exported ===")
+                print(f"Players processed: {len(players_data)}")
+                for fmt, result in zip(formats, pipeline.results):
+                    if fmt == "csv":
+                        print(f"CSV file '{targets[fmt]}' created successfully!")
+                    elif fmt == "ddb":
+                        print(f"DynamoDB table '{targets[fmt]}' updated successfully! (region {region})")
+                        if stats_target:
+                            print("DynamoDB per-match stats table updated!")
+                    elif fmt == "sqlite":
+                        print(f"SQLite database '{targets[fmt]}' updated successfully!")
+                        print(f"Per-match stat rows: {len(match_stats)}")
+                    elif fmt == "parquet":
+                        print(f"Parquet file '{targets[fmt]}' created successfully!")
                     print(
-                        "\n=== UEFA Champions League Players Data Exported to DynamoDB ==="
+                        f"  {result.sink}: {result.records} rows in {result.seconds:.2f}s "
+                        f"({result.records_per_second:.0f} rows/s)"
                     )
-                    print(f"Players processed: {len(players_data)}")
-                    print(f"DynamoDB table '{table_name}' updated successfully!")
-                    print(f"Region: {region}")
 
-            # Display sample of the data for both formats
-            if success:
                 print("\n=== Sample Players (first 5) ===")
                 for i, player in enumerate(players_data[:5], 1):
                     print(
@@ -286,6 +879,375 @@ class CLIApp:
             self.logger.error(f"Error processing players: {str(e)}")
             return False
 
+    def process_watch_command(
+        self,
+        format_type: str = "ddb",
+        output_target: Optional[str] = None,
+        region: str = "eu-central-1",
+        idle_interval: float = 900,
+        live_interval: float = 60,
+        max_polls: Optional[int] = None,
+    ) -> bool:
+        """
+        Process watch command: poll the feeds and push only changed players
+
+        The API client and DynamoDB resource stay alive across polls.
+
+        Args:
+            format_type: Output format ('csv' or 'ddb')
+            output_target: Output filename for CSV or table name for DynamoDB
+            region: AWS region for DynamoDB
+            idle_interval: Seconds between polls when no match is live
+            live_interval: Seconds between polls while matches are live
+            max_polls: Stop after this many polls
+
+        Returns:
+            True if the watcher stopped cleanly
+        """
+        from src.core.watcher import FeedWatcher
+
+        if format_type == "csv":
+            output_filename = output_target or "players_data.csv"
+
+            def on_changes(changed, all_players):
+                # A CSV file can't be patched in place, rewrite it on any change
+                return self.csv_exporter.export_players_data(
+                    all_players, output_filename
+                )
+
+        else:
+            table_name = output_target or "new-manual-fapi-ddb"
+            if region != "eu-central-1":
+                self.dynamodb_exporter.region_name = region
+                self.dynamodb_exporter._dynamodb = None
+
+            def on_changes(changed, all_players):
+                return self.dynamodb_exporter.export_players_data(changed, table_name)
+
+        watcher = FeedWatcher(
+            self.api_client,
+            self.players_processor,
+            self.fixtures_processor,
+            on_changes,
+            idle_interval=idle_interval,
+            live_interval=live_interval,
+        )
+
+        try:
+            polls = watcher.run(max_polls=max_polls, after_poll=self.write_metrics)
+        finally:
+            self.api_client.close()
+
+        print(f"\n=== Watch stopped after {polls} polls ===")
+        return True
+
+    def process_history_command(
+        self,
+        action: str,
+        snapshot_ids: List[str],
+        snapshot_dir: str = "snapshots",
+        matchday: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> bool:
+        """
+        Process history command over the snapshot store
+
+        Args:
+            action: 'list', 'show' or 'diff'
+            snapshot_ids: Snapshot IDs or prefixes for show/diff
+            snapshot_dir: Snapshot store directory
+            matchday: Only list snapshots for this matchday
+            fields: Comma-separated fields to compare in diff
+
+        Returns:
+            True if successful, False otherwise
+        """
+        from src.core.snapshot_store import SnapshotStore
+
+        store = SnapshotStore(snapshot_dir)
+
+        if action == "list":
+            snapshots = store.list_snapshots(matchday)
+            print(f"\n=== Snapshots in '{snapshot_dir}' ({len(snapshots)}) ===")
+            for entry in snapshots:
+                contents = [kind for kind in ("players", "fixtures") if entry.get(kind)]
+                print(
+                    f"{entry['id']}  matchday {entry['matchday']}  {', '.join(contents)}"
+                )
+            return True
+
+        if action == "show":
+            if len(snapshot_ids) != 1:
+                print("❌ 'history show' needs exactly one snapshot ID")
+                return False
+            snapshot = store.load(snapshot_ids[0])
+            if not snapshot:
+                print(f"❌ Snapshot '{snapshot_ids[0]}' not found")
+                return False
+            meta = snapshot["meta"]
+            print(f"\n=== Snapshot {meta['id']} ===")
+            print(f"Taken at: {meta['timestamp']}")
+            print(f"Matchday: {meta['matchday']}")
+            if snapshot["players"] is not None:
+                print(f"Players: {len(snapshot['players'])}")
+            if snapshot["fixtures"] is not None:
+                print(f"Fixture matchdays: {len(snapshot['fixtures'])}")
+            return True
+
+        if len(snapshot_ids) != 2:
+            print("❌ 'history diff' needs exactly two snapshot IDs")
+            return False
+
+        field_list = [f.strip() for f in fields.split(",")] if fields else None
+        changes = store.diff(snapshot_ids[0], snapshot_ids[1], field_list)
+        if changes is None:
+            print("❌ One of the snapshots was not found")
+            return False
+
+        print(f"\n=== Changes from {snapshot_ids[0]} to {snapshot_ids[1]} ===")
+        print(f"Players added: {len(changes['added'])}")
+        print(f"Players removed: {len(changes['removed'])}")
+        print(f"Players changed: {len(changes['changed'])}")
+        for player_id, player_changes in sorted(changes["changed"].items()):
+            summary = ", ".join(
+                f"{field}: {old} -> {new}"
+                for field, (old, new) in sorted(player_changes.items())
+            )
+            print(f"  {player_id}: {summary}")
+        return True
+
+    def process_league_command(
+        self,
+        user_guids: List[str],
+        guids_file: Optional[str],
+        matchday: int,
+        from_matchday: Optional[int],
+        phase: int,
+        workers: int,
+        output_filename: str,
+        ownership_filename: Optional[str] = None,
+    ) -> bool:
+        """
+        Fetch a league's teams and export its standings
+
+        Args:
+            user_guids: Manager GUIDs given on the command line
+            guids_file: File with one more GUID per line
+            matchday: Latest matchday ID
+            from_matchday: First matchday to fetch; earlier ranks give movements
+            phase: Phase ID
+            workers: Concurrent team fetches
+            output_filename: Standings CSV filename
+            ownership_filename: Optional per-player ownership CSV filename
+
+        Returns:
+            True if successful, False otherwise
+        """
+        from src.core.league import LeagueTracker
+
+        guids = list(user_guids)
+        if guids_file:
+            try:
+                with open(guids_file, "r", encoding="utf-8") as f:
+                    guids.extend(line.strip() for line in f if line.strip())
+            except OSError as e:
+                self.logger.error(f"Error reading GUIDs file: {str(e)}")
+                return False
+        if not guids:
+            self.logger.error("No manager GUIDs given")
+            return False
+
+        from src.core.team_analyzer import TeamAnalyzer
+
+        # Only fetches teams: skip the DynamoDB exporter (and boto3)
+        analyzer = TeamAnalyzer(csv_exporter=self.csv_exporter, api_client=self.api_client)
+        tracker = LeagueTracker(analyzer, guids, workers)
+        for md in range(from_matchday or matchday, matchday + 1):
+            tracker.refresh(md, phase)
+
+        standings = tracker.standings.standings()
+        if not standings:
+            self.logger.error("No team data loaded")
+            return False
+
+        try:
+            with open(output_filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(standings[0]))
+                writer.writeheader()
+                writer.writerows(standings)
+        except OSError as e:
+            self.logger.error(f"Error exporting league standings: {str(e)}")
+            return False
+
+        if ownership_filename and not self.export_league_ownership(tracker.teams, ownership_filename):
+            return False
+
+        print(f"\n=== League Standings after Matchday {tracker.standings.current_matchday} ===")
+        for row in standings[:20]:
+            movement = row["movement"]
+            arrow = f"▲{movement}" if movement > 0 else f"▼{-movement}" if movement < 0 else "="
+            print(
+                f"{row['rank']:>4}. {row['team']:<30} {row['total_points']:>7.1f} "
+                f"(MD {row['matchday_points'] or 0:.1f}) {arrow}"
+            )
+        if len(standings) > 20:
+            print(f"  ... and {len(standings) - 20} more in '{output_filename}'")
+        if tracker.failed:
+            print(f"⚠️  {len(tracker.failed)} teams could not be loaded")
+        return True
+
+    def export_league_ownership(
+        self, teams: Dict[str, Dict[str, Any]], output_filename: str
+    ) -> bool:
+        """
+        Export per-player ownership across a league's squads
+
+        Args:
+            teams: Team payload by manager GUID
+            output_filename: Ownership CSV filename
+
+        Returns:
+            True if successful, False otherwise
+        """
+        from src.core.ownership import OwnershipMatrix
+
+        matrix = OwnershipMatrix.from_teams(teams)
+        rows = matrix.summary()
+        try:
+            with open(output_filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(
+                    f, fieldnames=["playerId", "owners", "ownership", "captaincy", "effective_ownership"],
+                    extrasaction="ignore",
+                )
+                writer.writeheader()
+                writer.writerows(rows)
+        except OSError as e:
+            self.logger.error(f"Error exporting league ownership: {str(e)}")
+            return False
+
+        print(f"\n=== Highest Effective Ownership ({matrix.shape[0]} teams, {matrix.shape[1]} players) ===")
+        for row in rows[:10]:
+            print(
+                f"  {row['playerId']}: EO {row['effective_ownership']:.1f}% "
+                f"(owned {row['ownership']:.1f}%, captained {row['captaincy']:.1f}%)"
+            )
+        return True
+
+    def process_serve_command(
+        self,
+        players_csv: str,
+        opponents_csv: str,
+        snapshot_dir: Optional[str],
+        host: str,
+        port: int,
+        reload_interval: float,
+    ) -> bool:
+        """
+        Serve processed data over HTTP until interrupted
+
+        Args:
+            players_csv: Players CSV to serve
+            opponents_csv: Opponents table CSV to serve
+            snapshot_dir: Snapshot store to serve players and fixtures from instead
+            host: Interface to bind
+            port: Port to listen on
+            reload_interval: Seconds between checks for new data
+
+        Returns:
+            False if the server could not start
+        """
+        from src.api.query_server import QueryServer
+        from src.core.query_index import IndexLoader
+
+        loader = IndexLoader(
+            self._scoped(players_csv), self._scoped(opponents_csv), self._scoped(snapshot_dir)
+        )
+        try:
+            server = QueryServer(loader, host, port, reload_interval)
+        except OSError as e:
+            self.logger.error(f"Error starting query server: {str(e)}")
+            return False
+
+        print(f"🌐 Serving {len(server.index)} players on http://{server.host}:{server.port}")
+        print("   Routes: /players, /players/top, /players/<id>, /players/<id>/similar, /teams, /opponents, /fixtures, /health")
+        server.serve_forever()
+        return True
+
+    def process_similar_command(
+        self,
+        player_id: str,
+        k: int = 5,
+        players_csv: str = "players_data.csv",
+        snapshot_dir: Optional[str] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        price_band: Optional[float] = None,
+        any_position: bool = False,
+        exclude_team: bool = False,
+    ) -> bool:
+        """
+        Print the players most similar to a player
+
+        Args:
+            player_id: Player to find replacements for
+            k: Number of players to list
+            players_csv: Players CSV to search
+            snapshot_dir: Snapshot store to search the latest players of instead
+            min_value: Cheapest price accepted
+            max_value: Most expensive price accepted
+            price_band: Only players priced within this much of the player
+            any_position: Also consider players of other positions
+            exclude_team: Skip players of the player's own club
+
+        Returns:
+            False if there is no roster or the player is not in it
+        """
+        from src.core.metrics import METRICS
+        from src.core.query_index import IndexLoader
+
+        try:
+            index = IndexLoader(self._scoped(players_csv), None, self._scoped(snapshot_dir)).load()
+        except Exception as e:
+            self.logger.error(f"Error loading players: {str(e)}")
+            return False
+        if not len(index):
+            self.logger.error("No players to search; run the players command first")
+            return False
+
+        similarity = index.similarity
+        player = similarity.get_player(player_id)
+        if player is None:
+            self.logger.error(f"Player '{player_id}' not found")
+            return False
+        if price_band is not None:
+            value = float(player.get("value") or 0.0)
+            min_value = value - price_band if min_value is None else max(min_value, value - price_band)
+            max_value = value + price_band if max_value is None else min(max_value, value + price_band)
+
+        with METRICS.span("similar_query"):
+            matches = similarity.similar(
+                player_id,
+                k=k,
+                min_value=min_value,
+                max_value=max_value,
+                same_position=not any_position,
+                exclude_team=exclude_team,
+            )
+
+        print(
+            f"\n🔁 Players most similar to {player.get('name')} "
+            f"({player.get('team')}, {player.get('position')}, {player.get('value')}):"
+        )
+        if not matches:
+            print("  No players match the filters")
+        for rank, match in enumerate(matches, 1):
+            print(
+                f"  {rank}. {match.get('name')} ({match.get('team')}, {match.get('position')}) "
+                f"value {match.get('value')}, {match.get('total points')} pts, "
+                f"distance {match['distance']:.3f}"
+            )
+        return True
+
     def run(self, args: Optional[list] = None) -> int:
         """
         Run the CLI application
@@ -303,12 +1265,82 @@ class CLIApp:
             parser.print_help()
             return 1
 
+        from src.core.metrics import METRICS
+
+        METRICS.reset()
+        if parsed_args.competition:
+            self.competitions = parsed_args.competition
+        self.metrics_json = parsed_args.metrics_json
+        self.metrics_prom = parsed_args.metrics_prom
+        if parsed_args.command in self.API_COMMANDS:
+            self.configure_api_client(parsed_args)
+        if parsed_args.trace_requests:
+            self.api_client.enable_trace()
+        try:
+            if parsed_args.profile:
+                from src.core.profiling import profiled
+
+                with profiled(parsed_args.profile, parsed_args.profile_mode):
+                    return self._run_command(parser, parsed_args)
+            return self._run_command(parser, parsed_args)
+        finally:
+            self.write_metrics()
+            if parsed_args.trace_requests:
+                try:
+                    self.api_client.write_trace(parsed_args.trace_requests)
+                except OSError as e:
+                    self.logger.error(f"Error writing request trace: {str(e)}")
+            if parsed_args.metrics:
+                print(f"\n{METRICS.summary()}")
+
+    def configure_api_client(self, parsed_args: argparse.Namespace) -> None:
+        """Apply timeouts, the run deadline, hedging and the response cache to the API client"""
+        client = self.api_client
+        if parsed_args.connect_timeout:
+            client.connect_timeout = parsed_args.connect_timeout
+        if parsed_args.read_timeout:
+            client.read_timeout = parsed_args.read_timeout
+        client.set_deadline(parsed_args.deadline)
+        if parsed_args.hedge:
+            client.enable_hedging(max_rate=parsed_args.hedge_max_rate)
+        if parsed_args.no_response_cache:
+            client.response_cache = None
+        else:
+            client.enable_response_cache(
+                os.path.join(self.CACHE_DIR, "responses"), parsed_args.stale_after
+            )
+
+    def write_metrics(self) -> None:
+        """Write the JSON/Prometheus metrics files requested on the command line"""
+        from src.core.metrics import METRICS
+
+        try:
+            if self.metrics_json:
+                METRICS.write_json(self.metrics_json)
+            if self.metrics_prom:
+                METRICS.write_prometheus(self.metrics_prom)
+        except OSError as e:
+            self.logger.error(f"Error writing metrics: {str(e)}")
+
+    def _run_command(
+        self, parser: argparse.ArgumentParser, parsed_args: argparse.Namespace
+    ) -> int:
+        """Dispatch a parsed command line to its command handler"""
         try:
             if parsed_args.command == "fixtures":
                 print("🏆 Processing UEFA Champions League Fixtures...")
-                success = self.process_fixtures_command(parsed_args.output)
+                success = self.run_competitions(
+                    lambda app: app.process_fixtures_command(
+                        parsed_args.output, parsed_args.snapshot_dir
+                    )
+                )
 
-                if success:
+                if success and len(self.competitions) > 1:
+                    print(
+                        f"\n✅ Success! Opponents tables created for {len(self.competitions)} competitions."
+                    )
+                    return 0
+                elif success:
                     print(
                         f"\n✅ Success! Check '{parsed_args.output}' for the opponents table."
                     )
@@ -318,26 +1350,44 @@ class CLIApp:
                     return 1
 
             elif parsed_args.command == "players":
-                format_type = getattr(parsed_args, "format", "csv")
-                if format_type == "ddb":
-                    print("⚽ Processing UEFA Champions League Players for DynamoDB...")
-                else:
-                    print("⚽ Processing UEFA Champions League Players for CSV export...")
+                formats = list(dict.fromkeys(parsed_args.format or ["csv"]))
+                names = {"csv": "CSV export", "ddb": "DynamoDB", "sqlite": "SQLite", "parquet": "Parquet"}
+                print(
+                    "⚽ Processing UEFA Champions League Players for "
+                    f"{', '.join(names[fmt] for fmt in formats)}..."
+                )
 
-                success = self.process_players_command(
-                    format_type=format_type,
-                    output_target=parsed_args.output,
-                    region=getattr(parsed_args, "region", "eu-central-1"),
+                success = self.run_competitions(
+                    lambda app: app.process_players_command(
+                        format_type=formats,
+                        output_target=parsed_args.output,
+                        region=getattr(parsed_args, "region", "eu-central-1"),
+                        stats_target=parsed_args.stats_output,
+                        snapshot_dir=parsed_args.snapshot_dir,
+                    )
                 )
 
                 if success:
-                    if format_type == "ddb":
-                        table_name = parsed_args.output or "uefa-players"
+                    if len(self.competitions) > 1:
+                        print(
+                            f"\n✅ Success! Players data exported for {len(self.competitions)} competitions."
+                        )
+                    elif len(formats) > 1:
+                        print(
+                            f"\n✅ Success! Players data exported to {', '.join(names[fmt] for fmt in formats)}."
+                        )
+                    elif formats[0] == "ddb":
+                        table_name = self._export_target("ddb", parsed_args.output, False)
                         print(
                             f"\n✅ Success! Players data exported to DynamoDB table '{table_name}'."
                         )
+                    elif formats[0] == "sqlite":
+                        database = self._export_target("sqlite", parsed_args.output, False)
+                        print(
+                            f"\n✅ Success! Players data exported to SQLite database '{database}'."
+                        )
                     else:
-                        output_file = parsed_args.output or "players_data.csv"
+                        output_file = self._export_target(formats[0], parsed_args.output, False)
                         print(
                             f"\n✅ Success! Check '{output_file}' for the players data."
                         )
@@ -346,6 +1396,69 @@ class CLIApp:
                     print("\n❌ Failed to process players.")
                     return 1
 
+            elif parsed_args.command == "watch":
+                print("👀 Watching UEFA Champions League feeds for changes...")
+                success = self.process_watch_command(
+                    format_type=parsed_args.format,
+                    output_target=parsed_args.output,
+                    region=parsed_args.region,
+                    idle_interval=parsed_args.interval,
+                    live_interval=parsed_args.live_interval,
+                    max_polls=parsed_args.max_polls,
+                )
+                return 0 if success else 1
+
+            elif parsed_args.command == "history":
+                success = self.process_history_command(
+                    action=parsed_args.action,
+                    snapshot_ids=parsed_args.snapshot_ids,
+                    snapshot_dir=parsed_args.snapshot_dir,
+                    matchday=parsed_args.matchday,
+                    fields=parsed_args.fields,
+                )
+                return 0 if success else 1
+
+            elif parsed_args.command == "league":
+                print("🏅 Computing mini-league standings...")
+                success = self.process_league_command(
+                    user_guids=parsed_args.user_guids,
+                    guids_file=parsed_args.guids_file,
+                    matchday=parsed_args.matchday,
+                    from_matchday=parsed_args.from_matchday,
+                    phase=parsed_args.phase,
+                    workers=parsed_args.workers,
+                    output_filename=parsed_args.output,
+                    ownership_filename=parsed_args.ownership,
+                )
+                if success:
+                    print(f"\n✅ Success! Check '{parsed_args.output}' for the standings.")
+                return 0 if success else 1
+
+            elif parsed_args.command == "serve":
+                success = self.process_serve_command(
+                    players_csv=parsed_args.players,
+                    opponents_csv=parsed_args.opponents,
+                    snapshot_dir=parsed_args.snapshot_dir,
+                    host=parsed_args.host,
+                    port=parsed_args.port,
+                    reload_interval=parsed_args.reload_interval,
+                )
+                return 0 if success else 1
+
+            elif parsed_args.command == "similar":
+                success = self.process_similar_command(
+                    player_id=parsed_args.player_id,
+                    k=parsed_args.k,
+                    players_csv=parsed_args.players,
+                    snapshot_dir=parsed_args.snapshot_dir,
+                    min_value=parsed_args.min_value,
+                    max_value=parsed_args.max_value,
+                    price_band=parsed_args.price_band,
+                    any_position=parsed_args.any_position,
+                    exclude_team=parsed_args.exclude_team,
+                )
+                return 0 if success else 1
+
             elif parsed_args.command == "team":
                 print("🏆 Analyzing UEFA Champions League Fantasy Team...")
                 
@@ -355,7 +1468,6 @@ class CLIApp:
                         matchday_id=parsed_args.matchday or 3,
                         phase_id=parsed_args.phase,
                         table_name=parsed_args.table_name,
-                        json_fallback_path=parsed_args.json_fallback,
                         csv_filename=parsed_args.output,
                         export_to_dynamodb=bool(parsed_args.export_table),
                         dynamodb_table_name=parsed_args.export_table,
@@ -0,0 +1,122 @@
+"""
+Bounded LRU cache with per-entry time-to-live
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from src.core.metrics import METRICS
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after a fixed TTL
+
+    Hits and misses are counted in the process-wide METRICS registry as
+    cache_hits/cache_misses with a cache=<name> label.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 300.0,
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            maxsize: Entries kept before the least recently used is evicted
+            ttl: Seconds an entry stays valid
+            name: Label of the cache in metrics
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look a key up
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss or expired entry
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hit = True
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                hit = False
+        METRICS.incr("cache_hits" if hit else "cache_misses", cache=self.name)
+        return (True, entry[1]) if hit else (False, None)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        expires = self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Read-through: return the cached value or load, store and return it
+
+        Args:
+            key: Cache key
+            loader: Called on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        hit, value = self.lookup(key)
+        if hit:
+            return value
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Drop all entries, or those whose key matches a predicate
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
@@ -0,0 +1,153 @@
+"""
+Kickoff-time normalization: feed date strings to timezone-aware UTC, parsed once
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+# Fixtures and players feeds give kickoffs in Central European local time
+FEED_TIMEZONE = "Europe/Paris"
+
+# Fixtures feed ('9/17/25 9:00:00 PM') and players feed ('09/17/2025 21:00:00')
+KICKOFF_FORMATS = ("%m/%d/%Y %H:%M:%S", "%m/%d/%y %I:%M:%S %p")
+
+
+@lru_cache(maxsize=4096)
+def parse_local(date_str: str) -> Optional[datetime]:
+    """
+    Parse a feed date string into a naive feed-local datetime
+
+    There are only a handful of distinct kickoff strings per matchday, so
+    results are memoized.
+
+    Args:
+        date_str: Date as found in the fixtures, players or team feeds
+
+    Returns:
+        Naive datetime or None if the format is not recognised
+    """
+    for date_format in KICKOFF_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format)
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def _default_timezone() -> tzinfo:
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(FEED_TIMEZONE)
+    except Exception:
+        # No tz database (e.g. Windows without tzdata): CET until a feed
+        # timestamp tells us the current offset
+        return timezone(timedelta(hours=1), "CET")
+
+
+class KickoffClock:
+    """Converts feed-local date strings to UTC, memoizing one result per distinct string"""
+
+    def __init__(self, tz: Optional[tzinfo] = None):
+        """
+        Args:
+            tz: Timezone of the feed dates (default: Europe/Paris)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.tz = tz or _default_timezone()
+        self._utc: Dict[str, Optional[datetime]] = {}
+        self._lock = threading.Lock()
+
+    def observe_meta(self, payload: Dict[str, Any]) -> Optional[timedelta]:
+        """
+        Read the feed's UTC offset from a payload's meta.timestamp
+
+        Team and popupstats payloads carry the server time as both utcTime
+        and cestTime. The offset is only adopted when no tz database is
+        available (fixed-offset timezone); a real zone already knows the
+        daylight-saving rules for every kickoff.
+
+        Args:
+            payload: Raw team or popupstats payload
+
+        Returns:
+            The offset found, or None if the payload has no usable timestamp
+        """
+        timestamp = ((payload or {}).get("meta") or {}).get("timestamp") or {}
+        utc_time = parse_local(timestamp.get("utcTime", ""))
+        local_time = parse_local(timestamp.get("cestTime", ""))
+        if utc_time is None or local_time is None:
+            return None
+
+        # Round to 15 minutes; the two strings may straddle a second boundary
+        minutes = round((local_time - utc_time).total_seconds() / 900) * 15
+        offset = timedelta(minutes=minutes)
+        if isinstance(self.tz, timezone) and self.tz.utcoffset(None) != offset:
+            self.logger.info(f"Feed UTC offset is now {offset}")
+            with self._lock:
+                self.tz = timezone(offset)
+                self._utc = {}
+        return offset
+
+    def localize(self, local: datetime) -> datetime:
+        """Attach the feed timezone to a naive feed-local datetime and convert to UTC"""
+        return local.replace(tzinfo=self.tz).astimezone(timezone.utc)
+
+    def to_utc(self, date_str: str) -> Optional[datetime]:
+        """
+        Kickoff as a timezone-aware UTC datetime
+
+        Args:
+            date_str: Feed date string
+
+        Returns:
+            Aware UTC datetime or None if the string can't be parsed
+        """
+        try:
+            return self._utc[date_str]
+        except (KeyError, TypeError):
+            pass
+
+        local = parse_local(date_str)
+        result = self.localize(local) if local else None
+        with self._lock:
+            self._utc[date_str] = result
+        return result
+
+    def timestamp(self, date_str: str) -> Optional[float]:
+        """Kickoff as a POSIX timestamp, for numeric comparisons"""
+        kickoff = self.to_utc(date_str)
+        return kickoff.timestamp() if kickoff else None
+
+    def iso_utc(self, date_str: str) -> str:
+        """Kickoff as an ISO 8601 UTC string, or '' if the string can't be parsed"""
+        kickoff = self.to_utc(date_str)
+        return kickoff.isoformat() if kickoff else ""
+
+    def day_of_week(self, date_str: str) -> str:
+        """Weekday name of a kickoff in feed-local time, or 'N/A'"""
+        local = parse_local(date_str)
+        return local.strftime("%A") if local else "N/A"
+
+    def now(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Normalize 'now' to aware UTC
+
+        Args:
+            now: Aware datetime, naive feed-local datetime, or None for the current time
+
+        Returns:
+            Aware UTC datetime
+        """
+        if now is None:
+            return datetime.now(timezone.utc)
+        if now.tzinfo is None:
+            return self.localize(now)
+        return now.astimezone(timezone.utc)
+
+
+# Shared by processors and schedulers so each kickoff string is parsed once per process
+KICKOFFS = KickoffClock()
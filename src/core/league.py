@@ -0,0 +1,275 @@
+"""
+Mini-league standings over many managers' fantasy teams
+"""
+
+import bisect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.core.metrics import METRICS
+
+
+class TeamEntry(NamedTuple):
+    """A manager's league-relevant fields from one opponent-team payload"""
+
+    guid: str
+    team_name: str
+    manager: str
+    matchday: int
+    matchday_points: float
+    total_points: float
+    overall_rank: Optional[int]
+
+    @classmethod
+    def from_payload(
+        cls, guid: str, team_data: Dict[str, Any], matchday: Optional[int] = None
+    ) -> Optional["TeamEntry"]:
+        """
+        Parse the gdPoints/ovPoints/ovRank fields of a team payload
+
+        Args:
+            guid: Manager GUID the payload was fetched for
+            team_data: Opponent-team payload
+            matchday: Matchday the payload was requested for (default: its mdid)
+
+        Returns:
+            TeamEntry or None if the payload has no matchday or points
+        """
+        value = (team_data or {}).get("data", {}).get("value") or {}
+        matchday = value.get("mdid") if matchday is None else matchday
+        if matchday is None or value.get("ovPoints") is None:
+            return None
+        return cls(
+            guid=guid,
+            team_name=value.get("teamName") or guid,
+            manager=value.get("username") or "",
+            matchday=int(matchday),
+            matchday_points=float(value.get("gdPoints") or 0.0),
+            total_points=float(value["ovPoints"]),
+            overall_rank=value.get("ovRank"),
+        )
+
+
+class _RankedScores:
+    """Scores kept in descending order; updating one score moves one entry"""
+
+    def __init__(self):
+        self._keys: List[Tuple[float, str]] = []
+        self._scores: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, guid: str) -> Optional[float]:
+        return self._scores.get(guid)
+
+    def set(self, guid: str, score: float) -> None:
+        old = self._scores.get(guid)
+        if old == score:
+            return
+        if old is not None:
+            del self._keys[bisect.bisect_left(self._keys, (-old, guid))]
+        bisect.insort(self._keys, (-score, guid))
+        self._scores[guid] = score
+
+    def rank(self, guid: str) -> Optional[int]:
+        """1-based rank; managers on equal scores share the best rank"""
+        score = self._scores.get(guid)
+        if score is None:
+            return None
+        return bisect.bisect_left(self._keys, (-score,)) + 1
+
+    def ranks(self) -> Dict[str, int]:
+        """Ranks of every manager in one walk of the order"""
+        ranks = {}
+        previous = None
+        for position, (key, guid) in enumerate(self._keys, start=1):
+            if key != previous:
+                rank, previous = position, key
+            ranks[guid] = rank
+        return ranks
+
+    def ordered(self) -> List[str]:
+        return [guid for _, guid in self._keys]
+
+
+class LeagueStandings:
+    """
+    Standings, per-matchday ranks and rank movements of a mini-league
+
+    Each manager's league total is seeded from the first payload seen
+    (ovPoints minus that matchday's gdPoints) and then grows by the
+    gdPoints of every matchday. Updates apply deltas: a manager whose
+    points changed moves within the sorted order, nobody else is touched.
+    The league ranks at the end of each matchday are frozen when the next
+    matchday's points first arrive, and movements are measured against them;
+    late revisions of an earlier matchday change totals, not frozen ranks.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.entries: Dict[str, TeamEntry] = {}
+        self.current_matchday: Optional[int] = None
+        self._seeds: Dict[str, float] = {}
+        self._matchday_points: Dict[int, Dict[str, float]] = {}
+        self._totals = _RankedScores()
+        self._matchday_scores: Dict[int, _RankedScores] = {}
+        # matchday -> league ranks once that matchday was complete
+        self.rank_history: Dict[int, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def update(self, entries: Iterable[TeamEntry]) -> List[str]:
+        """
+        Apply new or revised matchday points
+
+        Args:
+            entries: Parsed team payloads, any matchday
+
+        Returns:
+            GUIDs of managers whose points changed
+        """
+        changed = []
+        for entry in sorted(entries, key=lambda entry: entry.matchday):
+            if self.current_matchday is None or entry.matchday > self.current_matchday:
+                if self.current_matchday is not None:
+                    self.rank_history[self.current_matchday] = self._totals.ranks()
+                self.current_matchday = entry.matchday
+
+            previous = self.entries.get(entry.guid)
+            points = self._matchday_points.setdefault(entry.matchday, {})
+            if previous == entry or (
+                previous is not None
+                and entry.matchday < previous.matchday
+                and points.get(entry.guid) == entry.matchday_points
+            ):
+                continue
+            if entry.guid not in self._seeds:
+                self._seeds[entry.guid] = entry.total_points - entry.matchday_points
+
+            delta = entry.matchday_points - points.get(entry.guid, 0.0)
+            points[entry.guid] = entry.matchday_points
+            self._matchday_scores.setdefault(entry.matchday, _RankedScores()).set(
+                entry.guid, entry.matchday_points
+            )
+            total = self._totals.get(entry.guid)
+            self._totals.set(
+                entry.guid,
+                self._seeds[entry.guid] + entry.matchday_points if total is None else total + delta,
+            )
+
+            if previous is None or entry.matchday >= previous.matchday:
+                self.entries[entry.guid] = entry
+            changed.append(entry.guid)
+
+        if changed:
+            METRICS.incr("league_updates", len(changed))
+        return changed
+
+    def total(self, guid: str) -> Optional[float]:
+        """League total of a manager"""
+        return self._totals.get(guid)
+
+    def rank(self, guid: str) -> Optional[int]:
+        """Current league rank of a manager"""
+        return self._totals.rank(guid)
+
+    def matchday_ranks(self, matchday: int) -> Dict[str, int]:
+        """Ranks by the points scored in one matchday"""
+        scores = self._matchday_scores.get(matchday)
+        return scores.ranks() if scores else {}
+
+    def standings(self) -> List[Dict[str, Any]]:
+        """
+        Current standings, best first
+
+        Returns:
+            Rows with rank, previous rank, movement (positive = climbed),
+            totals, matchday points and ranks, and the overall game rank
+        """
+        ranks = self._totals.ranks()
+        previous = self.rank_history[max(self.rank_history)] if self.rank_history else {}
+        matchday_ranks = self.matchday_ranks(self.current_matchday) if self.current_matchday else {}
+        points = self._matchday_points.get(self.current_matchday, {})
+
+        rows = []
+        for guid in self._totals.ordered():
+            entry = self.entries[guid]
+            previous_rank = previous.get(guid)
+            rows.append(
+                {
+                    "rank": ranks[guid],
+                    "previous_rank": previous_rank,
+                    "movement": previous_rank - ranks[guid] if previous_rank else 0,
+                    "guid": guid,
+                    "team": entry.team_name,
+                    "manager": entry.manager,
+                    "total_points": self._totals.get(guid),
+                    "matchday_points": points.get(guid),
+                    "matchday_rank": matchday_ranks.get(guid),
+                    "overall_rank": entry.overall_rank,
+                }
+            )
+        return rows
+
+
+class LeagueTracker:
+    """Fetches a league's teams concurrently and keeps its standings up to date"""
+
+    def __init__(self, team_analyzer, guids: Iterable[str], workers: int = 16):
+        """
+        Args:
+            team_analyzer: TeamAnalyzer whose fetch_team_data is used
+            guids: Manager GUIDs in the league
+            workers: Concurrent team fetches
+        """
+        self.logger = logging.getLogger(__name__)
+        self.team_analyzer = team_analyzer
+        self.guids = list(dict.fromkeys(guids))
+        self.workers = workers
+        self.standings = LeagueStandings()
+        self.failed: List[str] = []
+        # Latest payload of every manager, for squad analytics (see OwnershipMatrix)
+        self.teams: Dict[str, Dict[str, Any]] = {}
+
+    def _fetch(self, guid: str, matchday_id: int, phase_id: int) -> Optional[TeamEntry]:
+        try:
+            team_data = self.team_analyzer.fetch_team_data(guid, matchday_id, phase_id)
+        except Exception as e:
+            self.logger.error(f"Error fetching team {guid}: {str(e)}")
+            return None
+        if not team_data:
+            return None
+        self.teams[guid] = team_data
+        return TeamEntry.from_payload(guid, team_data, matchday_id)
+
+    def refresh(self, matchday_id: int, phase_id: int = 0) -> List[str]:
+        """
+        Fetch every team for a matchday and apply what changed
+
+        Args:
+            matchday_id: Matchday to fetch
+            phase_id: Phase ID
+
+        Returns:
+            GUIDs of managers whose points changed
+        """
+        with METRICS.span("league_refresh"):
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.workers, len(self.guids))),
+                thread_name_prefix="league",
+            ) as executor:
+                entries = list(
+                    executor.map(lambda guid: self._fetch(guid, matchday_id, phase_id), self.guids)
+                )
+
+        self.failed = [guid for guid, entry in zip(self.guids, entries) if entry is None]
+        if self.failed:
+            self.logger.warning(f"Could not load {len(self.failed)} of {len(self.guids)} teams")
+        changed = self.standings.update(entry for entry in entries if entry is not None)
+        self.logger.info(
+            f"Matchday {matchday_id}: {len(changed)} of {len(self.guids)} teams changed"
+        )
+        return changed
@@ -0,0 +1,151 @@
+"""
+Starting XI, bench order and captain selection for a 15-player squad
+"""
+
+import logging
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Player skill codes of the feeds
+GOALKEEPER, DEFENDER, MIDFIELDER, FORWARD = 1, 2, 3, 4
+
+
+class SquadPlayer(NamedTuple):
+    """A squad player with the projection the selection maximizes"""
+
+    player_id: Any
+    skill: int
+    projected: float
+
+
+class Lineup(NamedTuple):
+    """One starting XI with its bench and captaincy"""
+
+    formation: str
+    starters: List[SquadPlayer]
+    bench: List[SquadPlayer]
+    captain: SquadPlayer
+    vice_captain: SquadPlayer
+    projected: float
+
+
+class LineupSelector:
+    """
+    Picks the best starting XI, bench order and captain of a squad
+
+    Within a formation the best XI is simply the top-projected players of
+    each position, so the players of each position are sorted once and
+    their prefix sums give the XI total of every formation by table lookup:
+    all formations are scored in one pass without enumerating XIs. The
+    captain's points count CAPTAIN_MULTIPLIER times.
+    """
+
+    # (defenders, midfielders, forwards) allowed alongside one goalkeeper
+    FORMATIONS: Tuple[Tuple[int, int, int], ...] = (
+        (3, 4, 3), (3, 5, 2), (4, 3, 3), (4, 4, 2), (4, 5, 1), (5, 3, 2), (5, 4, 1),
+    )
+    CAPTAIN_MULTIPLIER = 2.0
+
+    def __init__(self, formations: Optional[Sequence[Tuple[int, int, int]]] = None):
+        """
+        Args:
+            formations: Allowed (DEF, MID, FWD) counts (default: the game's seven)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.formations = tuple(formations or self.FORMATIONS)
+
+    @staticmethod
+    def squad_from_team(
+        team_data: Mapping[str, Any], projections: Optional[Mapping[Any, float]] = None
+    ) -> List[SquadPlayer]:
+        """
+        Squad of an opponent-team payload
+
+        Args:
+            team_data: Team payload (the playerid list TeamAnalyzer.extract_player_ids reads)
+            projections: Projected points by player ID; players without one
+                are projected at their points per matchday so far
+
+        Returns:
+            Squad players; inactive players are projected at 0
+        """
+        value = (team_data or {}).get("data", {}).get("value", {})
+        matchdays = max(int(value.get("mdid") or 1), 1)
+        squad = []
+        for player in value.get("playerid") or []:
+            if not player.get("id"):
+                continue
+            if projections and player["id"] in projections:
+                projected = float(projections[player["id"]])
+            else:
+                projected = float(player.get("overallpoints") or 0.0) / matchdays
+            if player.get("isactive") == 0:
+                projected = 0.0
+            squad.append(SquadPlayer(player["id"], int(player.get("skill") or 0), projected))
+        return squad
+
+    def rank(self, squad: Sequence[SquadPlayer], top: Optional[int] = None) -> List[Lineup]:
+        """
+        Best lineup of every valid formation, best first
+
+        Args:
+            squad: Squad players
+            top: Only return this many lineups
+
+        Returns:
+            Lineups ranked by projected points (empty if no formation fits)
+        """
+        by_skill: Dict[int, List[SquadPlayer]] = {
+            GOALKEEPER: [], DEFENDER: [], MIDFIELDER: [], FORWARD: []
+        }
+        for player in squad:
+            if player.skill in by_skill:
+                by_skill[player.skill].append(player)
+        prefix: Dict[int, List[float]] = {}
+        for skill, players in by_skill.items():
+            players.sort(key=lambda player: player.projected, reverse=True)
+            sums = [0.0]
+            for player in players:
+                sums.append(sums[-1] + player.projected)
+            prefix[skill] = sums
+
+        scored = []
+        for defenders, midfielders, forwards in self.formations:
+            counts = {GOALKEEPER: 1, DEFENDER: defenders, MIDFIELDER: midfielders, FORWARD: forwards}
+            if any(len(by_skill[skill]) < count for skill, count in counts.items()):
+                continue
+            # Every formation fields each position's best player, so the
+            # captain is the best of those leaders whatever the formation
+            leaders = [by_skill[skill][0].projected for skill in counts]
+            total = sum(prefix[skill][count] for skill, count in counts.items())
+            scored.append((total + (self.CAPTAIN_MULTIPLIER - 1) * max(leaders), counts))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [self._lineup(by_skill, counts, projected) for projected, counts in scored[:top]]
+
+    def best(self, squad: Sequence[SquadPlayer]) -> Optional[Lineup]:
+        """Highest-projected lineup, or None if no formation fits the squad"""
+        lineups = self.rank(squad, top=1)
+        return lineups[0] if lineups else None
+
+    @staticmethod
+    def _lineup(
+        by_skill: Dict[int, List[SquadPlayer]], counts: Dict[int, int], projected: float
+    ) -> Lineup:
+        starters = [player for skill, count in counts.items() for player in by_skill[skill][:count]]
+        # Backup goalkeeper first, then outfield players in order of projection
+        keepers = by_skill[GOALKEEPER][1:]
+        outfield = sorted(
+            (player for skill, count in counts.items() if skill != GOALKEEPER
+             for player in by_skill[skill][count:]),
+            key=lambda player: player.projected,
+            reverse=True,
+        )
+        captain, vice_captain = sorted(starters, key=lambda player: player.projected, reverse=True)[:2]
+        return Lineup(
+            formation=f"{counts[DEFENDER]}-{counts[MIDFIELDER]}-{counts[FORWARD]}",
+            starters=starters,
+            bench=keepers + outfield,
+            captain=captain,
+            vice_captain=vice_captain,
+            projected=round(projected, 3),
+        )
@@ -0,0 +1,219 @@
+"""
+Long-format per-match statistics table for UEFA Champions League players
+"""
+
+import logging
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class MatchStatsTable:
+    """
+    Stores (player, matchday, stat, value) rows extracted from popupstats payloads
+
+    Rows are kept column-wise in compact typed arrays, with stat names interned
+    into small integer codes. Only non-zero values are stored, so a missing row
+    means the stat was zero for that player and matchday.
+    """
+
+    # Raw per-match stats taken from the popupstats ``stats`` array
+    STAT_FIELDS = (
+        "oF",
+        "gS",
+        "gA",
+        "cS",
+        "sS",
+        "pS",
+        "pM",
+        "pE",
+        "pC",
+        "gC",
+        "yC",
+        "rC",
+        "oG",
+        "bR",
+        "gOB",
+        "saves",
+        "isWin",
+        "mOM",
+    )
+
+    # Fantasy points breakdown taken from the popupstats ``points`` array
+    POINTS_FIELDS = (
+        "oF",
+        "gS",
+        "gA",
+        "cS",
+        "sS",
+        "pE",
+        "pS",
+        "pM",
+        "pC",
+        "gC",
+        "yC",
+        "rC",
+        "oG",
+        "bR",
+        "gOB",
+        "isWin",
+        "mOM",
+    )
+
+    POINTS_PREFIX = "pts_"
+    TOTAL_POINTS = "tPoints"
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.player_ids = array("q")
+        self.matchdays = array("H")
+        self.stat_codes = array("H")
+        self.values = array("i")
+        self._stat_names: List[str] = []
+        self._stat_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def stat_names(self) -> List[str]:
+        """Names of all stats seen so far, in code order"""
+        return list(self._stat_names)
+
+    def _stat_code(self, stat: str) -> int:
+        code = self._stat_index.get(stat)
+        if code is None:
+            code = len(self._stat_names)
+            self._stat_names.append(stat)
+            self._stat_index[stat] = code
+        return code
+
+    def add(self, player_id: int, matchday: int, stat: str, value: Any) -> None:
+        """
+        Append a single stat value, skipping zero and non-numeric values
+
+        Args:
+            player_id: The player's ID
+            matchday: Matchday number
+            stat: Stat name (e.g. 'gS', 'pts_gS', 'tPoints')
+            value: Raw stat value from the API
+        """
+        try:
+            numeric = int(float(value))
+        except (TypeError, ValueError):
+            return
+
+        if numeric == 0:
+            return
+
+        self.player_ids.append(int(player_id))
+        self.matchdays.append(int(matchday))
+        self.stat_codes.append(self._stat_code(stat))
+        self.values.append(numeric)
+
+    def add_popupstats(self, player_id: int, player_value: Dict[str, Any]) -> int:
+        """
+        Extract every per-match stat from a popupstats ``data.value`` payload
+
+        The payload is read in full before any row is added, so a malformed
+        payload raises without leaving partial rows behind. A (matchday, stat)
+        repeated in the payload is kept once, with its last value.
+
+        Args:
+            player_id: The player's ID
+            player_value: The ``data.value`` object of a popupstats response
+
+        Returns:
+            Number of rows added
+        """
+        player_id = int(player_id)
+        entries: Dict[Tuple[int, str], Any] = {}
+
+        for match_stats in player_value.get("stats") or []:
+            matchday = match_stats.get("mdId")
+            if not matchday:
+                continue
+            for field in self.STAT_FIELDS:
+                entries[(int(matchday), field)] = match_stats.get(field)
+
+        for match_points in player_value.get("points") or []:
+            matchday = match_points.get("mdId")
+            if not matchday:
+                continue
+            for field in self.POINTS_FIELDS:
+                entries[(int(matchday), f"{self.POINTS_PREFIX}{field}")] = match_points.get(field)
+            entries[(int(matchday), self.TOTAL_POINTS)] = match_points.get("tPoints")
+
+        start = len(self)
+        for (matchday, stat), value in entries.items():
+            self.add(player_id, matchday, stat, value)
+        return len(self) - start
+
+    def extend(self, other: "MatchStatsTable") -> None:
+        """
+        Append all rows of another table, re-coding its stat names
+
+        Args:
+            other: Table to merge into this one
+        """
+        recode = [self._stat_code(name) for name in other._stat_names]
+        self.player_ids.extend(other.player_ids)
+        self.matchdays.extend(other.matchdays)
+        self.stat_codes.extend(recode[code] for code in other.stat_codes)
+        self.values.extend(other.values)
+
+    def rows(self) -> Iterator[Tuple[int, int, str, int]]:
+        """
+        Iterate over rows in insertion order
+
+        Yields:
+            (player_id, matchday, stat, value) tuples
+        """
+        names = self._stat_names
+        for player_id, matchday, code, value in zip(
+            self.player_ids, self.matchdays, self.stat_codes, self.values
+        ):
+            yield player_id, matchday, names[code], value
+
+    def get(
+        self,
+        stat: str,
+        player_id: Optional[int] = None,
+        matchday: Optional[int] = None,
+    ) -> Dict[Tuple[int, int], int]:
+        """
+        Select one stat, optionally filtered by player and matchday
+
+        Args:
+            stat: Stat name to select
+            player_id: Restrict to a single player
+            matchday: Restrict to a single matchday
+
+        Returns:
+            Dictionary keyed by (player_id, matchday) with the stat value
+        """
+        code = self._stat_index.get(stat)
+        if code is None:
+            return {}
+
+        selected = {}
+        for i, row_code in enumerate(self.stat_codes):
+            if row_code != code:
+                continue
+            if player_id is not None and self.player_ids[i] != player_id:
+                continue
+            if matchday is not None and self.matchdays[i] != matchday:
+                continue
+            selected[(self.player_ids[i], self.matchdays[i])] = self.values[i]
+        return selected
+
+    def by_player_matchday(self) -> Dict[Tuple[int, int], Dict[str, int]]:
+        """
+        Pivot the long table into one stats dictionary per (player, matchday)
+
+        Returns:
+            Dictionary keyed by (player_id, matchday) with {stat: value} values
+        """
+        pivoted: Dict[Tuple[int, int], Dict[str, int]] = {}
+        for player_id, matchday, stat, value in self.rows():
+            pivoted.setdefault((player_id, matchday), {})[stat] = value
+        return pivoted
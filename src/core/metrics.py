@@ -0,0 +1,283 @@
+"""
+Lightweight run metrics: counters, latency histograms and timing spans
+"""
+
+import functools
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = list(labels) + sorted((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+
+class Histogram:
+    """Latency/size distribution with exact count and sum and sampled percentiles"""
+
+    MAX_SAMPLES = 10000
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._samples: List[float] = []
+        self._random = random.Random(0)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        # Reservoir sampling keeps memory bounded in long-running watch mode
+        if len(self._samples) < self.MAX_SAMPLES:
+            self._samples.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.MAX_SAMPLES:
+                self._samples[slot] = value
+
+    def percentile(self, p: float) -> float:
+        """
+        Nearest-rank percentile of the observed values
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            The percentile, or 0.0 if nothing was observed
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = min(len(ordered), max(1, math.ceil(p / 100 * len(ordered)))) - 1
+        return ordered[rank]
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min or 0.0,
+            "max": self.max or 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of labelled counters and histograms for one run"""
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, prefix: str = "fapi"):
+        self.prefix = prefix
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.started_at = time.time()
+
+    def reset(self) -> None:
+        """Drop everything collected so far"""
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+            self.started_at = time.time()
+
+    def incr(self, name: str, value: float = 1, **labels: Any) -> None:
+        """
+        Increment a counter
+
+        Args:
+            name: Counter name (e.g. 'http_requests')
+            value: Amount to add
+            **labels: Label values (e.g. endpoint='players')
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Record a value in a histogram
+
+        Args:
+            name: Histogram name (e.g. 'http_request_seconds')
+            value: Observed value
+            **labels: Label values
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        """Current value of a counter series (0 if never incremented)"""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def histogram(self, name: str, **labels: Any) -> Optional[Histogram]:
+        """Histogram for a series, or None if nothing was observed"""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        """
+        Time a block into '<name>_seconds' and count failures into '<name>_errors'
+
+        Args:
+            name: Stage name (e.g. 'fetch', 'process', 'export')
+            **labels: Label values
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.incr(f"{name}_errors", **labels)
+            raise
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, **labels: Any) -> Callable:
+        """
+        Decorator form of span()
+
+        Methods following the repo's convention of returning False on failure
+        are counted in '<name>_failures'.
+
+        Args:
+            name: Stage name
+            **labels: Label values
+        """
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **labels):
+                    result = func(*args, **kwargs)
+                if result is False:
+                    self.incr(f"{name}_failures", **labels)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot of all series, suitable for JSON output"""
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "elapsed_seconds": time.time() - self.started_at,
+                "counters": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in sorted(series.items())
+                    ]
+                    for name, series in sorted(self._counters.items())
+                },
+                "histograms": {
+                    name: [
+                        dict(histogram.to_dict(), labels=dict(key))
+                        for key, histogram in sorted(series.items())
+                    ]
+                    for name, series in sorted(self._histograms.items())
+                },
+            }
+
+    def summary(self) -> str:
+        """Human-readable run summary"""
+        data = self.to_dict()
+        lines = [f"=== Run metrics ({data['elapsed_seconds']:.2f}s) ==="]
+
+        for name, series in data["histograms"].items():
+            for entry in series:
+                labels = _format_labels(_label_key(entry["labels"]))
+                if name.endswith("_seconds"):
+                    lines.append(
+                        f"{name}{labels}: n={entry['count']} total={entry['sum']:.3f}s "
+                        f"p50={entry['p50'] * 1000:.1f}ms p95={entry['p95'] * 1000:.1f}ms "
+                        f"p99={entry['p99'] * 1000:.1f}ms"
+                    )
+                else:
+                    lines.append(
+                        f"{name}{labels}: n={entry['count']} total={entry['sum']:.0f} "
+                        f"p50={entry['p50']:.0f} p95={entry['p95']:.0f} p99={entry['p99']:.0f}"
+                    )
+
+        for name, series in data["counters"].items():
+            for entry in series:
+                labels = _format_labels(_label_key(entry["labels"]))
+                lines.append(f"{name}{labels}: {entry['value']:g}")
+
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """Write to_dict() as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        self.logger.info(f"Metrics written to {path}")
+
+    def to_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format"""
+        data_lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.prefix}_{name}_total"
+                data_lines.append(f"# TYPE {metric} counter")
+                for key, value in sorted(series.items()):
+                    data_lines.append(f"{metric}{_format_labels(key)} {value:g}")
+
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.prefix}_{name}"
+                data_lines.append(f"# TYPE {metric} summary")
+                for key, histogram in sorted(series.items()):
+                    for quantile in self.QUANTILES:
+                        labels = _format_labels(key, {"quantile": str(quantile)})
+                        data_lines.append(
+                            f"{metric}{labels} {histogram.percentile(quantile * 100):g}"
+                        )
+                    data_lines.append(f"{metric}_sum{_format_labels(key)} {histogram.total:g}")
+                    data_lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+
+        return "\n".join(data_lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Write a node_exporter textfile-collector file
+
+        The file is written next to its final path and renamed so the collector
+        never reads a partial file.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+        self.logger.info(f"Prometheus metrics written to {path}")
+
+
+# Process-wide registry used by the API client, processors, exporters and CLI
+METRICS = MetricsRegistry()
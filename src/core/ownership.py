@@ -0,0 +1,349 @@
+"""
+Sparse teams x players ownership matrix and effective-ownership analytics
+"""
+
+import logging
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class OwnershipMatrix:
+    """
+    Compressed sparse row (CSR) matrix of which manager owns which player
+
+    Row i is a manager, column j a player. Every squad player is stored,
+    with a weight: CAPTAIN_WEIGHT for the captain, STARTER_WEIGHT for the
+    rest of the starting XI and BENCH_WEIGHT for benched players, so the
+    sparsity pattern gives ownership and the weights give effective
+    ownership. A transposed (CSC) copy is built on first use for
+    per-player queries.
+
+    Storage is three flat arrays (indptr, indices, data), about 15 entries
+    per team whatever the number of players in the game, and every query
+    is a single pass over them.
+    """
+
+    CAPTAIN_WEIGHT = 2.0
+    STARTER_WEIGHT = 1.0
+    BENCH_WEIGHT = 0.0
+
+    def __init__(
+        self,
+        managers: Sequence[str],
+        players: Sequence[Any],
+        indptr: array,
+        indices: array,
+        data: array,
+    ):
+        """
+        Args:
+            managers: Row labels (manager GUIDs)
+            players: Column labels (player IDs)
+            indptr: Row i's entries are indices/data[indptr[i]:indptr[i + 1]]
+            indices: Column of each entry, sorted within a row
+            data: Weight of each entry
+        """
+        self.logger = logging.getLogger(__name__)
+        self.managers = list(managers)
+        self.players = list(players)
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self._rows = {guid: i for i, guid in enumerate(self.managers)}
+        self._columns = {player_id: j for j, player_id in enumerate(self.players)}
+        self._csc: Optional[Tuple[array, array]] = None
+        # Per-player (ownership, effective ownership), computed once for differentials()
+        self._stats: Optional[Tuple[Dict[Any, float], Dict[Any, float]]] = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.managers), len(self.players)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def weight(cls, player: Mapping[str, Any]) -> float:
+        """Weight of one squad entry of a team payload"""
+        if player.get("benchposition"):
+            return cls.BENCH_WEIGHT
+        if player.get("iscaptain"):
+            return cls.CAPTAIN_WEIGHT
+        return cls.STARTER_WEIGHT
+
+    @staticmethod
+    def squad(team_data: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+        """Squad entries of a team payload (the playerid list TeamAnalyzer.extract_player_ids reads)"""
+        players = (team_data or {}).get("data", {}).get("value", {}).get("playerid") or []
+        return [player for player in players if player.get("id")]
+
+    @classmethod
+    def from_teams(cls, teams: Mapping[str, Mapping[str, Any]]) -> "OwnershipMatrix":
+        """
+        Build the matrix from opponent-team payloads
+
+        Args:
+            teams: Team payload by manager GUID
+
+        Returns:
+            OwnershipMatrix with one row per manager
+        """
+        columns: Dict[Any, int] = {}
+        players: List[Any] = []
+        indptr = array("l", [0])
+        indices = array("l")
+        data = array("d")
+
+        for team_data in teams.values():
+            row: Dict[int, float] = {}
+            for player in cls.squad(team_data):
+                j = columns.get(player["id"])
+                if j is None:
+                    j = columns[player["id"]] = len(players)
+                    players.append(player["id"])
+                row[j] = cls.weight(player)
+            for j in sorted(row):
+                indices.append(j)
+                data.append(row[j])
+            indptr.append(len(indices))
+
+        return cls(list(teams), players, indptr, indices, data)
+
+    def _transpose(self) -> Tuple[array, array]:
+        """CSC pointers and row indices, built once by counting sort"""
+        if self._csc is None:
+            counts = [0] * (len(self.players) + 1)
+            for j in self.indices:
+                counts[j + 1] += 1
+            for j in range(len(self.players)):
+                counts[j + 1] += counts[j]
+            colptr = array("l", counts)
+            rows = array("l", [0]) * len(self.indices)
+            fill = list(counts)
+            for i in range(len(self.managers)):
+                for k in range(self.indptr[i], self.indptr[i + 1]):
+                    j = self.indices[k]
+                    rows[fill[j]] = i
+                    fill[j] += 1
+            self._csc = (colptr, rows)
+        return self._csc
+
+    # ------------------------------------------------------------------
+    # Linear algebra
+    # ------------------------------------------------------------------
+
+    def matvec(self, values: Sequence[float], weighted: bool = True) -> List[float]:
+        """
+        A @ values: per-manager sums of a per-player vector
+
+        Args:
+            values: One value per player column (e.g. projected points)
+            weighted: Use the captain/starter/bench weights; False sums
+                over every squad player
+
+        Returns:
+            One total per manager
+        """
+        indptr, indices, data = self.indptr, self.indices, self.data
+        totals = []
+        for i in range(len(self.managers)):
+            start, end = indptr[i], indptr[i + 1]
+            if weighted:
+                totals.append(sum(data[k] * values[indices[k]] for k in range(start, end)))
+            else:
+                totals.append(sum(values[indices[k]] for k in range(start, end)))
+        return totals
+
+    def rmatvec(self, values: Optional[Sequence[float]] = None, weighted: bool = True) -> List[float]:
+        """
+        A.T @ values: per-player sums over managers
+
+        Args:
+            values: One value per manager (default: all ones)
+            weighted: Use the weights; False counts squad membership
+
+        Returns:
+            One total per player column
+        """
+        totals = [0.0] * len(self.players)
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for i in range(len(self.managers)):
+            scale = 1.0 if values is None else values[i]
+            for k in range(indptr[i], indptr[i + 1]):
+                totals[indices[k]] += (data[k] if weighted else 1.0) * scale
+        return totals
+
+    # ------------------------------------------------------------------
+    # Ownership analytics
+    # ------------------------------------------------------------------
+
+    def ownership(self) -> Dict[Any, float]:
+        """Percentage of managers with each player in their squad"""
+        managers = len(self.managers) or 1
+        colptr, _ = self._transpose()
+        return {
+            player_id: 100.0 * (colptr[j + 1] - colptr[j]) / managers
+            for j, player_id in enumerate(self.players)
+        }
+
+    def effective_ownership(self) -> Dict[Any, float]:
+        """
+        Effective ownership (%) of each player: starters count once, captains
+        twice and benched players not at all, so a player's league-average
+        gain is effective_ownership / 100 times their points
+        """
+        managers = len(self.managers) or 1
+        return {
+            player_id: 100.0 * total / managers
+            for player_id, total in zip(self.players, self.rmatvec())
+        }
+
+    def captaincy(self) -> Dict[Any, float]:
+        """Percentage of managers captaining each player"""
+        managers = len(self.managers) or 1
+        counts = [0] * len(self.players)
+        for j, weight in zip(self.indices, self.data):
+            if weight == self.CAPTAIN_WEIGHT:
+                counts[j] += 1
+        return {
+            player_id: 100.0 * count / managers
+            for player_id, count in zip(self.players, counts) if count
+        }
+
+    def owners(self, player_id: Any) -> List[str]:
+        """GUIDs of the managers with a player in their squad"""
+        colptr, rows = self._transpose()
+        j = self._columns.get(player_id)
+        if j is None:
+            return []
+        return [self.managers[i] for i in rows[colptr[j]:colptr[j + 1]]]
+
+    def row(self, guid: str) -> Dict[Any, float]:
+        """Squad of one manager: player ID -> weight"""
+        i = self._rows[guid]
+        return {
+            self.players[self.indices[k]]: self.data[k]
+            for k in range(self.indptr[i], self.indptr[i + 1])
+        }
+
+    def differentials(self, guid: str, max_ownership: float = 100.0) -> List[Dict[str, Any]]:
+        """
+        A manager's exposure to each squad player relative to the league
+
+        The differential is the manager's weight minus the league's
+        effective ownership as a fraction: points scored by a player with a
+        positive differential gain ground on the league, and vice versa.
+
+        Args:
+            guid: Manager GUID
+            max_ownership: Only players owned by at most this percentage
+
+        Returns:
+            Squad players, largest differential first; the league-wide
+            figures are computed on the first call only
+
+        Raises:
+            KeyError: If the manager is not in the matrix
+        """
+        if self._stats is None:
+            self._stats = (self.ownership(), self.effective_ownership())
+        ownership, effective = self._stats
+        rows = []
+        for player_id, weight in self.row(guid).items():
+            if ownership[player_id] > max_ownership:
+                continue
+            rows.append(
+                {
+                    "playerId": player_id,
+                    "weight": weight,
+                    "ownership": ownership[player_id],
+                    "effective_ownership": effective[player_id],
+                    "differential": weight - effective[player_id] / 100.0,
+                }
+            )
+        rows.sort(key=lambda row: row["differential"], reverse=True)
+        return rows
+
+    def overlap(self, guid_a: str, guid_b: str) -> int:
+        """Number of squad players two managers share (sorted merge of two rows)"""
+        a, b = self._rows[guid_a], self._rows[guid_b]
+        i, i_end = self.indptr[a], self.indptr[a + 1]
+        k, k_end = self.indptr[b], self.indptr[b + 1]
+        shared = 0
+        while i < i_end and k < k_end:
+            if self.indices[i] == self.indices[k]:
+                shared += 1
+                i += 1
+                k += 1
+            elif self.indices[i] < self.indices[k]:
+                i += 1
+            else:
+                k += 1
+        return shared
+
+    def overlaps(self, guid: str) -> Dict[str, int]:
+        """
+        Shared squad players between one manager and every other manager
+
+        One row of A @ A.T, computed through the transposed matrix: only
+        managers owning at least one of this squad's players are visited.
+
+        Returns:
+            Shared players by GUID, for managers sharing at least one
+        """
+        colptr, rows = self._transpose()
+        i = self._rows[guid]
+        shared: Dict[int, int] = {}
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            j = self.indices[k]
+            for other in rows[colptr[j]:colptr[j + 1]]:
+                if other != i:
+                    shared[other] = shared.get(other, 0) + 1
+        return {self.managers[other]: count for other, count in shared.items()}
+
+    def overlap_matrix(self) -> List[List[int]]:
+        """Shared squad players for every pair of managers (A @ A.T, dense result)"""
+        size = len(self.managers)
+        matrix = [[0] * size for _ in range(size)]
+        colptr, rows = self._transpose()
+        for i in range(size):
+            row = matrix[i]
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                for other in rows[colptr[j]:colptr[j + 1]]:
+                    row[other] += 1
+        return matrix
+
+    def summary(self, names: Optional[Mapping[Any, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Per-player ownership table, highest effective ownership first
+
+        Args:
+            names: Optional player names by ID
+
+        Returns:
+            Rows with owners, ownership, captaincy and effective ownership
+        """
+        colptr, _ = self._transpose()
+        ownership = self.ownership()
+        effective = self.effective_ownership()
+        captaincy = self.captaincy()
+        rows = [
+            {
+                "playerId": player_id,
+                "name": (names or {}).get(player_id, ""),
+                "owners": colptr[j + 1] - colptr[j],
+                "ownership": round(ownership[player_id], 2),
+                "captaincy": round(captaincy.get(player_id, 0.0), 2),
+                "effective_ownership": round(effective[player_id], 2),
+            }
+            for j, player_id in enumerate(self.players)
+        ]
+        rows.sort(key=lambda row: (-row["effective_ownership"], -row["owners"]))
+        return rows
+
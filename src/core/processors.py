@@ -3,12 +3,31 @@ Data processing classes for UEFA Champions League data
 """
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from src.core.kickoff import KICKOFFS
+from src.core.match_stats import MatchStatsTable
+from src.core.metrics import METRICS
+from src.core.scheduler import MatchdayScheduler
 from src.core.team_mapper import TeamMapper
 
 
+class FixtureSlot(NamedTuple):
+    """One upcoming match from a team's point of view"""
+
+    matchday: int
+    opponent: str
+    opponent_id: Optional[int]
+    venue: str
+    kickoff: str
+    day: str
+    kickoff_timestamp: Optional[float] = None
+
+
+# Upcoming fixtures per team ID, ordered by matchday
+FixtureIndex = Dict[int, Tuple[FixtureSlot, ...]]
+
+
 class FixturesDataProcessor:
     """Processes raw fixtures data from UEFA API"""
 
@@ -16,6 +35,7 @@ class FixturesDataProcessor:
         self.team_mapper = team_mapper
         self.logger = logging.getLogger(__name__)
 
+    @METRICS.timed("process", stage="fixtures")
     def process_fixtures(
         self, raw_data: Dict[str, Any]
     ) -> Dict[int, List[Dict[str, Any]]]:
@@ -32,6 +52,9 @@ class FixturesDataProcessor:
             self.logger.error("Invalid fixtures data structure")
             return {}
 
+        # The feed is the source of truth for which clubs play the competition
+        self.team_mapper.load_from_fixtures(raw_data)
+
         fixtures_by_matchday = {}
 
         # Process each matchday's fixtures
@@ -55,10 +78,16 @@ class FixturesDataProcessor:
                     "match_id": match["mId"],
                     "home_team": home_team,
                     "away_team": away_team,
+                    "home_team_id": match.get("htId"),
+                    "away_team_id": match.get("atId"),
                     "home_team_original": match["htName"],
                     "away_team_original": match["atName"],
+                    "home_team_code": match.get("htCCode", ""),
+                    "away_team_code": match.get("atCCode", ""),
                     "match_name": match.get("mdName", ""),
                     "date_time": match.get("dateTime", ""),
+                    # Normalized once per fixture, referenced by players and schedulers
+                    "kickoff_timestamp": KICKOFFS.timestamp(match.get("dateTime", "")),
                     "match_status": match.get("matchStatus", ""),
                 }
 
@@ -77,6 +106,69 @@ class OpponentsTableBuilder:
         self.team_mapper = team_mapper
         self.logger = logging.getLogger(__name__)
 
+    @METRICS.timed("process", stage="fixture_index")
+    def build_fixture_index(
+        self,
+        fixtures_by_matchday: Dict[int, List[Dict[str, Any]]],
+        include_finished: bool = False,
+    ) -> FixtureIndex:
+        """
+        Index every team's upcoming fixtures by team ID
+
+        Kickoff strings are parsed once per fixture here, so joining players
+        to their fixtures is a dictionary lookup per player.
+
+        Args:
+            fixtures_by_matchday: Processed fixtures data
+            include_finished: Also index matches that are already finished
+
+        Returns:
+            Fixture slots per team ID, ordered by matchday
+        """
+        slots: Dict[int, List[FixtureSlot]] = {}
+
+        for matchday_id, fixtures in fixtures_by_matchday.items():
+            for fixture in fixtures:
+                status = str(fixture.get("match_status", ""))
+                if not include_finished and status == MatchdayScheduler.FINISHED_MATCH_STATUS:
+                    continue
+
+                kickoff = fixture.get("date_time", "")
+                day = KICKOFFS.day_of_week(kickoff)
+                kickoff_timestamp = fixture.get("kickoff_timestamp")
+                if kickoff_timestamp is None:
+                    kickoff_timestamp = KICKOFFS.timestamp(kickoff)
+
+                for side, other, venue in (("home", "away", "H"), ("away", "home", "A")):
+                    team_id = fixture.get(f"{side}_team_id")
+                    if team_id in (None, ""):
+                        continue
+                    opponent_id = fixture.get(f"{other}_team_id")
+                    slots.setdefault(int(team_id), []).append(
+                        FixtureSlot(
+                            matchday=matchday_id,
+                            opponent=fixture.get(f"{other}_team_code", ""),
+                            opponent_id=int(opponent_id) if opponent_id not in (None, "") else None,
+                            venue=venue,
+                            kickoff=kickoff,
+                            day=day,
+                            kickoff_timestamp=kickoff_timestamp,
+                        )
+                    )
+
+        index = {
+            team_id: tuple(sorted(team_slots, key=lambda slot: slot.matchday))
+            for team_id, team_slots in slots.items()
+        }
+        self.logger.info(f"Indexed upcoming fixtures for {len(index)} teams")
+        return index
+
+    def _resolve_team(self, fixture: Dict[str, Any], side: str) -> str:
+        """Standardized name of a fixture's home or away team, joined on team ID when known"""
+        team = self.team_mapper.get_team(fixture.get(f"{side}_team_id"))
+        return team.name if team else fixture[f"{side}_team"]
+
+    @METRICS.timed("process", stage="opponents")
     def build_opponents_table(
         self, fixtures_by_matchday: Dict[int, List[Dict[str, Any]]]
     ) -> Dict[str, Dict[str, str]]:
@@ -103,16 +195,16 @@ class OpponentsTableBuilder:
             )
 
             for fixture in fixtures:
-                home_team = fixture["home_team"]
-                away_team = fixture["away_team"]
+                home_team = self._resolve_team(fixture, "home")
+                away_team = self._resolve_team(fixture, "away")
 
                 # Record opponents for both teams
-                if self.team_mapper.is_valid_team(home_team):
+                if home_team in opponents_table:
                     opponents_table[home_team][f"Matchday {matchday_id}"] = away_team
                 else:
                     self.logger.warning(f"Home team {home_team} not found in team list")
 
-                if self.team_mapper.is_valid_team(away_team):
+                if away_team in opponents_table:
                     opponents_table[away_team][f"Matchday {matchday_id}"] = home_team
                 else:
                     self.logger.warning(f"Away team {away_team} not found in team list")
@@ -133,9 +225,26 @@ class PlayersDataProcessor:
     # Skill mapping
     SKILL_MAP = {1: "goal keepers", 2: "defenders", 3: "midfielders", 4: "attackers"}
 
-    def __init__(self, api_client=None):
+    # Upcoming matches emitted per player as 'fixture 1'..'fixture N',
+    # each with its UTC kickoff in 'fixture N kickoff'
+    FIXTURE_HORIZON = 3
+
+    def __init__(
+        self,
+        api_client=None,
+        fixture_index: Optional[FixtureIndex] = None,
+        team_mapper: Optional[TeamMapper] = None,
+    ):
         self.logger = logging.getLogger(__name__)
         self.api_client = api_client
+        # Per-match stats collected from the same popupstats fetches
+        self.match_stats = MatchStatsTable()
+        # Players whose popupstats came from the response cache instead of the API
+        self.stale_players = 0
+        # Team ID -> upcoming fixtures, from OpponentsTableBuilder.build_fixture_index
+        self.fixture_index = fixture_index
+        # Completed with the clubs of every players feed processed
+        self.team_mapper = team_mapper
 
     def _get_day_of_week(self, date_str: str) -> str:
         """
@@ -147,20 +256,24 @@ class PlayersDataProcessor:
         Returns:
             Day of the week name
         """
-        try:
-            dt = datetime.strptime(date_str, "%m/%d/%Y %H:%M:%S")
-            return dt.strftime("%A")
-        except (ValueError, TypeError):
-            return "N/A"
+        return KICKOFFS.day_of_week(date_str)
+
+    def _team_code(self, team_id: Any) -> str:
+        """Country code of a club by feed ID, from the team mapper"""
+        if self.team_mapper is None:
+            return ""
+        return self.team_mapper.team_code(team_id) or ""
 
+    @METRICS.timed("process", stage="players")
     def process_players(
-        self, raw_data: Dict[str, Any]
+        self, raw_data: Dict[str, Any], with_fantasy_points: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Process raw players data into cleaned format
 
         Args:
             raw_data: Raw data from UEFA players API
+            with_fantasy_points: Fetch per-player fantasy points (one request per player)
 
         Returns:
             List of processed player data dictionaries
@@ -173,15 +286,20 @@ class PlayersDataProcessor:
             self.logger.error("No playerList found in data")
             return []
 
+        # Clubs missing from the fixtures feed (and missing codes) come from the players
+        if self.team_mapper is not None:
+            self.team_mapper.load_from_players(raw_data)
+
         cleaned_player_data = []
+        self.match_stats = MatchStatsTable()
+        self.stale_players = 0
 
         for player in raw_data["data"]["value"]["playerList"]:
             # Transform the skill number to its description
             skill_description = self.SKILL_MAP.get(player.get("skill", 0), "unknown")
 
-            for upcoming_match in player.get("upcomingMatchesList", []):
-                home_or_away = upcoming_match.get("tLoc")
-                opponent = upcoming_match.get("vsCCode")
+            upcoming = self._upcoming_fixtures(player)
+            next_match = upcoming[0] if upcoming else None
 
             player_data = {
                 "playerId": player.get("id", ""),
@@ -194,7 +312,7 @@ class PlayersDataProcessor:
                 "minutes played": player.get("minsPlyd", ""),
                 "average points": player.get("avgPlayerPts", ""),
                 "isActive": player.get("isActive", ""),
-                "team": player.get("cCode", ""),
+                "team": player.get("cCode") or self._team_code(player.get("tId")),
                 "man of match": player.get("mOM", ""),
                 "position": skill_description,
                 "goals conceded": player.get("gC"),
@@ -203,25 +321,72 @@ class PlayersDataProcessor:
                 "penalties earned": player.get("pE"),
                 "balls recovered": player.get("bR"),
                 "selected by (%)": player.get("selPer", ""),
-                "match date": (
-                    self._get_day_of_week(player["upcomingMatchesList"][0]["matchDate"])
-                    if player.get("upcomingMatchesList")
-                    else "N/A"
-                ),
-                "home or away": home_or_away,
-                "opponent": opponent,
+                "match date": next_match.day if next_match else "N/A",
+                "home or away": next_match.venue if next_match else None,
+                "opponent": next_match.opponent if next_match else None,
             }
+            for i in range(self.FIXTURE_HORIZON):
+                slot = upcoming[i] if i < len(upcoming) else None
+                player_data[f"fixture {i + 1}"] = (
+                    f"MD{slot.matchday} {slot.opponent} ({slot.venue})" if slot else ""
+                )
+                player_data[f"fixture {i + 1} kickoff"] = KICKOFFS.iso_utc(slot.kickoff) if slot else ""
 
             # Fetch fantasy points data if API client is available
-            if self.api_client:
-                fantasy_data = self._get_player_fantasy_points(player.get("id", ""))
-                player_data.update(fantasy_data)
+            if with_fantasy_points:
+                self.add_fantasy_points(player_data)
 
             cleaned_player_data.append(player_data)
 
         self.logger.info(f"Processed {len(cleaned_player_data)} players")
+        if self.api_client and with_fantasy_points:
+            self.logger.info(f"Collected {len(self.match_stats)} per-match stat rows")
+        if self.stale_players:
+            self.logger.warning(
+                f"Fantasy points of {self.stale_players} players are cached copies "
+                "from a slow or failing API"
+            )
         return cleaned_player_data
 
+    def _upcoming_fixtures(self, player: Dict[str, Any]) -> Tuple[FixtureSlot, ...]:
+        """
+        Next FIXTURE_HORIZON fixtures of a player's team
+
+        Joined on the team ID through the fixture index when one is set,
+        otherwise read from the player's own upcomingMatchesList.
+        """
+        if self.fixture_index is not None:
+            try:
+                slots = self.fixture_index.get(int(player.get("tId")))
+            except (TypeError, ValueError):
+                slots = None
+            if slots is not None:
+                return slots[: self.FIXTURE_HORIZON]
+
+        return tuple(
+            FixtureSlot(
+                matchday=match.get("mdId", ""),
+                opponent=match.get("vsCCode", ""),
+                opponent_id=match.get("vsTId"),
+                venue=match.get("tLoc", ""),
+                kickoff=match.get("matchDate", ""),
+                day=self._get_day_of_week(match.get("matchDate", "")),
+                kickoff_timestamp=KICKOFFS.timestamp(match.get("matchDate", "")),
+            )
+            for match in player.get("upcomingMatchesList", [])[: self.FIXTURE_HORIZON]
+        )
+
+    def add_fantasy_points(self, player_data: Dict[str, Any]) -> None:
+        """
+        Fetch fantasy points for a processed player and merge in the MD columns
+
+        Args:
+            player_data: Processed player dictionary (updated in place)
+        """
+        if self.api_client:
+            fantasy_data = self._get_player_fantasy_points(player_data.get("playerId", ""))
+            player_data.update(fantasy_data)
+
     def _get_player_fantasy_points(self, player_id: str) -> Dict[str, int]:
         """
         Fetch and extract fantasy points for a single player
@@ -240,6 +405,8 @@ class PlayersDataProcessor:
         try:
             # Fetch player fantasy data from API
             raw_fantasy_data = self.api_client.fetch_player_fantasy_data(player_id)
+            if getattr(raw_fantasy_data, "stale", False):
+                self.stale_players += 1
 
             if not raw_fantasy_data or "data" not in raw_fantasy_data:
                 # Player has no fantasy data (hasn't played), set default values
@@ -267,6 +434,15 @@ class PlayersDataProcessor:
             if not fantasy_points:
                 self._set_default_fantasy_points(fantasy_points)
 
+            # Keep the full per-match breakdown from the same payload; a bad
+            # stat entry must not cost the player their MD points
+            try:
+                self.match_stats.add_popupstats(int(player_id), player_data)
+            except Exception as e:
+                self.logger.warning(
+                    f"Skipping per-match stats of player {player_id}: {str(e)}"
+                )
+
         except Exception as e:
             # Log error but continue with default values
             self.logger.debug(
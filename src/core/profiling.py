@@ -0,0 +1,127 @@
+"""
+Profiling hooks for CLI runs: cProfile (pstats output) or a sampling profiler
+(collapsed-stack output for flame graphs)
+"""
+
+import cProfile
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all running threads at a fixed interval
+
+    Overhead does not grow with the number of function calls, so it is safe
+    to leave on during long production runs. Output is the collapsed-stack
+    format read by flamegraph.pl and speedscope (one 'frame;frame;frame count'
+    line per distinct stack).
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.logger = logging.getLogger(__name__)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def sample(self) -> None:
+        """Record the current stack of every thread except the profiler's own"""
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(self._frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+        self.sample_count += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "SamplingProfiler":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def write_collapsed(self, path: str) -> None:
+        """Write the sampled stacks in collapsed-stack format"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        self.logger.info(
+            f"Wrote {len(self.stacks)} stacks from {self.sample_count} samples to {path}"
+        )
+
+
+@contextmanager
+def profiled(path: str, mode: str = "sample", interval: float = 0.005) -> Iterator[None]:
+    """
+    Profile the enclosed block and write the result to path
+
+    Requests, revalidation, hedges and DynamoDB writes run on pool threads.
+    Sampling sees every thread; cProfile only records the calling thread
+    (and only one cProfile can be active per process since Python 3.12, so
+    per-thread profiles cannot be merged).
+
+    Args:
+        path: Output file (pstats for 'cprofile', collapsed stacks for 'sample')
+        mode: 'sample' for low-overhead sampling of all threads,
+            'cprofile' for deterministic per-call stats of the calling thread only
+        interval: Sampling interval in seconds ('sample' mode only)
+    """
+    logger = logging.getLogger(__name__)
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode '{mode}', expected one of {PROFILE_MODES}")
+
+    start = time.perf_counter()
+    if mode == "sample":
+        profiler = SamplingProfiler(interval).start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            profiler.write_collapsed(path)
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(path)
+            logger.info(
+                f"Wrote cProfile stats of the main thread to {path} "
+                f"(view with: python -m pstats {path})"
+            )
+
+    logger.info(f"Profiled run took {time.perf_counter() - start:.2f} seconds")
@@ -0,0 +1,395 @@
+"""
+In-memory indexes over processed players, fixtures and the opponents table
+"""
+
+import csv
+import heapq
+import logging
+import math
+import os
+import threading
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.core.similarity import SimilarityIndex
+
+# Field the 'points' index and the default top-k are ordered by
+POINTS_FIELD = "total points"
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+class QueryError(ValueError):
+    """Invalid query (unknown field, bad number); reported to clients as HTTP 400"""
+
+
+def _coerce(value: Any) -> Any:
+    """Typed value of a CSV cell: int, float, None for empty, else the string"""
+    if not isinstance(value, str):
+        return value
+    if value == "":
+        return None
+    if value.lstrip("-").isdigit():
+        return int(value)
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
+
+def _fold(value: Any) -> str:
+    """Case-insensitive string form used for equality filters"""
+    return str(value).casefold()
+
+
+class QueryIndex:
+    """
+    Read-only snapshot of one run's processed data, indexed for queries
+
+    Players are indexed by id, team and position, and kept in points order.
+    Orders for other sort fields are built on first use. An index is never
+    modified once built; reloading builds a new one.
+    """
+
+    INDEXED_FIELDS = ("team", "position")
+
+    def __init__(
+        self,
+        players: Iterable[Dict[str, Any]],
+        opponents: Optional[Dict[str, Dict[str, str]]] = None,
+        fixtures: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        sources: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            players: Processed players (CSV rows are coerced to numbers)
+            opponents: Opponents table: team -> matchday -> opponent
+            fixtures: Fixtures by matchday
+            sources: Description of where the data was loaded from
+        """
+        self.players: List[Dict[str, Any]] = [
+            {field: _coerce(value) for field, value in player.items()} for player in players
+        ]
+        self.opponents = opponents or {}
+        self.fixtures = {str(matchday): games for matchday, games in (fixtures or {}).items()}
+        self.sources = sources or {}
+        self.loaded_at = time.time()
+
+        self.fields: List[str] = list(
+            dict.fromkeys(field for player in self.players for field in player)
+        )
+        self._by_id: Dict[str, int] = {
+            str(player.get("playerId")): i for i, player in enumerate(self.players)
+        }
+        self._by_field: Dict[str, Dict[str, List[int]]] = {}
+        for field in self.INDEXED_FIELDS:
+            postings: Dict[str, List[int]] = {}
+            for i, player in enumerate(self.players):
+                if player.get(field) is not None:
+                    postings.setdefault(_fold(player[field]), []).append(i)
+            self._by_field[field] = postings
+
+        # field -> (ascending order of rows with a value, rank of each row or None)
+        self._orders: Dict[str, Tuple[List[int], List[Optional[int]]]] = {}
+        self._orders_lock = threading.Lock()
+        if POINTS_FIELD in self.fields:
+            self._order(POINTS_FIELD)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    @cached_property
+    def similarity(self) -> "SimilarityIndex":
+        """Nearest-neighbour index of this roster, built on first use"""
+        from src.core.similarity import SimilarityIndex
+
+        return SimilarityIndex(self.players)
+
+    def _order(self, field: str) -> Tuple[List[int], List[Optional[int]]]:
+        """Ascending order and ranks of a field, built on first use"""
+        order = self._orders.get(field)
+        if order is not None:
+            return order
+        if field not in self.fields:
+            raise QueryError(f"Unknown field '{field}'")
+
+        valued = [i for i, player in enumerate(self.players) if player.get(field) is not None]
+        # Strings sort after numbers so mixed columns still have a total order
+        valued.sort(key=lambda i: (isinstance(self.players[i][field], str), self.players[i][field]))
+        ranks: List[Optional[int]] = [None] * len(self.players)
+        for rank, i in enumerate(valued):
+            ranks[i] = rank
+
+        with self._orders_lock:
+            return self._orders.setdefault(field, (valued, ranks))
+
+    def _sort_key(self, field: str, descending: bool):
+        _, ranks = self._order(field)
+        if descending:
+            return lambda i: (ranks[i] is None, -(ranks[i] or 0))
+        return lambda i: (ranks[i] is None, ranks[i] or 0)
+
+    def _ordered(self, field: str, descending: bool) -> List[int]:
+        """All rows in field order, rows without a value last"""
+        valued, ranks = self._order(field)
+        missing = [i for i, rank in enumerate(ranks) if rank is None]
+        return (valued[::-1] if descending else valued) + missing
+
+    def _select(
+        self, equals: Dict[str, Sequence[str]], ranges: Dict[str, Range]
+    ) -> Optional[List[int]]:
+        """
+        Rows matching every filter, in load order
+
+        Indexed fields narrow the candidates through their postings; other
+        filters are checked row by row on what is left.
+
+        Returns:
+            Matching row numbers, or None when there are no filters (all rows)
+        """
+        for field in list(equals) + list(ranges):
+            if field not in self.fields:
+                raise QueryError(f"Unknown field '{field}'")
+        if not equals and not ranges:
+            return None
+
+        candidates: Optional[List[int]] = None
+        scanned = {}
+        for field, values in equals.items():
+            if field not in self._by_field:
+                scanned[field] = {_fold(value) for value in values}
+                continue
+            postings = self._by_field[field]
+            rows = sorted({i for value in values for i in postings.get(_fold(value), ())})
+            if candidates is None:
+                candidates = rows
+            else:
+                keep = set(rows)
+                candidates = [i for i in candidates if i in keep]
+
+        rows = range(len(self.players)) if candidates is None else candidates
+        selected = []
+        for i in rows:
+            player = self.players[i]
+            if any(_fold(player.get(field)) not in values for field, values in scanned.items()):
+                continue
+            if any(not self._in_range(player.get(field), bounds) for field, bounds in ranges.items()):
+                continue
+            selected.append(i)
+        return selected
+
+    @staticmethod
+    def _in_range(value: Any, bounds: Range) -> bool:
+        if not isinstance(value, (int, float)):
+            return False
+        low, high = bounds
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    @staticmethod
+    def _project(player: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+        if not fields:
+            return player
+        return {field: player.get(field) for field in fields}
+
+    def get_player(self, player_id: Any) -> Optional[Dict[str, Any]]:
+        """Player by ID, or None"""
+        i = self._by_id.get(str(player_id))
+        return None if i is None else self.players[i]
+
+    def find_players(
+        self,
+        equals: Optional[Dict[str, Sequence[str]]] = None,
+        ranges: Optional[Dict[str, Range]] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        offset: int = 0,
+        limit: int = 50,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Filter, sort and paginate players
+
+        Args:
+            equals: Field -> accepted values (case-insensitive)
+            ranges: Field -> (min, max) numeric bounds, either may be None
+            sort_by: Field to sort by (default: load order)
+            descending: Sort direction
+            offset: Matches to skip
+            limit: Maximum players returned
+            fields: Fields to return (default: all)
+
+        Returns:
+            Dictionary with total, offset, limit and the page of players
+
+        Raises:
+            QueryError: On unknown fields
+        """
+        selected = self._select(equals or {}, ranges or {})
+        if sort_by:
+            if selected is None:
+                selected = self._ordered(sort_by, descending)
+            else:
+                selected.sort(key=self._sort_key(sort_by, descending))
+        elif selected is None:
+            selected = range(len(self.players))
+
+        page = selected[offset:offset + limit]
+        return {
+            "total": len(selected),
+            "offset": offset,
+            "limit": limit,
+            "players": [self._project(self.players[i], fields) for i in page],
+        }
+
+    def top_players(
+        self,
+        by: str = POINTS_FIELD,
+        k: int = 10,
+        equals: Optional[Dict[str, Sequence[str]]] = None,
+        ranges: Optional[Dict[str, Range]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        The k players with the highest values of a field
+
+        Without filters this slices the prebuilt order; with filters it
+        takes the k best matches with a heap instead of sorting them all.
+
+        Raises:
+            QueryError: On unknown fields
+        """
+        selected = self._select(equals or {}, ranges or {})
+        valued, ranks = self._order(by)
+        if selected is None:
+            best = valued[::-1][:k]
+        else:
+            best = heapq.nsmallest(
+                k, (i for i in selected if ranks[i] is not None), key=lambda i: -ranks[i]
+            )
+        return [self._project(self.players[i], fields) for i in best]
+
+    def teams(self) -> List[Dict[str, Any]]:
+        """Teams with their number of players"""
+        counts: Dict[str, int] = {}
+        for player in self.players:
+            if player.get("team") is not None:
+                counts[str(player["team"])] = counts.get(str(player["team"]), 0) + 1
+        return [{"team": team, "players": count} for team, count in sorted(counts.items())]
+
+    def fixtures_for(
+        self, matchday: Optional[str] = None, team: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fixtures by matchday, optionally for one matchday and/or team"""
+        wanted = _fold(team) if team else None
+        result = {}
+        for md, games in self.fixtures.items():
+            if matchday is not None and md != str(matchday):
+                continue
+            if wanted is not None:
+                games = [
+                    game for game in games
+                    if wanted in (_fold(game.get("home_team")), _fold(game.get("away_team")))
+                ]
+            result[md] = games
+        return result
+
+
+class IndexLoader:
+    """
+    Builds QueryIndexes from a run's output files and tells when they changed
+
+    Players come from the latest snapshot of a snapshot store when one is
+    given (fixtures too), otherwise from the players CSV. The opponents
+    table comes from its CSV.
+    """
+
+    def __init__(
+        self,
+        players_csv: Optional[str] = "players_data.csv",
+        opponents_csv: Optional[str] = "uefa_opponents_table.csv",
+        snapshot_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            players_csv: Players CSV written by the players command
+            opponents_csv: Opponents table CSV written by the fixtures command
+            snapshot_dir: Snapshot store recorded by players/fixtures runs
+        """
+        self.players_csv = players_csv
+        self.opponents_csv = opponents_csv
+        self.snapshot_dir = snapshot_dir
+        self.logger = logging.getLogger(__name__)
+
+    def _paths(self) -> List[str]:
+        paths = [self.players_csv, self.opponents_csv]
+        if self.snapshot_dir:
+            from src.core.snapshot_store import SnapshotStore
+
+            paths.append(os.path.join(self.snapshot_dir, SnapshotStore.MANIFEST))
+        return [path for path in paths if path]
+
+    def signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Modification time and size of every source; changes when a run rewrites one"""
+        signature = []
+        for path in self._paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    @staticmethod
+    def _read_csv(path: Optional[str]) -> Optional[List[Dict[str, str]]]:
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def load(self) -> QueryIndex:
+        """
+        Read all sources and index them
+
+        Returns:
+            A new QueryIndex (empty for sources that do not exist yet)
+        """
+        players = None
+        fixtures = None
+        sources: Dict[str, Any] = {}
+
+        if self.snapshot_dir:
+            from src.core.snapshot_store import SnapshotStore
+
+            store = SnapshotStore(self.snapshot_dir)
+            entry = store.latest(kind="players")
+            if entry:
+                players = store.load(entry["id"])["players"]
+                sources["players"] = f"snapshot {entry['id']}"
+            entry = store.latest(kind="fixtures")
+            if entry:
+                fixtures = store.load(entry["id"])["fixtures"]
+                sources["fixtures"] = f"snapshot {entry['id']}"
+
+        if players is None:
+            players = self._read_csv(self.players_csv)
+            if players is not None:
+                sources["players"] = self.players_csv
+
+        opponents = None
+        rows = self._read_csv(self.opponents_csv)
+        if rows is not None:
+            opponents = {
+                row["Team"]: {md: opponent for md, opponent in row.items() if md != "Team"}
+                for row in rows
+            }
+            sources["opponents"] = self.opponents_csv
+
+        index = QueryIndex(players or [], opponents, fixtures, sources)
+        self.logger.info(
+            f"Indexed {len(index)} players, {len(index.opponents)} opponents rows "
+            f"and {len(index.fixtures)} fixture matchdays"
+        )
+        return index
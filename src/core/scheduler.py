@@ -0,0 +1,201 @@
+"""
+Live-matchday scheduling driven by fixture kickoff times
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.kickoff import KICKOFF_FORMATS, KICKOFFS, KickoffClock, parse_local
+
+
+class MatchdayScheduler:
+    """Works out which teams are playing right now from processed fixtures"""
+
+    # matchStatus values seen in the feeds: 0 = upcoming, 1 = live, 2 = finished
+    LIVE_MATCH_STATUS = "1"
+    FINISHED_MATCH_STATUS = "2"
+
+    KICKOFF_FORMATS = KICKOFF_FORMATS
+
+    def __init__(
+        self,
+        fixtures_by_matchday: Optional[Dict[Any, List[Dict[str, Any]]]] = None,
+        match_window: timedelta = timedelta(hours=2, minutes=30),
+        lead_time: timedelta = timedelta(minutes=5),
+        clock: Optional[KickoffClock] = None,
+    ):
+        """
+        Args:
+            fixtures_by_matchday: Processed fixtures (as returned by FixturesDataProcessor)
+            match_window: How long after kickoff a match is considered in progress
+            lead_time: How long before kickoff a match window opens
+            clock: Kickoff parser (default: the shared memoized one)
+
+        Times passed as 'now' may be aware, or naive feed-local (CET/CEST) times.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.match_window = match_window
+        self.lead_time = lead_time
+        self.clock = clock or KICKOFFS
+        self._fixtures: List[Tuple[Optional[datetime], Dict[str, Any]]] = []
+        self.update_fixtures(fixtures_by_matchday or {})
+
+    @classmethod
+    def parse_kickoff(cls, date_str: str) -> Optional[datetime]:
+        """
+        Parse a fixture dateTime string (memoized)
+
+        Args:
+            date_str: Kickoff time as found in the fixtures or players feeds
+
+        Returns:
+            Naive feed-local datetime or None if the format is not recognised
+        """
+        return parse_local(date_str)
+
+    def _kickoff(self, fixture: Dict[str, Any]) -> Optional[datetime]:
+        """Aware UTC kickoff of a processed fixture"""
+        timestamp = fixture.get("kickoff_timestamp")
+        if timestamp is not None:
+            return datetime.fromtimestamp(timestamp, timezone.utc)
+        return self.clock.to_utc(fixture.get("date_time", ""))
+
+    def update_fixtures(self, fixtures_by_matchday: Dict[Any, List[Dict[str, Any]]]) -> None:
+        """
+        Replace the fixtures the schedule is computed from
+
+        Args:
+            fixtures_by_matchday: Processed fixtures (as returned by FixturesDataProcessor)
+        """
+        fixtures = []
+        for matchday_fixtures in fixtures_by_matchday.values():
+            for fixture in matchday_fixtures:
+                fixtures.append((self._kickoff(fixture), fixture))
+        # Unparseable kickoffs sort last; they can still be live by status
+        fixtures.sort(key=lambda item: (item[0] is None, item[0].timestamp() if item[0] else 0.0))
+        self._fixtures = fixtures
+
+    def _is_in_progress(
+        self, kickoff: Optional[datetime], fixture: Dict[str, Any], now: datetime
+    ) -> bool:
+        status = str(fixture.get("match_status", ""))
+        if status == self.LIVE_MATCH_STATUS:
+            return True
+        if status == self.FINISHED_MATCH_STATUS or kickoff is None:
+            return False
+        return kickoff - self.lead_time <= now <= kickoff + self.match_window
+
+    def live_fixtures(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Fixtures that are live or inside their match window
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            List of processed fixture dictionaries
+        """
+        now = self.clock.now(now)
+        return [
+            fixture
+            for kickoff, fixture in self._fixtures
+            if self._is_in_progress(kickoff, fixture, now)
+        ]
+
+    def playing_teams(self, now: Optional[datetime] = None) -> Set[str]:
+        """
+        Team codes (as used in the players feed 'team' column) currently playing
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            Set of team codes
+        """
+        teams = set()
+        for fixture in self.live_fixtures(now):
+            for key in ("home_team_code", "away_team_code"):
+                if fixture.get(key):
+                    teams.add(fixture[key])
+        return teams
+
+    def is_live(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether any match is currently being played
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            True if at least one fixture is live or inside its match window
+        """
+        return bool(self.live_fixtures(now))
+
+    def next_window_start(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Start of the next match window after now
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            Aware UTC datetime the next window opens, or None if no fixtures are left
+        """
+        now = self.clock.now(now)
+        for kickoff, fixture in self._fixtures:
+            if kickoff is None:
+                break
+            if str(fixture.get("match_status", "")) == self.FINISHED_MATCH_STATUS:
+                continue
+            window_start = kickoff - self.lead_time
+            if window_start > now:
+                return window_start
+        return None
+
+    def next_interval(
+        self,
+        live_interval: float,
+        idle_interval: float,
+        now: Optional[datetime] = None,
+    ) -> float:
+        """
+        Seconds to wait before the next refresh
+
+        While matches are live this is the live interval. Otherwise it is the
+        idle interval, shortened so the next match window is not missed.
+
+        Args:
+            live_interval: Seconds between refreshes during live matches
+            idle_interval: Seconds between refreshes outside match windows
+            now: Current time (default: now)
+
+        Returns:
+            Seconds to wait
+        """
+        now = self.clock.now(now)
+        if self.is_live(now):
+            return live_interval
+
+        window_start = self.next_window_start(now)
+        if window_start is None:
+            return idle_interval
+        return max(0.0, min(idle_interval, (window_start - now).total_seconds()))
+
+    def players_to_refresh(
+        self, players: Iterable[Dict[str, Any]], now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Select players whose team is currently playing
+
+        Args:
+            players: Processed player dictionaries
+            now: Current time (default: now)
+
+        Returns:
+            Players from teams inside a match window
+        """
+        teams = self.playing_teams(now)
+        if not teams:
+            return []
+        return [player for player in players if player.get("team") in teams]
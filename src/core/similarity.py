@@ -0,0 +1,130 @@
+"""
+Nearest-neighbour search over normalized player stat vectors
+"""
+
+import heapq
+import logging
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Season stats compared besides the points of every matchday
+STAT_FIELDS = ("total points", "minutes played", "goals", "assist", "balls recovered", "value")
+
+
+class SimilarityIndex:
+    """
+    k-nearest-neighbour index of a roster, for finding like-for-like replacements
+
+    Every player becomes a vector of z-score normalized features: points
+    in each matchday (MD1, MD2, ...), the STAT_FIELDS season stats and a
+    one-hot position, so each feature weighs the same whatever its unit.
+    Vectors are built once per roster; queries filter by position and
+    price first and then rank the remaining players by Euclidean distance.
+    A roster is under a thousand players, so a brute-force scan beats a
+    tree here and takes a few milliseconds.
+    """
+
+    # Weight of the one-hot position block when positions may differ
+    POSITION_WEIGHT = 2.0
+
+    def __init__(self, players: Sequence[Mapping[str, Any]], stat_fields: Sequence[str] = STAT_FIELDS):
+        """
+        Args:
+            players: Processed players (numeric fields already typed)
+            stat_fields: Season stats used as features
+        """
+        self.logger = logging.getLogger(__name__)
+        self.players = [player for player in players if player.get("playerId") is not None]
+        fields = {field for player in self.players for field in player}
+        matchdays = sorted(
+            (field for field in fields if field.startswith("MD") and field[2:].isdigit()),
+            key=lambda field: int(field[2:]),
+        )
+        self.features = matchdays + [field for field in stat_fields if field in fields]
+        self.positions = sorted({str(player.get("position")) for player in self.players})
+        self._by_id = {str(player["playerId"]): i for i, player in enumerate(self.players)}
+
+        columns = [[self._number(player.get(field)) for player in self.players] for field in self.features]
+        scaled = [self._standardize(column) for column in columns]
+        self.vectors: List[Tuple[float, ...]] = []
+        for i, player in enumerate(self.players):
+            position = str(player.get("position"))
+            one_hot = [self.POSITION_WEIGHT if position == name else 0.0 for name in self.positions]
+            self.vectors.append(tuple([column[i] for column in scaled] + one_hot))
+        self.logger.info(
+            f"Indexed {len(self.players)} players on {len(self.features)} features"
+        )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    @staticmethod
+    def _number(value: Any) -> float:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return number if math.isfinite(number) else 0.0
+
+    @staticmethod
+    def _standardize(column: List[float]) -> List[float]:
+        """Z-scores of a feature column (all zeros for a constant column)"""
+        mean = sum(column) / len(column) if column else 0.0
+        std = math.sqrt(sum((value - mean) ** 2 for value in column) / len(column)) if column else 0.0
+        if not std:
+            return [0.0] * len(column)
+        return [(value - mean) / std for value in column]
+
+    def get_player(self, player_id: Any) -> Optional[Mapping[str, Any]]:
+        i = self._by_id.get(str(player_id))
+        return None if i is None else self.players[i]
+
+    def similar(
+        self,
+        player_id: Any,
+        k: int = 5,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        same_position: bool = True,
+        exclude_team: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Players most similar to one player
+
+        Args:
+            player_id: Player to replace
+            k: Number of players returned
+            min_value: Cheapest price accepted
+            max_value: Most expensive price accepted
+            same_position: Only consider players of the same position
+            exclude_team: Skip the player's own club
+
+        Returns:
+            Players with a 'distance' (smaller is more similar), closest first
+
+        Raises:
+            KeyError: If the player is not in the roster
+        """
+        i = self._by_id.get(str(player_id))
+        if i is None:
+            raise KeyError(f"Player '{player_id}' not in the roster")
+        target = self.players[i]
+        vector = self.vectors[i]
+
+        scored = []
+        for j, player in enumerate(self.players):
+            if j == i:
+                continue
+            if same_position and player.get("position") != target.get("position"):
+                continue
+            if exclude_team and player.get("team") == target.get("team"):
+                continue
+            value = self._number(player.get("value"))
+            if (min_value is not None and value < min_value) or (max_value is not None and value > max_value):
+                continue
+            scored.append((math.dist(vector, self.vectors[j]), j))
+
+        return [
+            dict(self.players[j], distance=round(distance, 4))
+            for distance, j in heapq.nsmallest(k, scored)
+        ]
@@ -0,0 +1,148 @@
+"""
+Single-flight call coalescing: concurrent callers with the same key share one call
+"""
+
+import asyncio
+import inspect
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.core.metrics import METRICS
+
+
+class _Call:
+    """One in-flight call and the callers waiting for it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+        # Run once the call finishes; used to wake asyncio waiters
+        self.callbacks: List[Callable[[], None]] = []
+
+    def outcome(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result (or exception). Threads
+    and asyncio tasks can wait on the same call. Results are shared, not
+    copied, so callers must treat them as read-only. Nothing is cached once
+    the call has finished.
+    """
+
+    def __init__(self, name: str = "call"):
+        """
+        Args:
+            name: Label of the coalesced calls in metrics
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def _begin(self, key: Hashable) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                return call, False
+            call = self._calls[key] = _Call()
+            return call, True
+
+    def _finish(self, key: Hashable, call: _Call, result: Any, error: Optional[BaseException]) -> None:
+        with self._lock:
+            del self._calls[key]
+            call.result = result
+            call.error = error
+            call.done.set()
+            callbacks, call.callbacks = call.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _shared(self, labels: Dict[str, Any]) -> None:
+        METRICS.incr("singleflight_shared", flight=self.name, **labels)
+
+    def in_flight(self) -> int:
+        """Number of keys with a call in flight"""
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any], **labels) -> Any:
+        """
+        Run fn, or wait for the in-flight call with the same key
+
+        Args:
+            key: Identity of the call (e.g. the request path)
+            fn: Function to run if no call is in flight
+            **labels: Extra metric labels
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        call, leader = self._begin(key)
+        if not leader:
+            self._shared(labels)
+            call.done.wait()
+            return call.outcome()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, call, None, e)
+            raise
+        self._finish(key, call, result, None)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any], **labels) -> Any:
+        """
+        Asyncio variant of do()
+
+        A blocking fn runs in the loop's default executor; a coroutine
+        function is awaited. Waiting does not block the event loop, and
+        tasks can share a call started by a thread and vice versa.
+
+        Args:
+            key: Identity of the call
+            fn: Function or coroutine function to run if no call is in flight
+            **labels: Extra metric labels
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        loop = asyncio.get_running_loop()
+        call, leader = self._begin(key)
+
+        if not leader:
+            self._shared(labels)
+            future = loop.create_future()
+
+            def wake():
+                loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_result(None)
+                )
+
+            with self._lock:
+                if call.done.is_set():
+                    future.set_result(None)
+                else:
+                    call.callbacks.append(wake)
+            await future
+            return call.outcome()
+
+        try:
+            if inspect.iscoroutinefunction(fn):
+                result = await fn()
+            else:
+                result = await loop.run_in_executor(None, fn)
+        except BaseException as e:
+            self._finish(key, call, None, e)
+            raise
+        self._finish(key, call, result, None)
+        return result
@@ -0,0 +1,363 @@
+"""
+Append-only, content-addressed snapshot store for processed UEFA data
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.cache import TTLCache
+
+
+class SnapshotStore:
+    """
+    Records each run's processed players and fixtures for later time-travel queries
+
+    Layout under ``root``:
+        objects/<aa>/<sha256>.json.gz   compressed, content-addressed blobs
+        manifest.jsonl                  one line per snapshot, append-only
+
+    Players are split into a fixed number of buckets by playerId, each stored as
+    its own blob. Unchanged buckets dedupe across runs, and diffing two
+    snapshots only loads the buckets whose hashes differ. Decoded blobs are
+    kept in a bounded LRU cache, so long-running processes that keep
+    loading snapshots stay within a few snapshots' worth of memory.
+    """
+
+    BUCKETS = 64
+    MANIFEST = "manifest.jsonl"
+    OBJECTS = "objects"
+    # Decoded blobs kept in memory: a few snapshots (BUCKETS + 1 blobs each)
+    BLOB_CACHE_SIZE = 4 * (BUCKETS + 1)
+
+    def __init__(self, root: str = "snapshots", blob_cache_size: int = BLOB_CACHE_SIZE):
+        """
+        Args:
+            root: Directory of the store
+            blob_cache_size: Decoded blobs kept in memory
+        """
+        self.root = root
+        self.logger = logging.getLogger(__name__)
+        # Blobs are immutable, so entries never expire; they are only evicted
+        self._blob_cache = TTLCache(maxsize=blob_cache_size, ttl=math.inf, name="snapshot_blobs")
+
+    # ------------------------------------------------------------------
+    # Blob storage
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _canonical(obj: Any) -> bytes:
+        return json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        ).encode("utf-8")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, self.OBJECTS, digest[:2], f"{digest}.json.gz")
+
+    def _put_blob(self, obj: Any) -> str:
+        """Store an object once and return its content hash"""
+        payload = self._canonical(obj)
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(payload, mtime=0))
+            os.replace(tmp_path, path)
+
+        return digest
+
+    def _read_blob(self, digest: str) -> Any:
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def _get_blob(self, digest: str) -> Any:
+        return self._blob_cache.get_or_load(digest, lambda: self._read_blob(digest))
+
+    @classmethod
+    def _bucket_of(cls, player_id: Any) -> int:
+        return zlib.crc32(str(player_id).encode("utf-8")) % cls.BUCKETS
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        players_data: Optional[List[Dict[str, Any]]] = None,
+        fixtures_by_matchday: Optional[Dict[Any, List[Dict[str, Any]]]] = None,
+        matchday: Optional[int] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> str:
+        """
+        Append a snapshot of a run's processed data
+
+        Args:
+            players_data: Processed players (as returned by PlayersDataProcessor)
+            fixtures_by_matchday: Processed fixtures (as returned by FixturesDataProcessor)
+            matchday: Matchday the snapshot belongs to (inferred from MD points if omitted)
+            timestamp: Snapshot time (default: now, UTC)
+
+        Returns:
+            The new snapshot ID
+        """
+        timestamp = timestamp or datetime.now(timezone.utc)
+        if matchday is None and players_data:
+            matchday = self.infer_matchday(players_data)
+
+        entry: Dict[str, Any] = {
+            "timestamp": timestamp.astimezone(timezone.utc).isoformat(),
+            "matchday": matchday,
+            "players": None,
+            "fixtures": None,
+        }
+
+        if players_data is not None:
+            buckets: List[Dict[str, Any]] = [{} for _ in range(self.BUCKETS)]
+            for player in players_data:
+                player_id = str(player.get("playerId", ""))
+                buckets[self._bucket_of(player_id)][player_id] = player
+            entry["players"] = [self._put_blob(bucket) for bucket in buckets]
+            entry["player_count"] = len(players_data)
+
+        if fixtures_by_matchday is not None:
+            # JSON object keys are strings, keep matchdays comparable after reload
+            entry["fixtures"] = self._put_blob(
+                {str(md): fixtures for md, fixtures in fixtures_by_matchday.items()}
+            )
+
+        root_hash = hashlib.sha256(
+            self._canonical([entry["players"], entry["fixtures"]])
+        ).hexdigest()
+        entry["id"] = f"{timestamp.astimezone(timezone.utc):%Y%m%dT%H%M%S%fZ}-{root_hash[:12]}"
+
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, self.MANIFEST), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        self.logger.info(f"Recorded snapshot {entry['id']} (matchday {matchday})")
+        return entry["id"]
+
+    @staticmethod
+    def infer_matchday(players_data: Iterable[Dict[str, Any]]) -> Optional[int]:
+        """
+        Infer the latest played matchday as the highest MD column with any points
+
+        Args:
+            players_data: Processed players with MD1, MD2, ... columns
+
+        Returns:
+            Matchday number or None if no points were found
+        """
+        latest = None
+        for player in players_data:
+            for key, value in player.items():
+                if key.startswith("MD") and key[2:].isdigit() and value:
+                    matchday = int(key[2:])
+                    if latest is None or matchday > latest:
+                        latest = matchday
+        return latest
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list_snapshots(self, matchday: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List snapshot manifest entries in recording order
+
+        Args:
+            matchday: Only return snapshots for this matchday
+
+        Returns:
+            List of manifest entries
+        """
+        path = os.path.join(self.root, self.MANIFEST)
+        if not os.path.exists(path):
+            return []
+
+        entries = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if matchday is None or entry.get("matchday") == matchday:
+                    entries.append(entry)
+        return entries
+
+    def get_entry(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a manifest entry by full ID or unique prefix
+
+        Args:
+            snapshot_id: Snapshot ID or prefix
+
+        Returns:
+            Manifest entry or None if not found
+        """
+        matches = [
+            entry
+            for entry in self.list_snapshots()
+            if entry["id"].startswith(snapshot_id)
+        ]
+        if len(matches) > 1:
+            self.logger.error(f"Snapshot ID '{snapshot_id}' is ambiguous")
+            return None
+        return matches[0] if matches else None
+
+    def latest(
+        self,
+        matchday: Optional[int] = None,
+        at: Optional[datetime] = None,
+        kind: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Time-travel lookup: the most recent snapshot as of a point in time
+
+        Args:
+            matchday: Only consider snapshots for this matchday
+            at: Only consider snapshots taken at or before this time
+            kind: Only consider snapshots containing 'players' or 'fixtures'
+
+        Returns:
+            Manifest entry or None if nothing matches
+        """
+        cutoff = at.astimezone(timezone.utc).isoformat() if at else None
+        for entry in reversed(self.list_snapshots(matchday)):
+            if cutoff and entry["timestamp"] > cutoff:
+                continue
+            if kind and not entry.get(kind):
+                continue
+            return entry
+        return None
+
+    def load(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a snapshot's players and fixtures
+
+        Args:
+            snapshot_id: Snapshot ID or unique prefix
+
+        Returns:
+            Dictionary with 'meta', 'players' and 'fixtures' or None if not found
+        """
+        entry = self.get_entry(snapshot_id)
+        if not entry:
+            return None
+
+        players = None
+        if entry.get("players"):
+            players = []
+            for digest in entry["players"]:
+                players.extend(self._get_blob(digest).values())
+
+        fixtures = self._get_blob(entry["fixtures"]) if entry.get("fixtures") else None
+
+        return {"meta": entry, "players": players, "fixtures": fixtures}
+
+    def diff(
+        self,
+        old_id: str,
+        new_id: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Diff the players of two snapshots, loading only buckets that changed
+
+        Args:
+            old_id: Older snapshot ID or prefix
+            new_id: Newer snapshot ID or prefix
+            fields: Only report changes to these fields (default: all)
+
+        Returns:
+            Dictionary with 'added' and 'removed' player lists and 'changed'
+            mapping playerId to {field: (old, new)}, or None if not found
+        """
+        old_entry = self.get_entry(old_id)
+        new_entry = self.get_entry(new_id)
+        if not old_entry or not new_entry:
+            return None
+
+        field_filter = set(fields) if fields else None
+        result: Dict[str, Any] = {"added": [], "removed": [], "changed": {}}
+
+        old_buckets = old_entry.get("players") or [None] * self.BUCKETS
+        new_buckets = new_entry.get("players") or [None] * self.BUCKETS
+
+        for old_digest, new_digest in zip(old_buckets, new_buckets):
+            if old_digest == new_digest:
+                continue
+
+            old_rows = self._get_blob(old_digest) if old_digest else {}
+            new_rows = self._get_blob(new_digest) if new_digest else {}
+
+            for player_id, new_row in new_rows.items():
+                old_row = old_rows.get(player_id)
+                if old_row is None:
+                    result["added"].append(new_row)
+                    continue
+                changes = self._row_changes(old_row, new_row, field_filter)
+                if changes:
+                    result["changed"][player_id] = changes
+
+            for player_id, old_row in old_rows.items():
+                if player_id not in new_rows:
+                    result["removed"].append(old_row)
+
+        return result
+
+    @staticmethod
+    def _row_changes(
+        old_row: Dict[str, Any],
+        new_row: Dict[str, Any],
+        field_filter: Optional[set],
+    ) -> Dict[str, Tuple[Any, Any]]:
+        keys = field_filter if field_filter is not None else old_row.keys() | new_row.keys()
+        return {
+            key: (old_row.get(key), new_row.get(key))
+            for key in keys
+            if old_row.get(key) != new_row.get(key)
+        }
+
+    def player_history(
+        self, player_id: Any, fields: Iterable[str] = ("value", "selected by (%)")
+    ) -> List[Dict[str, Any]]:
+        """
+        Trace a player's fields across all snapshots (e.g. price and ownership trends)
+
+        Only the bucket holding the player is loaded from each snapshot.
+
+        Args:
+            player_id: The player's ID
+            fields: Fields to include in each history point
+
+        Returns:
+            List of {'timestamp', 'matchday', <field>: value} dictionaries
+        """
+        player_key = str(player_id)
+        bucket = self._bucket_of(player_key)
+        history = []
+
+        for entry in self.list_snapshots():
+            if not entry.get("players"):
+                continue
+            row = self._get_blob(entry["players"][bucket]).get(player_key)
+            if row is None:
+                continue
+            point = {"timestamp": entry["timestamp"], "matchday": entry["matchday"]}
+            for field in fields:
+                point[field] = row.get(field)
+            history.append(point)
+
+        return history
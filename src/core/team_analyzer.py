@@ -2,28 +2,38 @@
 Team analysis module for UEFA Champions League fantasy teams
 """
 
-import csv
-import http.client
-import json
 import logging
-import urllib.parse
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from src.exporters.dynamodb_exporter import DynamoDBExporter
+from src.api.client import UEFAApiClient
 from src.exporters.csv_exporter import CSVExporter
+from src.core.kickoff import KICKOFFS
+from src.core.lineup import Lineup, LineupSelector
 from src.core.team_mapper import TeamMapper
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime, boto3 is slow to import
+    from src.exporters.dynamodb_exporter import DynamoDBExporter
+
 
 class TeamAnalyzer:
     """Analyzes fantasy team data by fetching from UEFA API and cross-referencing with DynamoDB"""
 
-    BASE_HOST = "gaming.uefa.com"
-
-    def __init__(self, dynamodb_exporter: Optional[DynamoDBExporter] = None, csv_exporter: Optional[CSVExporter] = None):
+    def __init__(self, dynamodb_exporter: Optional["DynamoDBExporter"] = None, csv_exporter: Optional[CSVExporter] = None, api_client: Optional[UEFAApiClient] = None):
         self.logger = logging.getLogger(__name__)
-        self.dynamodb_exporter = dynamodb_exporter or DynamoDBExporter()
+        self.api_client = api_client or UEFAApiClient()
+        self._dynamodb_exporter = dynamodb_exporter
         self.csv_exporter = csv_exporter or CSVExporter(TeamMapper())
 
+    @property
+    def dynamodb_exporter(self) -> "DynamoDBExporter":
+        """DynamoDB exporter, created on first use (fetching teams does not need it)"""
+        if self._dynamodb_exporter is None:
+            from src.exporters.dynamodb_exporter import DynamoDBExporter
+
+            self._dynamodb_exporter = DynamoDBExporter()
+        return self._dynamodb_exporter
+
     def fetch_team_data(
         self, user_guid: str, matchday_id, phase_id: int = 0
     ) -> Optional[Dict[str, Any]]:
@@ -38,89 +48,12 @@ class TeamAnalyzer:
         Returns:
             Team data dictionary or None if failed
         """
-        # Build the endpoint URL
-        endpoint = (
-            f"/en/uclfantasy/services/api/Gameplay/user/{user_guid}/opponent-team"
-        )
-        params = (
-            f"?matchdayId={matchday_id}&phaseId={phase_id}&opponentguid={user_guid}"
-        )
-        full_path = endpoint + params
-
-        # Headers based on your cURL command
-        headers = {
-            "accept": "application/json",
-            "accept-language": "en-US,en;q=0.9",
-            "access-control-expose-headers": "Date",
-            "dnt": "1",
-            "entity": "ed0t4n$3!",
-            "priority": "u=1, i",
-            "referer": "https://gaming.uefa.com/en/uclfantasy/team/18034ca6-8818-11f0-801e-7568b2125093/0041006200640065006c006c00610068/0/0/0/00330030003100360033003300300038",
-            "sec-ch-ua": '"Not=A?Brand";v="24", "Chromium";v="140"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-            # Note: Not including cookies as they contain sensitive session data
-            # User will need to provide authentication if needed
-        }
-
-        try:
-            self.logger.info(f"Fetching team data from {self.BASE_HOST}{full_path}")
-
-            conn = http.client.HTTPSConnection(self.BASE_HOST)
-            conn.request("GET", full_path, headers=headers)
-
-            response = conn.getresponse()
-
-            if response.status != 200:
-                self.logger.error(f"HTTP {response.status}: {response.reason}")
-                # If we get 401/403, suggest using the JSON file as fallback
-                if response.status in [401, 403]:
-                    self.logger.warning(
-                        "Authentication required. Consider using the JSON file method as fallback."
-                    )
-                return None
-
-            data = response.read()
-            parsed_data = json.loads(data.decode("utf-8"))
-
+        team_data = self.api_client.fetch_team_data(user_guid, matchday_id, phase_id)
+        if team_data:
             self.logger.info("Successfully fetched team data from API")
-            return parsed_data
-
-        except Exception as e:
-            self.logger.error(f"Error fetching team data: {str(e)}")
-            return None
-        finally:
-            if "conn" in locals():
-                conn.close()
-
-    def load_team_from_json_fallback(
-        self, json_file_path: str
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Fallback method to load team data from JSON file if API fails
-
-        Args:
-            json_file_path: Path to the team JSON file
-
-        Returns:
-            Team data dictionary or None if failed
-        """
-        try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                team_data = json.load(f)
-
-            self.logger.info(f"Successfully loaded team data from {json_file_path}")
-            return team_data
-
-        except Exception as e:
-            self.logger.error(
-                f"Error loading team data from {json_file_path}: {str(e)}"
-            )
-            return None
+            # The payload's utcTime/cestTime pin the feed's current UTC offset
+            KICKOFFS.observe_meta(team_data)
+        return team_data
 
     def extract_player_ids(self, team_data: Dict[str, Any]) -> List[int]:
         """
@@ -207,13 +140,35 @@ class TeamAnalyzer:
         return team_players
 
 
+    def suggest_lineup(
+        self, team_data: Dict[str, Any], team_players: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[Lineup]:
+        """
+        Best starting XI, bench order and captain for a team's squad
+
+        Args:
+            team_data: Team data dictionary
+            team_players: Player info from get_team_players_info; their
+                'average points' are used as projections where present
+
+        Returns:
+            Lineup or None if no valid formation fits the squad
+        """
+        projections = {}
+        for player in team_players or []:
+            try:
+                projections[int(player["playerId"])] = float(player["average points"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        squad = LineupSelector.squad_from_team(team_data, projections)
+        return LineupSelector().best(squad)
+
     def analyze_team(
         self,
         user_guid: str,
         matchday_id: int = 3,
         phase_id: int = 0,
         table_name: str = "new-manual-fapi-ddb",
-        json_fallback_path: Optional[str] = None,
         csv_filename: str = "my_team.csv",
         export_to_dynamodb: bool = False,
         dynamodb_table_name: Optional[str] = None,
@@ -226,7 +181,6 @@ class TeamAnalyzer:
             matchday_id: Matchday ID (default: 2)
             phase_id: Phase ID (default: 0)
             table_name: DynamoDB table name for fetching player data
-            json_fallback_path: Optional path to JSON file if API fails
             csv_filename: Output CSV filename
             export_to_dynamodb: Whether to export team to DynamoDB
             dynamodb_table_name: Target DynamoDB table name for team export
@@ -234,20 +188,19 @@ class TeamAnalyzer:
         Returns:
             True if successful, False otherwise
         """
-        # Try to fetch team data from API first
+        # With the client's response cache enabled, a slow or failing API
+        # answers with the last good payload, marked stale
         team_data = self.fetch_team_data(user_guid, matchday_id, phase_id)
-        # print(team_data)
-        # breakpoint()
-
-        # If API fails and we have a fallback JSON file, use it
-        if not team_data and json_fallback_path:
-            print("⚠️  API request failed, falling back to JSON file...")
-            team_data = self.load_team_from_json_fallback(json_fallback_path)
 
         if not team_data:
-            print("❌ Failed to load team data from both API and JSON file")
+            print("❌ Failed to load team data from the API (and no cached copy)")
             return False
 
+        if getattr(team_data, "stale", False):
+            print(
+                f"⚠️  API slow or unavailable, using the team cached {team_data.age / 60:.0f} min ago"
+            )
+
         # Get player information
         print("🔍 Fetching player information from database...")
         player_ids = self.extract_player_ids(team_data)
@@ -260,6 +213,15 @@ class TeamAnalyzer:
         team_info = team_data.get("data", {}).get("value", {})
         team_name = team_info.get("teamName", "Unknown Team")
 
+        lineup = self.suggest_lineup(team_data, team_players)
+        if lineup:
+            print(
+                f"🧠 Suggested lineup {lineup.formation}: captain {lineup.captain.player_id}, "
+                f"vice {lineup.vice_captain.player_id}, bench "
+                f"{', '.join(str(player.player_id) for player in lineup.bench)} "
+                f"({lineup.projected:.1f} projected points)"
+            )
+
         # Export to DynamoDB if requested, otherwise export to CSV
         if export_to_dynamodb and dynamodb_table_name:
             print(f"📤 Exporting team to DynamoDB table '{dynamodb_table_name}'...")
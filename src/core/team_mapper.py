@@ -1,13 +1,27 @@
 """
 Team name mapping and standardization
 """
-from typing import List, Dict
+import json
+import logging
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+
+class TeamInfo(NamedTuple):
+    """One club as identified across the fixtures, players and team feeds"""
+
+    id: int
+    name: str
+    api_name: str
+    code: str
 
 
 class TeamMapper:
     """Handles mapping between API team names and standardized team names"""
     
-    # Team name mapping - API names to standardized names
+    # Display-name overrides for the UCL feed - API names to standardized names.
+    # Names missing here are used as the feed spells them.
     TEAM_NAME_MAPPING = {
         "Paris": "Paris Saint-Germain",
         "Liverpool": "Liverpool",
@@ -47,7 +61,7 @@ class TeamMapper:
         "Qarabağ": "Qarabağ"
     }
     
-    # List of all teams in the competition
+    # Default team list, used until the mapper is loaded from a feed or cache
     ALL_TEAMS = [
         "Paris Saint-Germain", "Liverpool", "Arsenal", "Manchester City", "Chelsea",
         "Tottenham", "Newcastle", "Real Madrid", "Barcelona", "Atlético Madrid",
@@ -59,8 +73,174 @@ class TeamMapper:
         "Bodø/Glimt", "Kairat Almaty", "Pafos", "Qarabağ"
     ]
     
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        name_mapping: Optional[Dict[str, str]] = None,
+        teams: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            name_mapping: API name to standardized name overrides (default: TEAM_NAME_MAPPING)
+            teams: Standardized team names (default: ALL_TEAMS)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name_mapping: Mapping[str, str] = MappingProxyType(
+            dict(self.TEAM_NAME_MAPPING if name_mapping is None else name_mapping)
+        )
+        self._build_indexes({}, self.ALL_TEAMS if teams is None else teams)
+
+    def _build_indexes(self, teams_by_id: Dict[int, TeamInfo], names: Iterable[str]) -> None:
+        """
+        Rebuild every lookup index from scratch
+
+        All indexes are read-only views so callers can hold on to them
+        without copying; a reload swaps in new ones.
+        """
+        id_by_name = {}
+        id_by_code = {}
+        for team in teams_by_id.values():
+            id_by_name[team.api_name] = team.id
+            id_by_name[team.name] = team.id
+            if team.code:
+                id_by_code[team.code] = team.id
+
+        self.teams_by_id: Mapping[int, TeamInfo] = MappingProxyType(dict(teams_by_id))
+        self.id_by_name: Mapping[str, int] = MappingProxyType(id_by_name)
+        self.id_by_code: Mapping[str, int] = MappingProxyType(id_by_code)
+        self.teams: Tuple[str, ...] = tuple(dict.fromkeys(names))
+        self.team_set = frozenset(self.teams)
+
+    def _load_teams(self, teams: Iterable[Tuple[Any, str, str]], merge: bool) -> int:
+        """
+        Index (team ID, API name, code) entries
+
+        Args:
+            teams: Entries as found in a feed, duplicates allowed
+            merge: Keep already known teams and only fill in missing fields
+
+        Returns:
+            Number of distinct teams found
+        """
+        found: Dict[int, TeamInfo] = {}
+        for team_id, api_name, code in teams:
+            if team_id in (None, "") or not api_name:
+                continue
+            team_id = int(team_id)
+            if team_id not in found:
+                found[team_id] = TeamInfo(
+                    team_id, self.get_standardized_name(api_name), api_name, code or ""
+                )
+
+        if not found:
+            return 0
+
+        teams_by_id = dict(self.teams_by_id) if merge else {}
+        for team_id, team in found.items():
+            known = teams_by_id.get(team_id)
+            if known is not None and not known.code and team.code:
+                known = known._replace(code=team.code)
+            teams_by_id[team_id] = known or team
+
+        self._build_indexes(teams_by_id, (team.name for team in teams_by_id.values()))
+        return len(found)
+
+    @classmethod
+    def from_fixtures(
+        cls, raw_data: Dict[str, Any], name_mapping: Optional[Dict[str, str]] = None
+    ) -> "TeamMapper":
+        """
+        Build a mapper whose team list comes from a fixtures feed
+
+        Args:
+            raw_data: Raw data from the fixtures API of any competition
+            name_mapping: API name overrides (default: TEAM_NAME_MAPPING)
+
+        Returns:
+            TeamMapper for the competition in the feed
+        """
+        mapper = cls(name_mapping)
+        mapper.load_from_fixtures(raw_data)
+        return mapper
+
+    def load_from_fixtures(self, raw_data: Dict[str, Any]) -> int:
+        """
+        Replace the teams with the clubs playing in a fixtures feed
+
+        The teams are left unchanged if the feed has no matches.
+
+        Args:
+            raw_data: Raw data from the fixtures API
+
+        Returns:
+            Number of teams found in the feed
+        """
+        entries = []
+        for matchday_data in (raw_data or {}).get("data", {}).get("value", []) or []:
+            for match in matchday_data.get("match", []):
+                entries.append((match.get("htId"), match.get("htName"), match.get("htCCode")))
+                entries.append((match.get("atId"), match.get("atName"), match.get("atCCode")))
+
+        return self._load_teams(entries, merge=False)
+
+    def load_from_players(self, raw_data: Dict[str, Any]) -> int:
+        """
+        Add clubs (and missing country codes) from a players feed
+
+        Args:
+            raw_data: Raw data from the players API
+
+        Returns:
+            Number of teams found in the feed
+        """
+        players = (raw_data or {}).get("data", {}).get("value", {}).get("playerList", [])
+        return self._load_teams(
+            ((player.get("tId"), player.get("tName"), player.get("cCode")) for player in players),
+            merge=bool(self.teams_by_id),
+        )
+
+    def save_cache(self, path: str) -> bool:
+        """
+        Save the team indexes so later runs can start without the fixtures feed
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            True if saved, False otherwise
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([team._asdict() for team in self.teams_by_id.values()], f)
+            return True
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Could not save team cache to {path}: {str(e)}")
+            return False
+
+    def load_cache(self, path: str) -> bool:
+        """
+        Load team indexes saved with save_cache()
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            True if loaded, False if the cache is missing or unreadable
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                teams = [TeamInfo(**team) for team in json.load(f)]
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable team cache {path}: {str(e)}")
+            return False
+
+        teams_by_id = {team.id: team for team in teams}
+        self._build_indexes(teams_by_id, (team.name for team in teams))
+        return bool(teams)
     
     def get_standardized_name(self, api_name: str) -> str:
         """
@@ -72,16 +252,16 @@ class TeamMapper:
         Returns:
             Standardized team name
         """
-        return self.TEAM_NAME_MAPPING.get(api_name, api_name)
+        return self.name_mapping.get(api_name, api_name)
     
-    def get_all_teams(self) -> List[str]:
+    def get_all_teams(self) -> Tuple[str, ...]:
         """
-        Get list of all teams in the competition
+        Get all teams in the competition
         
         Returns:
-            List of all standardized team names
+            Read-only tuple of all standardized team names
         """
-        return self.ALL_TEAMS.copy()
+        return self.teams
     
     def is_valid_team(self, team_name: str) -> bool:
         """
@@ -93,7 +273,45 @@ class TeamMapper:
         Returns:
             True if team exists in the competition
         """
-        return team_name in self.ALL_TEAMS
+        return team_name in self.team_set
+
+    def get_team(self, team_id: Any) -> Optional[TeamInfo]:
+        """
+        Look up a team by its feed ID (htId/atId/tId/teamid)
+
+        Args:
+            team_id: Team ID as int or string
+
+        Returns:
+            TeamInfo or None if unknown
+        """
+        try:
+            return self.teams_by_id.get(int(team_id))
+        except (TypeError, ValueError):
+            return None
+
+    def team_id(self, name_or_code: str) -> Optional[int]:
+        """
+        Look up a team ID by API name, standardized name or country code
+
+        Args:
+            name_or_code: e.g. 'Paris', 'Paris Saint-Germain' or 'PSG'
+
+        Returns:
+            Team ID or None if unknown
+        """
+        team_id = self.id_by_name.get(name_or_code)
+        return team_id if team_id is not None else self.id_by_code.get(name_or_code)
+
+    def team_name(self, team_id: Any) -> Optional[str]:
+        """Standardized name of a team ID, or None if unknown"""
+        team = self.get_team(team_id)
+        return team.name if team else None
+
+    def team_code(self, team_id: Any) -> Optional[str]:
+        """Country code of a team ID, or None if unknown"""
+        team = self.get_team(team_id)
+        return team.code if team else None
     
     def get_mapping_dict(self) -> Dict[str, str]:
         """
@@ -102,4 +320,4 @@ class TeamMapper:
         Returns:
             Dictionary mapping API names to standardized names
         """
-        return self.TEAM_NAME_MAPPING.copy()
\ No newline at end of file
+        return dict(self.name_mapping)
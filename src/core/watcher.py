@@ -0,0 +1,219 @@
+"""
+Long-running feed watcher that pushes only changed players downstream
+"""
+
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.metrics import METRICS
+from src.core.processors import (
+    FixturesDataProcessor,
+    OpponentsTableBuilder,
+    PlayersDataProcessor,
+)
+from src.core.scheduler import MatchdayScheduler
+
+# Called with (changed_players, all_players); returns True if the write succeeded
+ChangeHandler = Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], bool]
+
+
+class FeedWatcher:
+    """Polls the players and fixtures feeds and exports only players whose data changed"""
+
+    def __init__(
+        self,
+        api_client,
+        players_processor: PlayersDataProcessor,
+        fixtures_processor: FixturesDataProcessor,
+        on_changes: ChangeHandler,
+        idle_interval: float = 900,
+        live_interval: float = 60,
+        fixtures_interval: float = 3600,
+        scheduler: Optional[MatchdayScheduler] = None,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.api_client = api_client
+        self.players_processor = players_processor
+        self.fixtures_processor = fixtures_processor
+        self.on_changes = on_changes
+        self.idle_interval = idle_interval
+        self.live_interval = live_interval
+        self.fixtures_interval = fixtures_interval
+        self.scheduler = scheduler or MatchdayScheduler()
+
+        self.fixtures_by_matchday: Dict[Any, List[Dict[str, Any]]] = {}
+        self._fixtures_fetched_at: Optional[float] = None
+        self._row_hashes: Dict[Any, str] = {}
+        self._rows: Dict[Any, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _row_hash(row: Dict[str, Any]) -> str:
+        payload = json.dumps(row, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()
+
+    def refresh_fixtures(self, force: bool = False) -> None:
+        """
+        Re-fetch fixtures when they are older than the fixtures interval
+
+        Args:
+            force: Fetch even if the cached fixtures are still fresh
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._fixtures_fetched_at is not None
+            and now - self._fixtures_fetched_at < self.fixtures_interval
+        ):
+            return
+
+        raw_fixtures = self.api_client.fetch_fixtures_data()
+        stale = getattr(raw_fixtures, "stale", False)
+        if raw_fixtures:
+            self.fixtures_by_matchday = self.fixtures_processor.process_fixtures(
+                raw_fixtures
+            )
+            self.scheduler.update_fixtures(self.fixtures_by_matchday)
+            self.players_processor.fixture_index = OpponentsTableBuilder(
+                self.fixtures_processor.team_mapper
+            ).build_fixture_index(self.fixtures_by_matchday)
+            # A cached copy is used for now but re-fetched on the next poll
+            if not stale:
+                self._fixtures_fetched_at = now
+
+    def next_interval(self, now: Optional[datetime] = None) -> float:
+        """
+        Seconds to wait before the next poll
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            The live interval during matches, otherwise the idle interval
+            capped at the start of the next match window
+        """
+        return self.scheduler.next_interval(
+            self.live_interval, self.idle_interval, now
+        )
+
+    def poll_once(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch the players feed once and push changed players downstream
+
+        Popupstats are only fetched for players whose feed row changed, plus
+        the scheduler's players to refresh (teams inside a match window);
+        everyone else keeps the fantasy points from the previous poll.
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            List of changed players that were pushed downstream
+        """
+        self.refresh_fixtures()
+
+        raw_players = self.api_client.fetch_players_data()
+        if not raw_players:
+            self.logger.error("Failed to fetch players data")
+            return []
+        if getattr(raw_players, "stale", False):
+            # Pushing a cached copy downstream would pass old data off as fresh
+            METRICS.incr("watch_stale_polls")
+            self.logger.warning(
+                f"Players feed served from the response cache ({raw_players.age:.0f}s old); "
+                "skipping this poll"
+            )
+            return []
+
+        base_rows = self.players_processor.process_players(
+            raw_players, with_fantasy_points=False
+        )
+
+        live_players = {
+            player.get("playerId")
+            for player in self.scheduler.players_to_refresh(base_rows, now)
+        }
+
+        changed = []
+        rows = {}
+        for row in base_rows:
+            player_id = row.get("playerId")
+            row_hash = self._row_hash(row)
+            previous = self._rows.get(player_id)
+
+            if self._row_hashes.get(player_id) == row_hash:
+                if player_id not in live_players:
+                    METRICS.incr("cache_hits", cache="watch_rows")
+                    rows[player_id] = previous
+                    continue
+                # Live points land in popupstats before the players feed changes
+                self.players_processor.add_fantasy_points(row)
+                rows[player_id] = row
+                if row != previous:
+                    changed.append(row)
+                continue
+
+            METRICS.incr("cache_misses", cache="watch_rows")
+            self.players_processor.add_fantasy_points(row)
+            self._row_hashes[player_id] = row_hash
+            rows[player_id] = row
+            changed.append(row)
+
+        # Forget players that disappeared from the feed
+        for player_id in set(self._row_hashes) - set(rows):
+            del self._row_hashes[player_id]
+        self._rows = rows
+
+        if not changed:
+            self.logger.info("No player changes since last poll")
+            return []
+
+        self.logger.info(f"{len(changed)} of {len(rows)} players changed")
+        if not self.on_changes(changed, list(rows.values())):
+            # Forget the failed rows so they are retried on the next poll
+            for row in changed:
+                self._row_hashes.pop(row.get("playerId"), None)
+            self.logger.error("Failed to push changed players downstream")
+            return []
+
+        return changed
+
+    def run(
+        self,
+        max_polls: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        after_poll: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """
+        Poll until interrupted (or until max_polls polls have run)
+
+        Args:
+            max_polls: Stop after this many polls (default: run forever)
+            sleep: Sleep function (injectable for tests)
+            after_poll: Called after every poll (e.g. to flush metrics)
+
+        Returns:
+            Number of polls completed
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            try:
+                with METRICS.span("poll"):
+                    self.poll_once()
+            except Exception as e:
+                self.logger.error(f"Error during poll: {str(e)}")
+            polls += 1
+            if after_poll is not None:
+                after_poll()
+
+            if max_polls is not None and polls >= max_polls:
+                break
+
+            interval = self.next_interval()
+            self.logger.info(f"Next poll in {interval:.0f} seconds")
+            sleep(interval)
+
+        return polls
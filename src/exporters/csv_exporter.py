@@ -3,18 +3,49 @@ CSV export functionality for UEFA Champions League data
 """
 import csv
 import logging
-from typing import Dict, List, Any
+import os
+from typing import Any, Dict, Iterable, List, Optional
 
+from src.core.match_stats import MatchStatsTable
+from src.core.metrics import METRICS
 from src.core.team_mapper import TeamMapper
+from src.exporters.pipeline import ExportPipeline, ExportSink
 
 
 class CSVExporter:
     """Handles exporting data to CSV files"""
     
+    # Fixed leading columns of the players CSV; fixture and MD columns follow
+    PLAYER_BASE_FIELDS = [
+        "playerId",
+        "name",
+        "rating",
+        "value",
+        "total points",
+        "goals",
+        "assist",
+        "minutes played",
+        "average points",
+        "isActive",
+        "team",
+        "man of match",
+        "position",
+        "goals conceded",
+        "yellow cards",
+        "red cards",
+        "penalties earned",
+        "balls recovered",
+        "selected by (%)",
+        "match date",
+        "opponent",
+        "home or away"
+    ]
+    
     def __init__(self, team_mapper: TeamMapper):
         self.team_mapper = team_mapper
         self.logger = logging.getLogger(__name__)
     
+    @METRICS.timed("export", sink="csv", data="opponents")
     def export_opponents_table(self, opponents_table: Dict[str, Dict[str, str]], filename: str = "uefa_opponents_table.csv") -> bool:
         """
         Export opponents table to CSV file
@@ -41,8 +72,9 @@ class CSVExporter:
             # Sort matchdays numerically
             sorted_matchdays = sorted(all_matchdays, key=lambda x: int(x.split()[-1]) if x.split()[-1].isdigit() else 0)
             
-            # Create CSV file
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            # Write next to the target and rename, so readers never see a partial table
+            tmp_filename = f"{filename}.tmp"
+            with open(tmp_filename, "w", newline="", encoding="utf-8") as csvfile:
                 # Create fieldnames: Team, Matchday 1, Matchday 2, etc.
                 fieldnames = ["Team"] + sorted_matchdays
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -62,6 +94,7 @@ class CSVExporter:
                         writer.writerow(row)
                     else:
                         self.logger.warning(f"Team {team} not found in opponents table")
+            os.replace(tmp_filename, filename)
             
             valid_teams = len([team for team in self.team_mapper.get_all_teams() if team in opponents_table])
             self.logger.info(f"Successfully exported opponents table to {filename}")
@@ -72,6 +105,33 @@ class CSVExporter:
             self.logger.error(f"Error exporting opponents table: {str(e)}")
             return False
     
+    @classmethod
+    def players_fieldnames(cls, fields: Iterable[str]) -> List[str]:
+        """
+        Column order of the players CSV for a set of player fields
+        
+        Args:
+            fields: Union of the keys of the players to export
+            
+        Returns:
+            Base fields, then 'fixture N' (each followed by its 'fixture N kickoff')
+            and 'MDN' columns in numeric order
+        """
+        # Find MD (matchday) columns and sort them
+        md_fields = sorted([field for field in fields if field.startswith('MD') and field[2:].isdigit()], 
+                          key=lambda x: int(x[2:]))
+        
+        # Upcoming fixture columns ('fixture 1', 'fixture 1 kickoff', 'fixture 2', ...)
+        fixture_fields = sorted([field for field in fields if field.startswith('fixture ')
+                                 and field[8:].removesuffix(' kickoff').isdigit()],
+                                key=lambda x: (int(x[8:].removesuffix(' kickoff')), x.endswith(' kickoff')))
+        
+        return cls.PLAYER_BASE_FIELDS + fixture_fields + md_fields
+    
+    def sink(self, filename: str = "players_data.csv", fieldnames: Optional[List[str]] = None) -> "CSVSink":
+        """Players CSV sink for an ExportPipeline"""
+        return CSVSink(filename, fieldnames)
+    
     def export_players_data(self, players_data: List[Dict[str, Any]], filename: str = "players_data.csv") -> bool:
         """
         Export players data to CSV file
@@ -89,55 +149,101 @@ class CSVExporter:
             self.logger.error("No players data to export")
             return False
         
-        try:
-            # Get all unique field names from players data
-            all_fields = set()
-            for player in players_data:
-                all_fields.update(player.keys())
-            
-            # Define base fieldnames for players CSV
-            base_fieldnames = [
-                "playerId",
-                "name",
-                "rating",
-                "value",
-                "total points",
-                "goals",
-                "assist",
-                "minutes played",
-                "average points",
-                "isActive",
-                "team",
-                "man of match",
-                "position",
-                "goals conceded",
-                "yellow cards",
-                "red cards",
-                "penalties earned",
-                "balls recovered",
-                "selected by (%)",
-                "match date",
-                "opponent",
-                "home or away"
-            ]
-            
-            # Find MD (matchday) columns and sort them
-            md_fields = sorted([field for field in all_fields if field.startswith('MD') and field[2:].isdigit()], 
-                              key=lambda x: int(x[2:]))
-            
-            # Combine base fields with MD fields
-            fieldnames = base_fieldnames + md_fields
+        success = ExportPipeline([self.sink(filename)]).run(players_data)
+        if success:
+            self.logger.info(f"Successfully exported {len(players_data)} players to {filename}")
+        return success
+    
+    @METRICS.timed("export", sink="csv", data="match_stats")
+    def export_match_stats(self, match_stats: MatchStatsTable, filename: str = "players_match_stats.csv") -> bool:
+        """
+        Export per-match player stats to a long-format CSV file
+        
+        Args:
+            match_stats: Long-format table of (player, matchday, stat, value) rows
+            filename: Name of the output CSV file
             
+        Returns:
+            True if export successful, False otherwise
+        """
+        self.logger.info(f"Exporting per-match stats to {filename}")
+        
+        if not len(match_stats):
+            self.logger.error("No per-match stats to export")
+            return False
+        
+        try:
             with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for player in players_data:
-                    writer.writerow(player)
+                writer = csv.writer(csvfile)
+                writer.writerow(["playerId", "matchday", "stat", "value"])
+                writer.writerows(match_stats.rows())
             
-            self.logger.info(f"Successfully exported {len(players_data)} players to {filename}")
+            self.logger.info(f"Successfully exported {len(match_stats)} stat rows to {filename}")
             return True
             
+        except Exception as e:
+            self.logger.error(f"Error exporting per-match stats: {str(e)}")
+            return False
+
+
+class CSVSink(ExportSink):
+    """
+    Players CSV sink
+    
+    Without explicit fieldnames the header depends on every record (fixture
+    and MD columns vary), so rows are kept until close while the field union
+    is grown as they arrive. With fieldnames, rows are streamed to disk.
+    Rows go to a temporary file renamed over the target on close, so readers
+    (e.g. the serve command) only ever see complete files.
+    """
+    
+    name = "csv"
+    
+    def __init__(self, filename: str = "players_data.csv", fieldnames: Optional[List[str]] = None):
+        self.filename = filename
+        self._tmp_filename = f"{filename}.tmp"
+        self.fieldnames = fieldnames
+        self.logger = logging.getLogger(__name__)
+        self._file = None
+        self._writer = None
+        self._rows: List[Dict[str, Any]] = []
+        self._fields: Dict[str, None] = {}
+    
+    def _start(self, fieldnames: List[str]) -> None:
+        self._file = open(self._tmp_filename, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        self._writer.writeheader()
+    
+    def open(self) -> bool:
+        if self.fieldnames:
+            self._start(self.fieldnames)
+        return True
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        if self._writer:
+            self._writer.writerow(record)
+        else:
+            self._fields.update(dict.fromkeys(record))
+            self._rows.append(record)
+    
+    def close(self) -> bool:
+        try:
+            if not self._writer:
+                self._start(CSVExporter.players_fieldnames(self._fields))
+                self._writer.writerows(self._rows)
+            self._file.close()
+            os.replace(self._tmp_filename, self.filename)
         except Exception as e:
             self.logger.error(f"Error exporting players data: {str(e)}")
-            return False
\ No newline at end of file
+            self.abort()
+            return False
+        finally:
+            self._rows = []
+        return True
+    
+    def abort(self) -> None:
+        self._rows = []
+        if self._file:
+            self._file.close()
+            if os.path.exists(self._tmp_filename):
+                os.remove(self._tmp_filename)
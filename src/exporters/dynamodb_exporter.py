@@ -3,19 +3,46 @@ DynamoDB export functionality for UEFA Champions League data
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from src.core.cache import TTLCache
+from src.core.match_stats import MatchStatsTable
+from src.core.metrics import METRICS
+from src.exporters.dynamodb_writer import BatchSession, ParallelBatchWriter, WriteResult
+from src.exporters.pipeline import ExportPipeline, ExportSink
+
 
 class DynamoDBExporter:
     """Handles exporting data to DynamoDB tables"""
 
-    def __init__(self, region_name: str = "eu-central-1"):
+    def __init__(
+        self,
+        region_name: str = "eu-central-1",
+        workers: int = 4,
+        cache_size: int = 4096,
+        cache_ttl: float = 300.0,
+    ):
+        """
+        Args:
+            region_name: AWS region of the tables
+            workers: Concurrent BatchWriteItem calls per export
+            cache_size: Players kept by the get_player_by_id read-through cache
+            cache_ttl: Seconds a cached player stays valid
+        """
         self.region_name = region_name
+        self.workers = workers
         self.logger = logging.getLogger(__name__)
         self._dynamodb = None
+        # (table, playerId) -> item or None; dropped when this exporter writes the player
+        self.player_cache = TTLCache(cache_size, cache_ttl, name="dynamodb_players")
+
+    @property
+    def writer(self) -> ParallelBatchWriter:
+        """Parallel batch writer over the thread-safe low-level client"""
+        return ParallelBatchWriter(self.dynamodb.meta.client, workers=self.workers)
 
     @property
     def dynamodb(self):
@@ -47,6 +74,63 @@ class DynamoDBExporter:
         Args:
             table_name: Name of the DynamoDB table
 
+        Returns:
+            True if table exists or was created successfully, False otherwise
+        """
+        return self._create_table_if_not_exists(
+            table_name,
+            key_schema=[
+                {
+                    "AttributeName": "playerId",
+                    "KeyType": "HASH",  # Partition key
+                }
+            ],
+            attribute_definitions=[
+                {
+                    "AttributeName": "playerId",
+                    "AttributeType": "S",  # String
+                }
+            ],
+        )
+
+    def create_match_stats_table_if_not_exists(
+        self, table_name: str = "uefa-players-match-stats"
+    ) -> bool:
+        """
+        Create the per-match stats table (playerId + matchday key) if it doesn't exist
+
+        Args:
+            table_name: Name of the DynamoDB table
+
+        Returns:
+            True if table exists or was created successfully, False otherwise
+        """
+        return self._create_table_if_not_exists(
+            table_name,
+            key_schema=[
+                {"AttributeName": "playerId", "KeyType": "HASH"},
+                {"AttributeName": "matchday", "KeyType": "RANGE"},
+            ],
+            attribute_definitions=[
+                {"AttributeName": "playerId", "AttributeType": "S"},
+                {"AttributeName": "matchday", "AttributeType": "N"},
+            ],
+        )
+
+    def _create_table_if_not_exists(
+        self,
+        table_name: str,
+        key_schema: List[Dict[str, str]],
+        attribute_definitions: List[Dict[str, str]],
+    ) -> bool:
+        """
+        Create a table with the given key schema if it doesn't exist
+
+        Args:
+            table_name: Name of the DynamoDB table
+            key_schema: DynamoDB KeySchema definition
+            attribute_definitions: DynamoDB AttributeDefinitions for the key attributes
+
         Returns:
             True if table exists or was created successfully, False otherwise
         """
@@ -65,18 +149,8 @@ class DynamoDBExporter:
                 try:
                     table = self.dynamodb.create_table(
                         TableName=table_name,
-                        KeySchema=[
-                            {
-                                "AttributeName": "playerId",
-                                "KeyType": "HASH",  # Partition key
-                            }
-                        ],
-                        AttributeDefinitions=[
-                            {
-                                "AttributeName": "playerId",
-                                "AttributeType": "S",  # String
-                            }
-                        ],
+                        KeySchema=key_schema,
+                        AttributeDefinitions=attribute_definitions,
                         BillingMode="PAY_PER_REQUEST",  # On-demand billing
                     )
 
@@ -94,6 +168,16 @@ class DynamoDBExporter:
                 self.logger.error(f"Error checking table '{table_name}': {e}")
                 return False
 
+    def sink(
+        self,
+        table_name: str = "uefa-players",
+        match_stats: Optional[MatchStatsTable] = None,
+        match_stats_table: str = "uefa-players-match-stats",
+        label: str = "players",
+    ) -> "DynamoDBSink":
+        """Players table sink for an ExportPipeline, optionally also writing per-match stats"""
+        return DynamoDBSink(self, table_name, match_stats, match_stats_table, label)
+
     def export_players_data(
         self, players_data: List[Dict[str, Any]], table_name: str = "uefa-players"
     ) -> bool:
@@ -107,52 +191,171 @@ class DynamoDBExporter:
         Returns:
             True if export successful, False otherwise
         """
+        return self._export_players(players_data, table_name, "players")
+
+    def _export_players(
+        self, players: List[Dict[str, Any]], table_name: str, data: str
+    ) -> bool:
+        """
+        Export player rows (all players or a team) through the pipeline
+
+        Args:
+            players: List of player data dictionaries
+            table_name: Name of the DynamoDB table
+            data: Dataset label ('players' or 'team')
+
+        Returns:
+            True if every player was written, False otherwise
+        """
         self.logger.info(
-            f"Exporting {len(players_data)} players to DynamoDB table '{table_name}'"
+            f"Exporting {len(players)} {data} rows to DynamoDB table '{table_name}'"
         )
 
-        if not players_data:
-            self.logger.error("No players data to export")
+        if not players:
+            self.logger.error(f"No {data} data to export")
+            return False
+
+        label = "players" if data == "players" else f"{data} players"
+        return ExportPipeline(
+            [self.sink(table_name, label=label)], data=data
+        ).run(players)
+
+    @METRICS.timed("export", sink="dynamodb", data="match_stats")
+    def export_match_stats(
+        self,
+        match_stats: MatchStatsTable,
+        table_name: str = "uefa-players-match-stats",
+    ) -> bool:
+        """
+        Export per-match stats to DynamoDB, one item per player and matchday
+
+        Args:
+            match_stats: Long-format table of (player, matchday, stat, value) rows
+            table_name: Name of the DynamoDB table
+
+        Returns:
+            True if export successful, False otherwise
+        """
+        self.logger.info(
+            f"Exporting {len(match_stats)} stat rows to DynamoDB table '{table_name}'"
+        )
+
+        if not len(match_stats):
+            self.logger.error("No per-match stats to export")
             return False
 
         # Ensure table exists
-        if not self.create_players_table_if_not_exists(table_name):
+        if not self.create_match_stats_table_if_not_exists(table_name):
             return False
 
-        try:
-            table = self.dynamodb.Table(table_name)
-            successful_writes = 0
-            failed_writes = 0
-
-            # Write items to DynamoDB
-            with table.batch_writer() as batch:
-                for player in players_data:
-                    try:
-                        # Prepare item for DynamoDB
-                        item = self._prepare_player_item(player)
-                        batch.put_item(Item=item)
-                        successful_writes += 1
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to write player {player.get('name', 'unknown')}: {str(e)}"
-                        )
-                        failed_writes += 1
-
-            self.logger.info(
-                f"Successfully exported {successful_writes} players to DynamoDB"
-            )
-            if failed_writes > 0:
-                self.logger.warning(f"Failed to export {failed_writes} players")
+        return self._write(
+            table_name, self._match_stats_items(match_stats), "player matchdays"
+        )
+
+    def _match_stats_items(self, match_stats: MatchStatsTable) -> Iterator[Dict[str, Any]]:
+        """One item per player and matchday, keyed by playerId + matchday"""
+        for (player_id, matchday), stats in match_stats.by_player_matchday().items():
+            item = {"playerId": str(player_id), "matchday": matchday}
+            item.update(stats)
+            yield item
+
+    def _write(self, table_name: str, items, label: str) -> bool:
+        """
+        Write items to one table with the parallel batch writer
 
-            return failed_writes == 0  # Return True only if all writes succeeded
+        Args:
+            table_name: Name of the DynamoDB table
+            items: Items to write
+            label: What the items are, for logging
 
+        Returns:
+            True if every item was written, False otherwise
+        """
+        try:
+            result = self.writer.write(table_name, items)
         except ClientError as e:
             self.logger.error(f"Error writing to DynamoDB table '{table_name}': {e}")
             return False
         except Exception as e:
             self.logger.error(f"Unexpected error during DynamoDB export: {str(e)}")
             return False
+        return self._report(result, label)
+
+    def _report(self, result: WriteResult, label: str) -> bool:
+        self.logger.info(
+            f"Successfully exported {result.written} {label} to DynamoDB "
+            f"({result.items_per_second:.0f} items/s)"
+        )
+        if result.failed:
+            self.logger.warning(f"Failed to export {result.failed} {label}")
+        return result.failed == 0
+
+    def export_all(
+        self,
+        players_data: Optional[List[Dict[str, Any]]] = None,
+        players_table: str = "uefa-players",
+        match_stats: Optional[MatchStatsTable] = None,
+        match_stats_table: str = "uefa-players-match-stats",
+        team_players: Optional[List[Dict[str, Any]]] = None,
+        team_table: str = "my-fantasy-team",
+    ) -> bool:
+        """
+        Export players, per-match stats and team players in one parallel pass
+
+        Batches for all tables share the same worker pool, so a small table
+        does not wait for a large one to finish.
+
+        Args:
+            players_data: Players to write, or None to skip
+            players_table: Players table name
+            match_stats: Per-match stats to write, or None to skip
+            match_stats_table: Per-match stats table name
+            team_players: Team players to write, or None to skip
+            team_table: Team table name
+
+        Returns:
+            True if every table was written completely, False otherwise
+        """
+        items_by_table = {}
+        labels = {}
+        if players_data:
+            if not self.create_players_table_if_not_exists(players_table):
+                return False
+            items_by_table[players_table] = (
+                self._prepare_player_item(p) for p in players_data
+            )
+            labels[players_table] = "players"
+        if match_stats is not None and len(match_stats):
+            if not self.create_match_stats_table_if_not_exists(match_stats_table):
+                return False
+            items_by_table[match_stats_table] = self._match_stats_items(match_stats)
+            labels[match_stats_table] = "player matchdays"
+        if team_players:
+            if not self.create_players_table_if_not_exists(team_table):
+                return False
+            items_by_table[team_table] = (
+                self._prepare_player_item(p) for p in team_players
+            )
+            labels[team_table] = "team players"
+
+        if not items_by_table:
+            self.logger.error("No data to export")
+            return False
+
+        try:
+            with METRICS.span("export", sink="dynamodb", data="all"):
+                results = self.writer.write_tables(items_by_table)
+        except Exception as e:
+            self.logger.error(f"Unexpected error during DynamoDB export: {str(e)}")
+            return False
+        finally:
+            for table_name in items_by_table:
+                self.invalidate_players(table_name)
+
+        success = True
+        for table_name, result in results.items():
+            success = self._report(result, labels[table_name]) and success
+        return success
 
     def _prepare_player_item(self, player: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -187,7 +390,7 @@ class DynamoDBExporter:
         self, player_id: str, table_name: str = "uefa-players"
     ) -> Optional[Dict[str, Any]]:
         """
-        Retrieve a player by ID from DynamoDB
+        Retrieve a player by ID, through the in-memory read-through cache
 
         Args:
             player_id: The player ID to lookup
@@ -197,20 +400,62 @@ class DynamoDBExporter:
             Player data dictionary or None if not found
         """
         try:
-            table = self.dynamodb.Table(table_name)
-            response = table.get_item(Key={"playerId": player_id})
-
-            if "Item" in response:
-                self.logger.info(f"Retrieved player {player_id} from DynamoDB")
-                return response["Item"]
-            else:
-                self.logger.info(f"Player {player_id} not found in DynamoDB")
-                return None
-
+            item = self.player_cache.get_or_load(
+                (table_name, str(player_id)), lambda: self._get_player_item(player_id, table_name)
+            )
         except ClientError as e:
+            # Not cached, so the next lookup asks DynamoDB again
             self.logger.error(f"Error retrieving player {player_id}: {e}")
             return None
+        # Callers get their own copy so the cached item can't be modified
+        return dict(item) if item is not None else None
+
+    @METRICS.timed("dynamodb_call", op="get_item")
+    def _get_player_item(
+        self, player_id: str, table_name: str = "uefa-players"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a player by ID from DynamoDB
+
+        Args:
+            player_id: The player ID to lookup
+            table_name: Name of the DynamoDB table
+
+        Returns:
+            Player data dictionary or None if not found
+
+        Raises:
+            ClientError: If the DynamoDB call fails
+        """
+        table = self.dynamodb.Table(table_name)
+        response = table.get_item(Key={"playerId": player_id})
+
+        if "Item" in response:
+            self.logger.info(f"Retrieved player {player_id} from DynamoDB")
+            return response["Item"]
+        else:
+            self.logger.info(f"Player {player_id} not found in DynamoDB")
+            return None
+
+    def invalidate_players(self, table_name: str, player_ids=None) -> int:
+        """
+        Drop cached players of a table after they were written
+
+        Args:
+            table_name: Table that was written
+            player_ids: Player IDs written, or None for the whole table
 
+        Returns:
+            Number of cache entries dropped
+        """
+        if player_ids is None:
+            return self.player_cache.clear(lambda key: key[0] == table_name)
+        dropped = len(self.player_cache)
+        for player_id in player_ids:
+            self.player_cache.invalidate((table_name, str(player_id)))
+        return dropped - len(self.player_cache)
+
+    @METRICS.timed("dynamodb_call", op="scan")
     def list_all_players(
         self, table_name: str = "uefa-players"
     ) -> List[Dict[str, Any]]:
@@ -254,49 +499,72 @@ class DynamoDBExporter:
         Returns:
             True if export successful, False otherwise
         """
-        self.logger.info(
-            f"Exporting {len(team_players)} team players to DynamoDB table '{table_name}'"
-        )
-
-        if not team_players:
-            self.logger.error("No team players data to export")
-            return False
-
-        # Ensure table exists
-        if not self.create_players_table_if_not_exists(table_name):
+        return self._export_players(team_players, table_name, "team")
+
+
+class DynamoDBSink(ExportSink):
+    """
+    Streams player rows into a table through a parallel batch session
+
+    Per-match stats, if given, are written to their own table in the same
+    session once the players have been queued.
+    """
+
+    name = "dynamodb"
+
+    def __init__(
+        self,
+        exporter: DynamoDBExporter,
+        table_name: str = "uefa-players",
+        match_stats: Optional[MatchStatsTable] = None,
+        match_stats_table: str = "uefa-players-match-stats",
+        label: str = "players",
+    ):
+        self.exporter = exporter
+        self.label = label
+        self.table_name = table_name
+        self.match_stats = match_stats if match_stats is not None and len(match_stats) else None
+        self.match_stats_table = match_stats_table
+        self._session: Optional[BatchSession] = None
+        self._written_ids: List[str] = []
+
+    def open(self) -> bool:
+        if not self.exporter.create_players_table_if_not_exists(self.table_name):
             return False
-
-        try:
-            table = self.dynamodb.Table(table_name)
-            successful_writes = 0
-            failed_writes = 0
-
-            # Write items to DynamoDB
-            with table.batch_writer() as batch:
-                for player in team_players:
-                    try:
-                        # Prepare item for DynamoDB
-                        item = self._prepare_player_item(player)
-                        batch.put_item(Item=item)
-                        successful_writes += 1
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to write player {player.get('name', 'unknown')}: {str(e)}"
-                        )
-                        failed_writes += 1
-
-            self.logger.info(
-                f"Successfully exported {successful_writes} team players to DynamoDB"
+        tables = [self.table_name]
+        if self.match_stats is not None:
+            if not self.exporter.create_match_stats_table_if_not_exists(
+                self.match_stats_table
+            ):
+                return False
+            tables.append(self.match_stats_table)
+        self._session = self.exporter.writer.session(tables)
+        return True
+
+    def write(self, record: Dict[str, Any]) -> None:
+        item = self.exporter._prepare_player_item(record)
+        self._session.put(self.table_name, item)
+        self._written_ids.append(item["playerId"])
+
+    def close(self) -> bool:
+        if self.match_stats is not None:
+            for item in self.exporter._match_stats_items(self.match_stats):
+                self._session.put(self.match_stats_table, item)
+        results = self._session.close()
+        # Invalidate once the writes have landed, so a concurrent read
+        # can't re-cache the old item
+        self.exporter.invalidate_players(self.table_name, self._written_ids)
+
+        success = self.exporter._report(results[self.table_name], self.label)
+        if self.match_stats is not None:
+            success = (
+                self.exporter._report(results[self.match_stats_table], "player matchdays")
+                and success
             )
-            if failed_writes > 0:
-                self.logger.warning(f"Failed to export {failed_writes} team players")
-
-            return failed_writes == 0  # Return True only if all writes succeeded
+        return success
 
-        except ClientError as e:
-            self.logger.error(f"Error writing to DynamoDB table '{table_name}': {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error during DynamoDB export: {str(e)}")
-            return False
+    def abort(self) -> None:
+        # Batches already sent can't be recalled; just wait for them
+        if self._session is not None:
+            self._session.close()
+            self.exporter.invalidate_players(self.table_name, self._written_ids)
@@ -0,0 +1,268 @@
+"""
+Parallel BatchWriteItem writer for DynamoDB
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+from src.core.metrics import METRICS
+
+
+class WriteResult(NamedTuple):
+    """Outcome of writing one table"""
+
+    table: str
+    items: int
+    written: int
+    failed: int
+    retries: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        return self.written / self.seconds if self.seconds > 0 else 0.0
+
+
+class ParallelBatchWriter:
+    """
+    Writes items to one or more tables with concurrent BatchWriteItem calls
+
+    Items are packed into 25-item requests (the BatchWriteItem limit), which
+    may mix tables, and sent by a pool of workers. UnprocessedItems and
+    throttling errors are retried with exponential backoff and full jitter.
+    Uses the low-level client, which unlike boto3 resources is thread-safe.
+    """
+
+    MAX_BATCH_SIZE = 25
+    # Errors meaning "slow down", retried like UnprocessedItems
+    RETRYABLE_ERRORS = {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+        "InternalServerError",
+    }
+
+    def __init__(
+        self,
+        client,
+        workers: int = 4,
+        max_attempts: int = 8,
+        base_delay: float = 0.05,
+        max_delay: float = 5.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            client: boto3 DynamoDB client (e.g. resource.meta.client)
+            workers: Concurrent BatchWriteItem calls
+            max_attempts: Attempts per batch before its remaining items count as failed
+            base_delay: First backoff delay in seconds
+            max_delay: Backoff cap in seconds
+            sleep: Sleep function (injectable for tests)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self._serializer = TypeSerializer()
+        self._random = random.Random()
+
+    def _serialize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: self._serializer.serialize(
+                Decimal(str(value)) if isinstance(value, float) else value
+            )
+            for key, value in item.items()
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: uniform between 0 and the capped exponential delay
+        return self._random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def _send(self, batch: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, List[int]]:
+        """
+        Write one batch, retrying unprocessed items
+
+        Returns:
+            [written, failed, retries] per table
+        """
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for table, request in batch:
+            request_items.setdefault(table, []).append(request)
+
+        counts = {table: [0, 0, 0] for table in request_items}
+        for attempt in range(self.max_attempts):
+            sent = {table: len(requests) for table, requests in request_items.items()}
+            try:
+                with METRICS.span("dynamodb_call", op="batch_write_item"):
+                    response = self.client.batch_write_item(RequestItems=request_items)
+                unprocessed = response.get("UnprocessedItems") or {}
+            except ClientError as e:
+                if e.response["Error"]["Code"] not in self.RETRYABLE_ERRORS:
+                    self.logger.error(f"BatchWriteItem failed: {e}")
+                    break
+                unprocessed = request_items
+
+            for table, count in sent.items():
+                counts[table][0] += count - len(unprocessed.get(table, []))
+            if not unprocessed:
+                return counts
+
+            for table in unprocessed:
+                counts[table][2] += 1
+            METRICS.incr("dynamodb_unprocessed_retries")
+            request_items = unprocessed
+            if attempt + 1 < self.max_attempts:
+                self.sleep(self._backoff(attempt))
+
+        for table, requests in request_items.items():
+            counts[table][1] += len(requests)
+        return counts
+
+    def session(self, tables: Iterable[str] = ()) -> "BatchSession":
+        """
+        Open a streaming write session
+
+        Args:
+            tables: Tables to report on even if no item is put to them
+
+        Returns:
+            BatchSession; put() items, then close() it (or use it as a context manager)
+        """
+        return BatchSession(self, tables)
+
+    def write_tables(
+        self, items_by_table: Dict[str, Iterable[Dict[str, Any]]]
+    ) -> Dict[str, WriteResult]:
+        """
+        Write items to several tables in one parallel pass
+
+        Args:
+            items_by_table: Items (plain Python values) per table name; the
+                iterables are consumed lazily
+
+        Returns:
+            WriteResult per table
+        """
+        with self.session(items_by_table) as session:
+            for table, items in items_by_table.items():
+                for item in items:
+                    session.put(table, item)
+        return session.results
+
+    def write(self, table_name: str, items: Iterable[Dict[str, Any]]) -> WriteResult:
+        """
+        Write items to a single table
+
+        Args:
+            table_name: Target table
+            items: Items with plain Python values
+
+        Returns:
+            WriteResult for the table
+        """
+        return self.write_tables({table_name: items})[table_name]
+
+
+class BatchSession:
+    """
+    Streams put requests into a ParallelBatchWriter's worker pool
+
+    Items are serialized and packed as they are put, and full batches are
+    sent while the caller keeps producing. At most two batches per worker
+    are in flight, so put() blocks rather than queueing without bound.
+    """
+
+    def __init__(self, writer: ParallelBatchWriter, tables: Iterable[str] = ()):
+        self.writer = writer
+        self.logger = writer.logger
+        # items, written, failed, retries
+        self._totals: Dict[str, List[int]] = {table: [0, 0, 0, 0] for table in tables}
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(writer.workers * 2)
+        self._batch: List[Tuple[str, Dict[str, Any]]] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=writer.workers, thread_name_prefix="ddb-writer"
+        )
+        self._start = time.perf_counter()
+        self.results: Optional[Dict[str, WriteResult]] = None
+
+    def __enter__(self) -> "BatchSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _collect(self, future) -> None:
+        self._in_flight.release()
+        try:
+            counts = future.result()
+        except Exception as e:
+            self.logger.error(f"BatchWriteItem worker failed: {str(e)}")
+            return
+        with self._lock:
+            for table, (written, failed, retries) in counts.items():
+                totals = self._totals[table]
+                totals[1] += written
+                totals[2] += failed
+                totals[3] += retries
+
+    def _submit(self) -> None:
+        batch, self._batch = self._batch, []
+        self._in_flight.acquire()
+        self._executor.submit(self.writer._send, batch).add_done_callback(self._collect)
+
+    def put(self, table_name: str, item: Dict[str, Any]) -> None:
+        """
+        Queue one item for writing
+
+        Args:
+            table_name: Target table
+            item: Item with plain Python values
+        """
+        request = {"PutRequest": {"Item": self.writer._serialize(item)}}
+        with self._lock:
+            self._totals.setdefault(table_name, [0, 0, 0, 0])[0] += 1
+        self._batch.append((table_name, request))
+        if len(self._batch) == self.writer.MAX_BATCH_SIZE:
+            self._submit()
+
+    def close(self) -> Dict[str, WriteResult]:
+        """
+        Send the last partial batch and wait for all workers
+
+        Returns:
+            WriteResult per table
+        """
+        if self.results is not None:
+            return self.results
+        if self._batch:
+            self._submit()
+        self._executor.shutdown(wait=True)
+
+        seconds = time.perf_counter() - self._start
+        self.results = {}
+        for table, (items, written, failed, retries) in self._totals.items():
+            # Items lost to a crashed worker count as failed
+            failed = max(failed, items - written)
+            result = WriteResult(table, items, written, failed, retries, seconds)
+            self.results[table] = result
+            METRICS.incr("dynamodb_items_written", written, table=table)
+            if failed:
+                METRICS.incr("dynamodb_items_failed", failed, table=table)
+            self.logger.info(
+                f"Wrote {written}/{items} items to '{table}' in {seconds:.2f}s "
+                f"({result.items_per_second:.0f} items/s, {retries} retried batches)"
+            )
+        return self.results
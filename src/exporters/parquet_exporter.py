@@ -0,0 +1,72 @@
+"""
+Parquet export functionality for UEFA Champions League data (needs pyarrow)
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from src.exporters.pipeline import ExportSink
+
+
+class ParquetSink(ExportSink):
+    """
+    Writes records to a Parquet file with pyarrow
+
+    pyarrow is optional and only imported when the sink is opened. Columns
+    are built as records arrive; a column mixing text and numbers (e.g.
+    'N/A' placeholders) is stored as text.
+    """
+
+    name = "parquet"
+
+    def __init__(self, filename: str = "players_data.parquet"):
+        self.filename = filename
+        self.logger = logging.getLogger(__name__)
+        self._columns: Dict[str, List[Any]] = {}
+        self._rows = 0
+
+    def open(self) -> bool:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.logger.error("Parquet export needs pyarrow: pip install pyarrow")
+            return False
+        return True
+
+    def write(self, record: Dict[str, Any]) -> None:
+        for name, value in record.items():
+            column = self._columns.get(name)
+            if column is None:
+                # Backfill rows written before this field first appeared
+                column = self._columns[name] = [None] * self._rows
+            column.append(value)
+        self._rows += 1
+        for column in self._columns.values():
+            if len(column) < self._rows:
+                column.append(None)
+
+    @staticmethod
+    def _normalize(values: List[Any]) -> List[Any]:
+        kinds = {type(value) for value in values if value is not None}
+        if len(kinds) <= 1 or kinds <= {int, float}:
+            return values
+        return [None if value is None else str(value) for value in values]
+
+    def close(self) -> bool:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            table = pa.table(
+                {name: self._normalize(values) for name, values in self._columns.items()}
+            )
+            pq.write_table(table, self.filename)
+        except (pa.ArrowException, OSError) as e:
+            self.logger.error(f"Error exporting players data to Parquet: {str(e)}")
+            return False
+        finally:
+            self._columns = {}
+        return True
+
+    def abort(self) -> None:
+        self._columns = {}
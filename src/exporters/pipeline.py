@@ -0,0 +1,155 @@
+"""
+Export pipeline: one pass over a record stream, fanned out to several sinks
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+from src.core.metrics import METRICS
+
+
+class ExportSink(ABC):
+    """
+    Destination for a stream of records
+
+    Subclasses must implement write (a sink without it cannot be created)
+    and may override open/close/abort; the pipeline times each call and
+    stops feeding a sink as soon as it fails.
+    """
+
+    # Short label used in logs and metrics (e.g. 'csv')
+    name = "sink"
+
+    def open(self) -> bool:
+        """
+        Prepare the destination
+
+        Returns:
+            True if the sink is ready to receive records
+        """
+        return True
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record; raise to mark the sink as failed"""
+
+    def close(self) -> bool:
+        """
+        Flush and finish the destination
+
+        Returns:
+            True if everything written so far was stored
+        """
+        return True
+
+    def abort(self) -> None:
+        """Release resources after a failed write, discarding what can be discarded"""
+        return None
+
+
+class SinkResult(NamedTuple):
+    """Outcome and throughput of one sink"""
+
+    sink: str
+    records: int
+    seconds: float
+    success: bool
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+
+class ExportPipeline:
+    """Feeds every record of a stream to each sink in a single pass"""
+
+    def __init__(self, sinks: List[ExportSink], data: str = "players"):
+        """
+        Args:
+            sinks: Destinations, written in order for each record
+            data: Dataset label for logs and metrics (e.g. 'players', 'team')
+        """
+        self.logger = logging.getLogger(__name__)
+        self.sinks = sinks
+        self.data = data
+        self.results: List[SinkResult] = []
+
+    def run(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Write a record stream to all sinks
+
+        The stream is consumed once; a sink that fails to open or write is
+        dropped while the others carry on. Per-sink results are left in
+        self.results.
+
+        Args:
+            records: Records to export (any iterable, e.g. a generator)
+
+        Returns:
+            True if every sink stored every record, False otherwise
+        """
+        active = []
+        # Seconds spent in each sink and records it received
+        elapsed = [0.0] * len(self.sinks)
+        counts = [0] * len(self.sinks)
+        ok = [True] * len(self.sinks)
+
+        for i, sink in enumerate(self.sinks):
+            start = time.perf_counter()
+            try:
+                opened = sink.open()
+            except Exception as e:
+                self.logger.error(f"Error opening {sink.name} sink: {str(e)}")
+                opened = False
+            elapsed[i] += time.perf_counter() - start
+            if opened:
+                active.append(i)
+            else:
+                ok[i] = False
+
+        try:
+            for record in records:
+                for i in list(active):
+                    sink = self.sinks[i]
+                    start = time.perf_counter()
+                    try:
+                        sink.write(record)
+                        counts[i] += 1
+                    except Exception as e:
+                        self.logger.error(f"Error writing to {sink.name} sink: {str(e)}")
+                        sink.abort()
+                        active.remove(i)
+                        ok[i] = False
+                    elapsed[i] += time.perf_counter() - start
+        except BaseException:
+            # The record stream itself failed: leave no half-written outputs behind
+            for i in active:
+                self.sinks[i].abort()
+            raise
+
+        for i in active:
+            sink = self.sinks[i]
+            start = time.perf_counter()
+            try:
+                ok[i] = bool(sink.close())
+            except Exception as e:
+                self.logger.error(f"Error closing {sink.name} sink: {str(e)}")
+                ok[i] = False
+            elapsed[i] += time.perf_counter() - start
+
+        self.results = []
+        for i, sink in enumerate(self.sinks):
+            result = SinkResult(sink.name, counts[i], elapsed[i], ok[i])
+            self.results.append(result)
+            METRICS.observe("export_seconds", result.seconds, sink=sink.name, data=self.data)
+            METRICS.incr("export_records", result.records, sink=sink.name, data=self.data)
+            if not result.success:
+                METRICS.incr("export_failures", sink=sink.name, data=self.data)
+            self.logger.info(
+                f"{sink.name}: {result.records} {self.data} records in {result.seconds:.3f}s "
+                f"({result.records_per_second:.0f} records/s)"
+            )
+
+        return all(ok)
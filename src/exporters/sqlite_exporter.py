@@ -0,0 +1,179 @@
+"""
+SQLite export functionality for UEFA Champions League data
+"""
+
+import logging
+import sqlite3
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+from src.core.match_stats import MatchStatsTable
+from src.core.metrics import METRICS
+from src.exporters.pipeline import ExportPipeline, ExportSink
+
+
+class SQLiteExporter:
+    """Handles exporting data to a local SQLite database"""
+
+    PLAYERS_TABLE = "players"
+    MATCH_STATS_TABLE = "match_stats"
+
+    def __init__(self, database: str = "players_data.db"):
+        self.database = database
+        self.logger = logging.getLogger(__name__)
+
+    def _connect(self) -> "closing[sqlite3.Connection]":
+        return closing(sqlite3.connect(self.database))
+
+    def sink(self, table: str = PLAYERS_TABLE) -> "SQLiteSink":
+        """Sink replacing a table of this database, for an ExportPipeline"""
+        return SQLiteSink(self.database, table)
+
+    def export_players_data(self, players_data: List[Dict[str, Any]]) -> bool:
+        """
+        Export players data to the players table, replacing previous contents
+
+        Args:
+            players_data: List of player data dictionaries
+
+        Returns:
+            True if export successful, False otherwise
+        """
+        self.logger.info(
+            f"Exporting {len(players_data)} players to SQLite database '{self.database}'"
+        )
+
+        if not players_data:
+            self.logger.error("No players data to export")
+            return False
+
+        success = ExportPipeline([self.sink()]).run(players_data)
+        if success:
+            self.logger.info(f"Successfully exported {len(players_data)} players to SQLite")
+        return success
+
+    @METRICS.timed("export", sink="sqlite", data="match_stats")
+    def export_match_stats(self, match_stats: MatchStatsTable) -> bool:
+        """
+        Export per-match stats to the long-format match_stats table
+
+        Args:
+            match_stats: Long-format table of (player, matchday, stat, value) rows
+
+        Returns:
+            True if export successful, False otherwise
+        """
+        self.logger.info(
+            f"Exporting {len(match_stats)} stat rows to SQLite database '{self.database}'"
+        )
+
+        if not len(match_stats):
+            self.logger.error("No per-match stats to export")
+            return False
+
+        try:
+            with self._connect() as conn, conn:
+                conn.execute(f'DROP TABLE IF EXISTS "{self.MATCH_STATS_TABLE}"')
+                conn.execute(
+                    f'CREATE TABLE "{self.MATCH_STATS_TABLE}" ('
+                    "playerId INTEGER NOT NULL, matchday INTEGER NOT NULL, "
+                    "stat TEXT NOT NULL, value INTEGER NOT NULL, "
+                    "PRIMARY KEY (playerId, matchday, stat))"
+                )
+                conn.executemany(
+                    # A repeated (player, matchday, stat) keeps its last value
+                    f'INSERT OR REPLACE INTO "{self.MATCH_STATS_TABLE}" VALUES (?, ?, ?, ?)',
+                    match_stats.rows(),
+                )
+
+            self.logger.info(f"Successfully exported {len(match_stats)} stat rows to SQLite")
+            return True
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Error exporting per-match stats to SQLite: {str(e)}")
+            return False
+
+
+class SQLiteSink(ExportSink):
+    """
+    Streams records into a table, replacing it in a single transaction
+
+    Columns follow the union of record fields in first-seen order; a field
+    appearing mid-stream is added with ALTER TABLE, so no second pass over
+    the records is needed.
+    """
+
+    name = "sqlite"
+    # Rows buffered per executemany call
+    CHUNK_SIZE = 500
+
+    def __init__(self, database: str = "players_data.db", table: str = "players"):
+        self.database = database
+        self.table = table
+        self.logger = logging.getLogger(__name__)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._columns: Dict[str, None] = {}
+        self._pending: List[Dict[str, Any]] = []
+
+    def open(self) -> bool:
+        try:
+            # Autocommit mode with an explicit transaction, so the DROP is
+            # rolled back too if the export fails
+            self._conn = sqlite3.connect(self.database, isolation_level=None)
+            self._conn.execute("BEGIN")
+            self._conn.execute(f'DROP TABLE IF EXISTS "{self.table}"')
+        except sqlite3.Error as e:
+            self.logger.error(f"Error exporting players data to SQLite: {str(e)}")
+            self.abort()
+            return False
+        return True
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        names = list(self._columns)
+        quoted = ", ".join(f'"{name}"' for name in names)
+        placeholders = ", ".join("?" for _ in names)
+        self._conn.executemany(
+            f'INSERT INTO "{self.table}" ({quoted}) VALUES ({placeholders})',
+            (tuple(record.get(name) for name in names) for record in self._pending),
+        )
+        self._pending = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        new_columns = [name for name in record if name not in self._columns]
+        if new_columns:
+            self._flush()
+            if self._columns:
+                for name in new_columns:
+                    self._conn.execute(f'ALTER TABLE "{self.table}" ADD COLUMN "{name}"')
+            else:
+                quoted = ", ".join(f'"{name}"' for name in new_columns)
+                self._conn.execute(f'CREATE TABLE "{self.table}" ({quoted})')
+            self._columns.update(dict.fromkeys(new_columns))
+
+        self._pending.append(record)
+        if len(self._pending) >= self.CHUNK_SIZE:
+            self._flush()
+
+    def close(self) -> bool:
+        try:
+            self._flush()
+            self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error exporting players data to SQLite: {str(e)}")
+            self.abort()
+            return False
+        self._conn.close()
+        self._conn = None
+        return True
+
+    def abort(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+            self._conn = None
+        self._pending = []
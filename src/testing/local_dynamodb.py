@@ -0,0 +1,144 @@
+"""
+In-memory stand-in for the subset of the boto3 DynamoDB resource the exporters use
+"""
+
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+
+
+class LocalTable:
+    """In-memory table supporting load, batch_writer, put_item, get_item and scan"""
+
+    def __init__(self, resource: "LocalDynamoDBResource", name: str):
+        self.resource = resource
+        self.name = name
+
+    def _items(self) -> Dict[tuple, Dict[str, Any]]:
+        items = self.resource.tables.get(self.name)
+        if items is None:
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": self.name}},
+                "DescribeTable",
+            )
+        return items
+
+    def _key(self, item: Dict[str, Any]) -> tuple:
+        return tuple(item[attribute] for attribute in self.resource.key_schemas[self.name])
+
+    def load(self) -> None:
+        self._items()
+
+    def wait_until_exists(self) -> None:
+        self._items()
+
+    def put_item(self, Item: Dict[str, Any]) -> Dict[str, Any]:
+        with self.resource.lock:
+            self._items()[self._key(Item)] = dict(Item)
+            self.resource.write_count += 1
+        return {}
+
+    def get_item(self, Key: Dict[str, Any]) -> Dict[str, Any]:
+        with self.resource.lock:
+            self.resource.read_count += 1
+            item = self._items().get(self._key(Key))
+        return {"Item": dict(item)} if item is not None else {}
+
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        with self.resource.lock:
+            return {"Items": [dict(item) for item in self._items().values()]}
+
+    def batch_writer(self) -> "LocalBatchWriter":
+        return LocalBatchWriter(self)
+
+
+class LocalBatchWriter:
+    """Context manager mirroring boto3's Table.batch_writer()"""
+
+    def __init__(self, table: LocalTable):
+        self.table = table
+
+    def __enter__(self) -> "LocalBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self.table.put_item(Item=Item)
+
+
+class LocalDynamoDBClient:
+    """
+    Stand-in for the low-level client behind ``resource.meta.client``
+
+    Only batch_write_item is supported. Setting ``unprocessed_every`` to N
+    hands back every Nth put request as UnprocessedItems, like a throttled
+    table would.
+    """
+
+    def __init__(self, resource: "LocalDynamoDBResource"):
+        self.resource = resource
+        self.unprocessed_every = 0
+        self.batch_calls = 0
+        self._seen = 0
+        self._deserializer = TypeDeserializer()
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        if sum(len(requests) for requests in RequestItems.values()) > 25:
+            raise ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "Too many items"}},
+                "BatchWriteItem",
+            )
+
+        unprocessed: Dict[str, List[Dict[str, Any]]] = {}
+        with self.resource.lock:
+            self.batch_calls += 1
+        for table_name, requests in RequestItems.items():
+            table = self.resource.Table(table_name)
+            for request in requests:
+                with self.resource.lock:
+                    self._seen += 1
+                    throttled = self.unprocessed_every and self._seen % self.unprocessed_every == 0
+                if throttled:
+                    unprocessed.setdefault(table_name, []).append(request)
+                    continue
+                item = request["PutRequest"]["Item"]
+                table.put_item(
+                    Item={key: self._deserializer.deserialize(value) for key, value in item.items()}
+                )
+        return {"UnprocessedItems": unprocessed}
+
+
+class LocalDynamoDBResource:
+    """
+    Drop-in for ``boto3.resource("dynamodb")`` in benchmarks and tests
+
+    Inject it with ``exporter._dynamodb = LocalDynamoDBResource()``.
+    """
+
+    def __init__(self):
+        self.tables: Dict[str, Dict[tuple, Dict[str, Any]]] = {}
+        self.key_schemas: Dict[str, List[str]] = {}
+        self.lock = threading.Lock()
+        self.read_count = 0
+        self.write_count = 0
+        self.meta = SimpleNamespace(client=LocalDynamoDBClient(self))
+
+    def Table(self, name: str) -> LocalTable:
+        return LocalTable(self, name)
+
+    def create_table(
+        self,
+        TableName: str,
+        KeySchema: List[Dict[str, str]],
+        AttributeDefinitions: Optional[List[Dict[str, str]]] = None,
+        **kwargs,
+    ) -> LocalTable:
+        with self.lock:
+            self.tables.setdefault(TableName, {})
+            self.key_schemas[TableName] = [key["AttributeName"] for key in KeySchema]
+        return self.Table(TableName)
@@ -0,0 +1,418 @@
+"""
+Local HTTP server replaying recorded UEFA fantasy API payloads
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.api.client import UEFAApiClient
+
+
+@lru_cache(maxsize=256)
+def _gzip(body: bytes) -> bytes:
+    # Recorded payloads are served many times; compress each one once
+    return gzip.compress(body, compresslevel=6)
+
+
+class ReplayServer:
+    """
+    Serves fixtures, players, popupstats and opponent-team payloads over plain HTTP
+
+    Point a UEFAApiClient at it with
+    ``UEFAApiClient(base_host="127.0.0.1", port=server.port, use_https=False)``.
+
+    Each response can be delayed by a fixed latency plus uniform random jitter,
+    a fraction of requests can straggle with an extra tail latency, and a
+    configurable fraction of requests fails with HTTP 503. Like the
+    live API, payloads are gzip-compressed for clients that accept it.
+    """
+
+    # Any game/season/language is answered with the same recording
+    FIXTURES_PATTERN = re.compile(r"/feeds/fixtures/fixtures_\d+_\w+\.json$")
+    PLAYERS_PATTERN = re.compile(r"/feeds/players/players_\d+_\w+\.json$")
+    POPUPSTATS_PATTERN = re.compile(r"/popupstats/popupstats_\d+_(\d+)\.json$")
+    OPPONENT_TEAM_PATTERN = re.compile(r"/Gameplay/user/([^/]+)/opponent-team$")
+
+    # File names used by from_directory()/save()
+    FIXTURES_FILE = "fixtures.json"
+    PLAYERS_FILE = "players.json"
+    POPUPSTATS_FILE = "popupstats.json"
+    POPUPSTATS_DIR = "popupstats"
+    TEAM_FILE = "opponent-team.json"
+    TEAMS_DIR = "opponent-team"
+
+    def __init__(
+        self,
+        fixtures: Optional[Dict[str, Any]] = None,
+        players: Optional[Dict[str, Any]] = None,
+        popupstats: Optional[Dict[str, Dict[str, Any]]] = None,
+        default_popupstats: Optional[Dict[str, Any]] = None,
+        teams: Optional[Dict[str, Dict[str, Any]]] = None,
+        default_team: Optional[Dict[str, Any]] = None,
+        popupstats_factory: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+        team_factory: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        tail_rate: float = 0.0,
+        tail_latency: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        compression: bool = True,
+    ):
+        """
+        Args:
+            fixtures: Fixtures feed payload
+            players: Players feed payload
+            popupstats: Popupstats payloads keyed by player ID
+            default_popupstats: Payload served for players missing from popupstats
+            teams: Opponent-team payloads keyed by user GUID
+            default_team: Payload served for GUIDs missing from teams
+            popupstats_factory: Builds popupstats on demand for IDs missing from popupstats
+            team_factory: Builds opponent-team payloads on demand for GUIDs missing from teams
+            latency: Fixed delay added to every response, in seconds
+            jitter: Maximum extra random delay, in seconds
+            error_rate: Fraction of requests answered with HTTP 503
+            tail_rate: Fraction of requests delayed by tail_latency on top
+            tail_latency: Extra delay of straggling requests, in seconds
+            seed: Seed for the latency/error random generator
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            compression: Gzip responses when the request accepts gzip
+        """
+        self.logger = logging.getLogger(__name__)
+        self._encoded: Dict[str, bytes] = {}
+        self._popupstats: Dict[str, bytes] = {}
+        self._teams: Dict[str, bytes] = {}
+        self._default_popupstats: Optional[bytes] = None
+        self._default_team: Optional[bytes] = None
+
+        if fixtures is not None:
+            self._encoded["fixtures"] = self._encode(fixtures)
+        if players is not None:
+            self._encoded["players"] = self._encode(players)
+        for player_id, payload in (popupstats or {}).items():
+            self._popupstats[str(player_id)] = self._encode(payload)
+        for guid, payload in (teams or {}).items():
+            self._teams[guid] = self._encode(payload)
+        if default_popupstats is not None:
+            self._default_popupstats = self._encode(default_popupstats)
+        if default_team is not None:
+            self._default_team = self._encode(default_team)
+        self.popupstats_factory = popupstats_factory
+        self.team_factory = team_factory
+
+        self.compression = compression
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        self.request_count = 0
+        self.error_count = 0
+        self._count_lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _encode(payload: Any) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    @property
+    def host(self) -> str:
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def api_client(self) -> UEFAApiClient:
+        """Build an API client pointed at this server"""
+        return UEFAApiClient(base_host=self.host, port=self.port, use_https=False)
+
+    def resolve(self, path: str) -> Optional[bytes]:
+        """
+        Find the payload for a request path
+
+        Args:
+            path: Request path (query string is ignored)
+
+        Returns:
+            Encoded payload or None if nothing is recorded for the path
+        """
+        path = path.split("?", 1)[0]
+
+        if self.FIXTURES_PATTERN.search(path):
+            return self._encoded.get("fixtures")
+        if self.PLAYERS_PATTERN.search(path):
+            return self._encoded.get("players")
+
+        match = self.POPUPSTATS_PATTERN.search(path)
+        if match:
+            return self._lookup(
+                self._popupstats, match.group(1), self.popupstats_factory, self._default_popupstats
+            )
+
+        match = self.OPPONENT_TEAM_PATTERN.search(path)
+        if match:
+            return self._lookup(
+                self._teams, match.group(1), self.team_factory, self._default_team
+            )
+
+        return None
+
+    def _lookup(
+        self,
+        recorded: Dict[str, bytes],
+        key: str,
+        factory: Optional[Callable[[str], Optional[Dict[str, Any]]]],
+        default: Optional[bytes],
+    ) -> Optional[bytes]:
+        if key in recorded:
+            return recorded[key]
+        if factory is not None:
+            payload = factory(key)
+            if payload is not None:
+                # Built per request and not kept, so huge synthetic rosters stay lazy
+                return self._encode(payload)
+        return default
+
+    def _delay_and_fail(self) -> Tuple[float, bool]:
+        with self._random_lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if self.tail_rate > 0 and self._random.random() < self.tail_rate:
+                delay += self.tail_latency
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        return delay, fail
+
+    def _make_handler(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; avoid Nagle stalls
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                delay, fail = server._delay_and_fail()
+                with server._count_lock:
+                    server.request_count += 1
+                    if fail:
+                        server.error_count += 1
+
+                if delay:
+                    time.sleep(delay)
+
+                body = None if fail else server.resolve(self.path)
+                if fail:
+                    self._send(503, b'{"error":"injected failure"}')
+                elif body is None:
+                    self._send(404, b'{"error":"not recorded"}')
+                else:
+                    self._send(200, body)
+
+            def _accepts_gzip(self) -> bool:
+                accepted = self.headers.get("Accept-Encoding", "")
+                return any(
+                    coding.split(";", 1)[0].strip() == "gzip" for coding in accepted.split(",")
+                )
+
+            def _send(self, status: int, body: bytes):
+                compressed = status == 200 and server.compression and self._accepts_gzip()
+                if compressed:
+                    body = _gzip(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if compressed:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                server.logger.debug("%s - %s", self.address_string(), format % args)
+
+        return ReplayHandler
+
+    def start(self) -> "ReplayServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Replay server listening on http://{self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @classmethod
+    def from_directory(cls, directory: str, **kwargs) -> "ReplayServer":
+        """
+        Build a server from payloads recorded with record_feeds()
+
+        Args:
+            directory: Recording directory
+            **kwargs: Latency, jitter, error rate and bind options
+
+        Returns:
+            A new (not yet started) ReplayServer
+        """
+
+        def load(*parts):
+            path = os.path.join(directory, *parts)
+            if not os.path.exists(path):
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        def load_dir(name):
+            path = os.path.join(directory, name)
+            if not os.path.isdir(path):
+                return {}
+            return {
+                filename[: -len(".json")]: load(name, filename)
+                for filename in os.listdir(path)
+                if filename.endswith(".json")
+            }
+
+        return cls(
+            fixtures=load(cls.FIXTURES_FILE),
+            players=load(cls.PLAYERS_FILE),
+            popupstats=load_dir(cls.POPUPSTATS_DIR),
+            default_popupstats=load(cls.POPUPSTATS_FILE),
+            teams=load_dir(cls.TEAMS_DIR),
+            default_team=load(cls.TEAM_FILE),
+            **kwargs,
+        )
+
+
+def record_feeds(
+    api_client: UEFAApiClient,
+    directory: str,
+    max_players: Optional[int] = None,
+    user_guids: Tuple[str, ...] = (),
+    matchday_id: int = 3,
+) -> int:
+    """
+    Record live API payloads into a directory readable by ReplayServer.from_directory()
+
+    Args:
+        api_client: Client used to fetch the payloads
+        directory: Output directory
+        max_players: Only record popupstats for the first N players
+        user_guids: Also record these users' opponent-team payloads
+        matchday_id: Matchday used for opponent-team requests
+
+    Returns:
+        Number of payloads recorded
+    """
+
+    def save(payload, *parts):
+        path = os.path.join(directory, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+
+    recorded = 0
+    fixtures = api_client.fetch_fixtures_data()
+    if fixtures:
+        save(fixtures, ReplayServer.FIXTURES_FILE)
+        recorded += 1
+
+    players = api_client.fetch_players_data()
+    if players:
+        save(players, ReplayServer.PLAYERS_FILE)
+        recorded += 1
+        player_list = players.get("data", {}).get("value", {}).get("playerList", [])
+        for player in player_list[:max_players]:
+            payload = api_client.fetch_player_fantasy_data(player.get("id"))
+            if payload:
+                save(payload, ReplayServer.POPUPSTATS_DIR, f"{player.get('id')}.json")
+                recorded += 1
+
+    for guid in user_guids:
+        payload = api_client.fetch_team_data(guid, matchday_id)
+        if payload:
+            save(payload, ReplayServer.TEAMS_DIR, f"{guid}.json")
+            recorded += 1
+
+    return recorded
+
+
+def main():
+    """Record payloads from the live API, or serve a recording"""
+    parser = argparse.ArgumentParser(description="UEFA fantasy API replay server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record live API payloads")
+    record_parser.add_argument("directory", help="Output directory")
+    record_parser.add_argument("--max-players", type=int, help="Limit popupstats recorded")
+    record_parser.add_argument("--guid", action="append", default=[], help="User GUID to record")
+
+    serve_parser = subparsers.add_parser("serve", help="Serve a recording")
+    serve_parser.add_argument("directory", help="Recording directory")
+    serve_parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    serve_parser.add_argument("--latency", type=float, default=0.0, help="Fixed latency in seconds")
+    serve_parser.add_argument("--jitter", type=float, default=0.0, help="Max random extra latency in seconds")
+    serve_parser.add_argument("--tail-rate", type=float, default=0.0, help="Fraction of requests that straggle")
+    serve_parser.add_argument("--tail-latency", type=float, default=0.0, help="Extra latency of stragglers in seconds")
+    serve_parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 503")
+    serve_parser.add_argument("--no-compression", action="store_true", help="Never gzip responses")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    if args.command == "record":
+        count = record_feeds(
+            UEFAApiClient(), args.directory, args.max_players, tuple(args.guid)
+        )
+        print(f"Recorded {count} payloads to '{args.directory}'")
+        return
+
+    server = ReplayServer.from_directory(
+        args.directory,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+        port=args.port,
+        compression=not args.no_compression,
+    )
+    with server:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
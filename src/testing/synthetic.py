@@ -0,0 +1,442 @@
+"""
+Schema-faithful synthetic UEFA fantasy feeds for scale testing
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.testing.replay_server import ReplayServer
+
+
+class SyntheticFeedGenerator:
+    """
+    Generates fixtures, players, popupstats and opponent-team payloads
+
+    Payloads follow the shapes the processors parse (``playerList``,
+    ``upcomingMatchesList``, ``points[].tPoints``, fixtures ``match[]``).
+    Everything is derived from the seed, and per-player payloads are built on
+    demand, so a 1000x roster never has to sit in memory as popupstats.
+    """
+
+    # One real competition: 36 clubs with ~25 registered players each
+    BASE_TEAMS = 36
+    PLAYERS_PER_TEAM = 25
+    SQUAD_SIZE = 15
+    # Squad composition by skill: 2 GK, 5 DEF, 5 MID, 3 FWD
+    SQUAD_SKILLS = (1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 4, 4, 4)
+    # Registered players per team by skill
+    TEAM_SKILLS = (1,) * 3 + (2,) * 8 + (3,) * 8 + (4,) * 6
+
+    STAT_FIELDS = ("oF", "gS", "gA", "cS", "sS", "pS", "pM", "pE", "pC",
+                   "gC", "yC", "rC", "oG", "bR", "gOB", "saves", "isWin", "mOM")
+
+    PLAYER_ID_BASE = 250000000
+    TEAM_ID_BASE = 90000
+
+    def __init__(
+        self,
+        teams: int = BASE_TEAMS,
+        players_per_team: int = PLAYERS_PER_TEAM,
+        matchdays: int = 8,
+        played_matchdays: int = 3,
+        start_date: datetime = datetime(2025, 9, 16, 18, 45),
+        seed: int = 0,
+    ):
+        """
+        Args:
+            teams: Number of clubs
+            players_per_team: Registered players per club
+            matchdays: Matchdays in the schedule
+            played_matchdays: Matchdays already finished (have points)
+            start_date: Kickoff of the first matchday
+            seed: Seed for all generated values
+        """
+        self.teams = teams
+        self.players_per_team = players_per_team
+        self.matchdays = matchdays
+        self.played_matchdays = played_matchdays
+        self.start_date = start_date
+        self.seed = seed
+        self._fixtures: Optional[List[Dict[str, Any]]] = None
+        self._fixtures_by_team: Dict[int, List[Dict[str, Any]]] = {}
+
+    @classmethod
+    def at_scale(cls, scale: float, **kwargs) -> "SyntheticFeedGenerator":
+        """
+        Generator for ``scale`` times one competition's roster
+
+        Args:
+            scale: Multiple of a real competition (e.g. 10, 100, 1000)
+            **kwargs: Other constructor arguments
+
+        Returns:
+            A new generator with scale * 36 clubs
+        """
+        return cls(teams=max(2, int(round(cls.BASE_TEAMS * scale))), **kwargs)
+
+    @property
+    def player_count(self) -> int:
+        return self.teams * self.players_per_team
+
+    # ------------------------------------------------------------------
+    # Identifiers
+    # ------------------------------------------------------------------
+
+    def team_id(self, team_index: int) -> int:
+        return self.TEAM_ID_BASE + team_index
+
+    def team_code(self, team_index: int) -> str:
+        return f"T{team_index:04d}"
+
+    def team_name(self, team_index: int) -> str:
+        return f"Club {team_index:04d}"
+
+    def player_id(self, player_index: int) -> int:
+        return self.PLAYER_ID_BASE + player_index
+
+    def player_index(self, player_id: Any) -> int:
+        return int(player_id) - self.PLAYER_ID_BASE
+
+    def _rng(self, *parts: Any) -> random.Random:
+        # String seeds are hashed deterministically, unlike hash() of a tuple
+        return random.Random(repr((self.seed,) + parts))
+
+    @staticmethod
+    def _fixture_time(kickoff: datetime) -> str:
+        # Same style as the fixtures/popupstats dateTime field, e.g. 9/17/25 9:00:00 PM
+        hour = kickoff.hour % 12 or 12
+        return f"{kickoff.month}/{kickoff.day}/{kickoff:%y} {hour}:{kickoff:%M:%S %p}"
+
+    # ------------------------------------------------------------------
+    # Fixtures
+    # ------------------------------------------------------------------
+
+    def _schedule(self) -> List[Dict[str, Any]]:
+        """Pair every club once per matchday (circle method), cached"""
+        if self._fixtures is not None:
+            return self._fixtures
+
+        clubs = list(range(self.teams))
+        if len(clubs) % 2:
+            clubs.append(None)
+
+        schedule = []
+        match_id = 2040000
+        for md in range(1, self.matchdays + 1):
+            day = self.start_date + timedelta(days=7 * (md - 1))
+            half = len(clubs) // 2
+            for slot in range(half):
+                home, away = clubs[slot], clubs[-slot - 1]
+                if home is None or away is None:
+                    continue
+                if md % 2 == 0:
+                    home, away = away, home
+                # Alternate the two kickoff slots of a matchday evening
+                kickoff = day + timedelta(hours=2, minutes=15) * (slot % 2)
+                kickoff += timedelta(days=slot * 2 // max(half, 1))
+                match_id += 1
+                status = "2" if md <= self.played_matchdays else "0"
+                schedule.append(
+                    {
+                        "mId": match_id,
+                        "mdId": md,
+                        "gdNo": str(md),
+                        "mdName": f"Matchday {md}",
+                        "dateTime": self._fixture_time(kickoff),
+                        "matchStatus": status,
+                        "htId": self.team_id(home),
+                        "htName": self.team_name(home),
+                        "htShortName": self.team_code(home),
+                        "htCCode": self.team_code(home),
+                        "htScore": str(self._rng("score", match_id, 0).randint(0, 4)) if status == "2" else "",
+                        "atId": self.team_id(away),
+                        "atName": self.team_name(away),
+                        "atShortName": self.team_code(away),
+                        "atCCode": self.team_code(away),
+                        "atScore": str(self._rng("score", match_id, 1).randint(0, 4)) if status == "2" else "",
+                        "_kickoff": kickoff,
+                    }
+                )
+            # Rotate all clubs but the first
+            clubs = [clubs[0], clubs[-1]] + clubs[1:-1]
+
+        self._fixtures = schedule
+        for fixture in schedule:
+            for key in ("htId", "atId"):
+                team_index = fixture[key] - self.TEAM_ID_BASE
+                self._fixtures_by_team.setdefault(team_index, []).append(fixture)
+        return schedule
+
+    def _team_fixtures(self, team_index: int) -> List[Dict[str, Any]]:
+        self._schedule()
+        return self._fixtures_by_team.get(team_index, [])
+
+    @staticmethod
+    def _public(fixture: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in fixture.items() if not k.startswith("_")}
+
+    def fixtures_feed(self) -> Dict[str, Any]:
+        """Fixtures feed payload: data.value[] of matchdays with match[]"""
+        by_matchday: Dict[int, List[Dict[str, Any]]] = {}
+        for fixture in self._schedule():
+            by_matchday.setdefault(fixture["mdId"], []).append(self._public(fixture))
+        return {
+            "data": {
+                "value": [
+                    {"mdId": md, "gdId": md, "match": matches}
+                    for md, matches in sorted(by_matchday.items())
+                ]
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Players
+    # ------------------------------------------------------------------
+
+    def _match_lines(self, player_index: int) -> List[Dict[str, Any]]:
+        """Per-fixture raw stats and the points breakdown they earn"""
+        team_index = player_index // self.players_per_team
+        rng = self._rng("stats", player_index)
+        lines = []
+
+        for fixture in self._team_fixtures(team_index):
+            md = fixture["mdId"]
+            stats = {field: 0 for field in self.STAT_FIELDS}
+            if md <= self.played_matchdays:
+                stats.update(
+                    oF=rng.choice((0, 20, 45, 90, 90, 90)),
+                    gS=rng.choice((0, 0, 0, 0, 1, 2)),
+                    gA=rng.choice((0, 0, 0, 1)),
+                    bR=rng.randint(0, 10),
+                    yC=rng.choice((0, 0, 0, 0, 1)),
+                )
+                if not stats["oF"]:
+                    stats.update(gS=0, gA=0, bR=0, yC=0)
+
+            points = {
+                "oF": 2 if stats["oF"] >= 60 else int(stats["oF"] > 0),
+                "gS": stats["gS"] * 5,
+                "gA": stats["gA"] * 3,
+                "bR": stats["bR"] // 3,
+                "yC": -stats["yC"],
+            }
+            points["tPoints"] = sum(points.values())
+            lines.append({"fixture": fixture, "stats": stats, "points": points})
+
+        return lines
+
+    def player(self, player_index: int) -> Dict[str, Any]:
+        """A single playerList entry"""
+        team_index = player_index // self.players_per_team
+        skill = self.TEAM_SKILLS[player_index % self.players_per_team % len(self.TEAM_SKILLS)]
+        rng = self._rng("player", player_index)
+        lines = self._match_lines(player_index)
+        total = sum(line["points"]["tPoints"] for line in lines)
+        season = {
+            field: sum(line["stats"][field] for line in lines)
+            for field in ("oF", "gS", "gA", "bR", "yC")
+        }
+
+        upcoming = []
+        for fixture in self._team_fixtures(team_index):
+            if fixture["mdId"] <= self.played_matchdays:
+                continue
+            is_home = fixture["htId"] == self.team_id(team_index)
+            upcoming.append(
+                {
+                    "mdId": fixture["mdId"],
+                    "tLoc": "H" if is_home else "A",
+                    "vsCCode": fixture["atCCode"] if is_home else fixture["htCCode"],
+                    "vsTId": fixture["atId"] if is_home else fixture["htId"],
+                    "matchDate": f"{fixture['_kickoff']:%m/%d/%Y %H:%M:%S}",
+                }
+            )
+            if len(upcoming) == 3:
+                break
+
+        return {
+            "id": self.player_id(player_index),
+            "pDName": f"P. Synthetic{player_index}",
+            "skill": skill,
+            "tId": self.team_id(team_index),
+            "cCode": self.team_code(team_index),
+            "tName": self.team_name(team_index),
+            "rating": round(rng.uniform(0, 5) * 2) / 2,
+            "value": round(rng.uniform(4.0, 11.0) * 2) / 2,
+            "totPts": total,
+            "avgPlayerPts": round(total / max(self.played_matchdays, 1), 1),
+            "gS": season["gS"],
+            "assist": season["gA"],
+            "minsPlyd": season["oF"],
+            "isActive": 1,
+            "mOM": 0,
+            "gC": rng.randint(0, 6) if skill <= 2 else 0,
+            "yC": season["yC"],
+            "rC": 0,
+            "pE": 0,
+            "bR": season["bR"],
+            "selPer": round(rng.uniform(0, 60), 2),
+            "upcomingMatchesList": upcoming,
+        }
+
+    def players_feed(self) -> Dict[str, Any]:
+        """Players feed payload: data.value.playerList[]"""
+        return {
+            "data": {
+                "value": {
+                    "playerList": [self.player(i) for i in range(self.player_count)]
+                }
+            }
+        }
+
+    def popupstats(self, player_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Popupstats payload for one player
+
+        Args:
+            player_id: The player's ID
+
+        Returns:
+            Payload with fixtures[], stats[] and points[], or None for unknown IDs
+        """
+        player_index = self.player_index(player_id)
+        if not 0 <= player_index < self.player_count:
+            return None
+
+        team_index = player_index // self.players_per_team
+        fixtures, stats, points = [], [], []
+
+        for line in self._match_lines(player_index):
+            fixture = line["fixture"]
+            match_keys = {"mId": fixture["mId"], "mdId": fixture["mdId"]}
+            fixtures.append(self._public(fixture))
+            stats.append(dict(line["stats"], **match_keys))
+            points.append(dict(line["points"], **match_keys))
+
+        return {
+            "data": {
+                "value": {
+                    "id": self.player_id(player_index),
+                    "teamId": str(self.team_id(team_index)),
+                    "fixtures": fixtures,
+                    "stats": stats,
+                    "points": points,
+                }
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Fantasy teams
+    # ------------------------------------------------------------------
+
+    def team(self, user_guid: str) -> Dict[str, Any]:
+        """
+        Opponent-team payload for a (synthetic) manager
+
+        Args:
+            user_guid: Manager GUID; the squad is derived from it
+
+        Returns:
+            Payload with playerid[] and league points/rank fields
+        """
+        rng = self._rng("team", user_guid)
+        slots_by_skill: Dict[int, List[int]] = {}
+        for slot in range(self.players_per_team):
+            skill = self.TEAM_SKILLS[slot % len(self.TEAM_SKILLS)]
+            slots_by_skill.setdefault(skill, []).append(slot)
+
+        # Pick random clubs and squad slots instead of scanning the whole roster
+        squad: List[int] = []
+        for skill in self.SQUAD_SKILLS:
+            while True:
+                team_index = rng.randrange(self.teams)
+                slot = rng.choice(slots_by_skill[skill])
+                player_index = team_index * self.players_per_team + slot
+                if player_index not in squad:
+                    squad.append(player_index)
+                    break
+
+        captain = rng.choice(squad[2:])
+        # Bench: one GK, then three outfield players
+        bench = [squad[1]] + rng.sample(squad[2:], 3)
+        players = []
+        for i in squad:
+            player = self.player(i)
+            players.append(
+                {
+                    "id": player["id"],
+                    "skill": player["skill"],
+                    "teamid": player["tId"],
+                    "value": player["value"],
+                    "overallpoints": float(player["totPts"]),
+                    "iscaptain": int(i == captain),
+                    "benchposition": bench.index(i) + 1 if i in bench else 0,
+                    "isactive": 1,
+                    "isplayed": 1,
+                }
+            )
+
+        gd_points = float(sum(p["overallpoints"] for p in players) / max(self.played_matchdays, 1))
+        return {
+            "data": {
+                "value": {
+                    "mdid": self.played_matchdays,
+                    "teamName": f"Team {user_guid[:8]}",
+                    "username": f"manager-{user_guid[:8]}",
+                    "gdPoints": round(gd_points, 1),
+                    "ovPoints": float(sum(p["overallpoints"] for p in players)),
+                    "ovRank": rng.randint(1, 1000000),
+                    "captplayerid": self.player_id(captain),
+                    "playerid": players,
+                }
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def api_client(self) -> "SyntheticApiClient":
+        """In-process client that feeds processors directly, no HTTP involved"""
+        return SyntheticApiClient(self)
+
+    def replay_server(self, **kwargs) -> ReplayServer:
+        """
+        Replay server serving this generator's payloads
+
+        Args:
+            **kwargs: Latency, jitter, error rate and bind options
+
+        Returns:
+            A new (not yet started) ReplayServer
+        """
+        return ReplayServer(
+            fixtures=self.fixtures_feed(),
+            players=self.players_feed(),
+            popupstats_factory=self.popupstats,
+            team_factory=self.team,
+            **kwargs,
+        )
+
+
+class SyntheticApiClient:
+    """Duck-typed UEFAApiClient serving a SyntheticFeedGenerator's payloads"""
+
+    def __init__(self, generator: SyntheticFeedGenerator):
+        self.generator = generator
+
+    def fetch_fixtures_data(self) -> Dict[str, Any]:
+        return self.generator.fixtures_feed()
+
+    def fetch_players_data(self) -> Dict[str, Any]:
+        return self.generator.players_feed()
+
+    def fetch_player_fantasy_data(self, player_id: str) -> Optional[Dict[str, Any]]:
+        return self.generator.popupstats(player_id)
+
+    def fetch_team_data(self, user_guid: str, matchday_id, phase_id: int = 0) -> Dict[str, Any]:
+        return self.generator.team(user_guid)
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,175 @@
+"""
+Shared fixtures for the end-to-end pipeline benchmarks
+
+Environment knobs:
+    FAPI_BENCH_SOURCE      'recorded' (scaled json/ samples) or 'synthetic' (default: recorded)
+    FAPI_BENCH_ROSTER      roster size served by the replay server (default: 50)
+    FAPI_BENCH_ROUNDS      timed rounds per benchmark (default: 3)
+    FAPI_BENCH_LATENCY     replay server latency per request in seconds (default: 0)
+    FAPI_BENCH_JITTER      replay server max jitter in seconds (default: 0)
+    FAPI_BENCH_BASELINE    JSON file of {benchmark: median seconds} to gate against
+    FAPI_BENCH_TOLERANCE   allowed slowdown versus the baseline (default: 0.25)
+    FAPI_BENCH_SAVE        write this run's medians to this JSON file
+"""
+
+import copy
+import json
+import os
+import statistics
+import time
+
+import pytest
+
+from src.testing.replay_server import ReplayServer
+from src.testing.synthetic import SyntheticFeedGenerator
+
+SOURCE = os.environ.get("FAPI_BENCH_SOURCE", "recorded")
+ROSTER_SIZE = int(os.environ.get("FAPI_BENCH_ROSTER", "50"))
+if SOURCE == "synthetic":
+    GENERATOR = SyntheticFeedGenerator(
+        teams=max(2, ROSTER_SIZE // SyntheticFeedGenerator.PLAYERS_PER_TEAM)
+    )
+    ROSTER_SIZE = GENERATOR.player_count
+ROUNDS = int(os.environ.get("FAPI_BENCH_ROUNDS", "3"))
+LATENCY = float(os.environ.get("FAPI_BENCH_LATENCY", "0"))
+JITTER = float(os.environ.get("FAPI_BENCH_JITTER", "0"))
+TOLERANCE = float(os.environ.get("FAPI_BENCH_TOLERANCE", "0.25"))
+
+# Absolute ceilings (fixed seconds + seconds per roster player) that hold on a
+# small runner with no injected latency; the baseline file is the tighter gate.
+BUDGETS = {
+    "fixtures": (1.0, 0.0),
+    "players_csv": (1.0, 0.01),
+    "players_ddb": (1.0, 0.01),
+    "team": (1.0, 0.0),
+    "league_lineups": (1.0, 0.0),
+}
+
+RESULTS = {}
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_recorded_payloads(roster_size):
+    """Scale the recorded sample payloads in json/ up to a roster of roster_size players"""
+    popupstats = load_json("json/players_data_per_match.json")
+    team = load_json("json/players_on_my_team.json")
+    recorded_fixtures = popupstats["data"]["value"]["fixtures"]
+
+    fixtures = {
+        "data": {
+            "value": [
+                {"mdId": fixture["mdId"], "match": [fixture]}
+                for fixture in recorded_fixtures
+            ]
+        }
+    }
+
+    team_codes = sorted(
+        {f["htCCode"] for f in recorded_fixtures} | {f["atCCode"] for f in recorded_fixtures}
+    )
+    upcoming = [
+        {"tLoc": "H", "vsCCode": "ATA", "matchDate": "01/28/2026 21:00:00"}
+    ]
+    players = {
+        "data": {
+            "value": {
+                "playerList": [
+                    {
+                        "id": 1000 + i,
+                        "pDName": f"Player {i}",
+                        "skill": i % 4 + 1,
+                        "cCode": team_codes[i % len(team_codes)],
+                        "value": 4.5 + i % 7,
+                        "totPts": i % 30,
+                        "upcomingMatchesList": upcoming,
+                    }
+                    for i in range(roster_size)
+                ]
+            }
+        }
+    }
+
+    team = copy.deepcopy(team)
+    for i, player in enumerate(team["data"]["value"]["playerid"]):
+        player["id"] = 1000 + i % roster_size
+
+    return {
+        "fixtures": fixtures,
+        "players": players,
+        "default_popupstats": popupstats,
+        "default_team": team,
+    }
+
+
+@pytest.fixture(scope="session")
+def replay_server():
+    if SOURCE == "synthetic":
+        server = GENERATOR.replay_server(latency=LATENCY, jitter=JITTER, seed=0)
+    else:
+        server = ReplayServer(
+            **build_recorded_payloads(ROSTER_SIZE), latency=LATENCY, jitter=JITTER, seed=0
+        )
+    with server:
+        yield server
+
+
+@pytest.fixture
+def pipeline_benchmark():
+    """Time a callable over several rounds and gate the median against the budgets"""
+
+    def run(name, func):
+        timings = []
+        result = None
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+
+        median = statistics.median(timings)
+        RESULTS[name] = {
+            "median": median,
+            "min": min(timings),
+            "max": max(timings),
+            "rounds": ROUNDS,
+            "roster": ROSTER_SIZE,
+        }
+
+        fixed, per_player = BUDGETS[name]
+        budget = fixed + per_player * ROSTER_SIZE + 2 * (LATENCY + JITTER) * (ROSTER_SIZE + 2)
+        assert median < budget, f"{name}: median {median:.3f}s over budget {budget:.3f}s"
+
+        baseline_path = os.environ.get("FAPI_BENCH_BASELINE")
+        if baseline_path and os.path.exists(baseline_path):
+            baseline = load_json(baseline_path).get(name)
+            if baseline:
+                limit = baseline * (1 + TOLERANCE)
+                assert median <= limit, (
+                    f"{name}: median {median:.3f}s regressed past baseline "
+                    f"{baseline:.3f}s (+{TOLERANCE:.0%})"
+                )
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    save_path = os.environ.get("FAPI_BENCH_SAVE")
+    if save_path and RESULTS:
+        with open(save_path, "w", encoding="utf-8") as f:
+            json.dump({name: stats["median"] for name, stats in RESULTS.items()}, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+    terminalreporter.section("pipeline benchmarks")
+    for name, stats in sorted(RESULTS.items()):
+        terminalreporter.write_line(
+            f"{name:<14} median {stats['median'] * 1000:8.1f} ms  "
+            f"min {stats['min'] * 1000:8.1f} ms  max {stats['max'] * 1000:8.1f} ms  "
+            f"(roster {stats['roster']}, {stats['rounds']} rounds)"
+        )
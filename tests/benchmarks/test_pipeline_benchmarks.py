@@ -0,0 +1,102 @@
+"""
+End-to-end benchmarks of the CLI commands against the local replay server
+"""
+
+import pytest
+
+from src.cli.app import CLIApp
+from src.core.team_analyzer import TeamAnalyzer
+from src.testing.local_dynamodb import LocalDynamoDBResource
+from src.testing.synthetic import SyntheticFeedGenerator
+
+from tests.benchmarks.conftest import ROSTER_SIZE
+
+
+@pytest.fixture
+def app(replay_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    app = CLIApp()
+    app.api_client = replay_server.api_client()
+    app.dynamodb_exporter._dynamodb = LocalDynamoDBResource()
+    yield app
+    app.api_client.close()
+
+
+def test_fixtures_benchmark(app, tmp_path, pipeline_benchmark):
+    output = str(tmp_path / "opponents.csv")
+
+    assert pipeline_benchmark(
+        "fixtures", lambda: app.process_fixtures_command(output)
+    )
+
+
+def test_players_csv_benchmark(app, tmp_path, pipeline_benchmark):
+    output = str(tmp_path / "players.csv")
+
+    assert pipeline_benchmark(
+        "players_csv", lambda: app.process_players_command("csv", output)
+    )
+    with open(output, encoding="utf-8") as f:
+        assert sum(1 for _ in f) == ROSTER_SIZE + 1
+
+
+def test_players_ddb_benchmark(app, pipeline_benchmark):
+    assert pipeline_benchmark(
+        "players_ddb", lambda: app.process_players_command("ddb", "bench-players")
+    )
+    assert len(app.dynamodb_exporter.dynamodb.tables["bench-players"]) == ROSTER_SIZE
+
+
+def test_team_benchmark(app, tmp_path, pipeline_benchmark):
+    assert app.process_players_command("ddb", "bench-players")
+    output = str(tmp_path / "team.csv")
+
+    assert pipeline_benchmark(
+        "team",
+        lambda: app.team_analyzer.analyze_team(
+            user_guid="bench-user", table_name="bench-players", csv_filename=output
+        ),
+    )
+
+
+def test_league_lineups_benchmark(pipeline_benchmark):
+    generator = SyntheticFeedGenerator()
+    analyzer = TeamAnalyzer(api_client=generator.api_client())
+    teams = [generator.team(f"{i:08d}-manager") for i in range(500)]
+
+    lineups = pipeline_benchmark(
+        "league_lineups", lambda: [analyzer.suggest_lineup(team) for team in teams]
+    )
+    assert len(lineups) == len(teams)
+
+
+def test_players_run_records_stage_metrics(app, tmp_path):
+    from src.core.metrics import METRICS
+
+    metrics_path = tmp_path / "metrics.json"
+    assert app.run(
+        ["--metrics-json", str(metrics_path), "players", "csv", "-o", str(tmp_path / "p.csv")]
+    ) == 0
+
+    assert metrics_path.exists()
+    assert METRICS.histogram("process_seconds", stage="players").count == 1
+    assert METRICS.histogram("export_seconds", sink="csv", data="players").count == 1
+    popupstats = METRICS.histogram("http_request_seconds", endpoint="popupstats")
+    assert popupstats.count == ROSTER_SIZE
+
+
+def test_trace_requests_writes_request_timeline(app, tmp_path):
+    import json
+
+    trace_path = tmp_path / "requests.jsonl"
+    assert app.run(
+        ["--trace-requests", str(trace_path), "players", "csv", "-o", str(tmp_path / "p.csv")]
+    ) == 0
+
+    entries = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    # Fixtures, players and one popupstats request per player
+    assert len(entries) == ROSTER_SIZE + 2
+    assert entries[0]["start"] == 0
+    for entry in entries:
+        assert 0 <= entry["connect_ms"] <= entry["ttfb_ms"] <= entry["done_ms"]
+        assert entry["status"] == 200
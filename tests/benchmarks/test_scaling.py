@@ -0,0 +1,64 @@
+"""
+Scaling checks: processors and exporters should stay close to linear in roster size
+
+Environment knobs:
+    FAPI_SCALES             comma-separated multiples of one competition (default: 0.25,1)
+    FAPI_SCALING_TOLERANCE  allowed growth of per-player cost from smallest to
+                            largest scale (default: 1.0, i.e. up to 2x)
+"""
+
+import os
+import time
+
+from src.core.match_stats import MatchStatsTable
+from src.core.processors import PlayersDataProcessor
+from src.core.team_mapper import TeamMapper
+from src.exporters.csv_exporter import CSVExporter
+from src.testing.synthetic import SyntheticFeedGenerator
+
+SCALES = [float(scale) for scale in os.environ.get("FAPI_SCALES", "0.25,1").split(",")]
+TOLERANCE = float(os.environ.get("FAPI_SCALING_TOLERANCE", "1.0"))
+
+
+def per_player_cost(stage, scales):
+    """Seconds per player of stage(generator) at each scale"""
+    costs = {}
+    for scale in scales:
+        generator = SyntheticFeedGenerator.at_scale(scale)
+        start = time.perf_counter()
+        stage(generator)
+        costs[scale] = (time.perf_counter() - start) / generator.player_count
+    return costs
+
+
+def assert_near_linear(costs):
+    smallest, largest = costs[min(costs)], costs[max(costs)]
+    assert largest <= smallest * (1 + TOLERANCE), (
+        f"per-player cost grew from {smallest * 1e6:.1f}us to {largest * 1e6:.1f}us"
+    )
+
+
+def test_players_processing_scales_linearly():
+    def stage(generator):
+        processor = PlayersDataProcessor(generator.api_client())
+        processor.process_players(generator.players_feed())
+
+    assert_near_linear(per_player_cost(stage, SCALES))
+
+
+def test_csv_export_scales_linearly(tmp_path):
+    def stage(generator):
+        players = PlayersDataProcessor().process_players(generator.players_feed())
+        CSVExporter(TeamMapper()).export_players_data(players, str(tmp_path / "players.csv"))
+
+    assert_near_linear(per_player_cost(stage, SCALES))
+
+
+def test_match_stats_extraction_scales_linearly():
+    def stage(generator):
+        table = MatchStatsTable()
+        for i in range(generator.player_count):
+            player_id = generator.player_id(i)
+            table.add_popupstats(player_id, generator.popupstats(player_id)["data"]["value"])
+
+    assert_near_linear(per_player_cost(stage, SCALES))
@@ -0,0 +1,51 @@
+"""
+Tests for negotiated compression in the API client
+"""
+
+import gzip
+import json
+
+from src.api.client import _Decoder
+from src.core.metrics import METRICS
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_decoder_decompresses_gzip_in_small_chunks():
+    payload = json.dumps({"players": list(range(2000))}).encode("utf-8")
+    compressed = gzip.compress(payload)
+    decoder = _Decoder("gzip")
+
+    decoded = b"".join(
+        decoder.decompress(compressed[i : i + 7]) for i in range(0, len(compressed), 7)
+    )
+
+    assert decoded + decoder.flush() == payload
+
+
+def test_players_feed_is_fetched_gzip_compressed():
+    generator = SyntheticFeedGenerator(teams=8, players_per_team=10)
+    METRICS.reset()
+
+    with generator.replay_server() as server:
+        client = server.api_client()
+        client.enable_trace()
+        assert client.fetch_players_data() == generator.players_feed()
+        client.close()
+
+    wire = METRICS.counter_value("http_wire_bytes", endpoint="players", encoding="gzip")
+    decoded = METRICS.counter_value("http_decoded_bytes", endpoint="players", encoding="gzip")
+    assert 0 < wire * 3 < decoded
+    assert client.trace[0]["encoding"] == "gzip"
+    assert client.trace[0]["decoded_bytes"] == decoded
+
+
+def test_uncompressed_responses_are_read_as_is():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=2)
+    METRICS.reset()
+
+    with generator.replay_server(compression=False) as server:
+        client = server.api_client()
+        assert client.fetch_fixtures_data() == generator.fixtures_feed()
+        client.close()
+
+    assert METRICS.counter_value("http_wire_bytes", endpoint="fixtures", encoding="identity") > 0
@@ -0,0 +1,72 @@
+"""
+Tests for hedged requests
+"""
+
+import itertools
+import time
+
+from src.api.hedging import HedgePolicy
+from src.core.metrics import METRICS
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_policy_waits_for_samples_and_caps_duplicates():
+    policy = HedgePolicy(percentile=95, max_rate=0.1, min_samples=20)
+    assert policy.delay("popupstats") is None
+
+    for ms in range(1, 21):
+        policy.record("popupstats", ms / 1000)
+    assert policy.delay("popupstats") == 0.019
+    assert policy.delay("fixtures") is None
+
+    # 3 requests seen so far: no duplicate fits in a 10% budget
+    assert not policy.acquire()
+    for _ in range(7):
+        policy.delay("popupstats")
+    assert policy.acquire()
+    assert not policy.acquire()
+    assert policy.hedge_rate == 0.1
+
+
+def test_straggler_is_hedged_and_the_duplicate_wins():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=10)
+    player_ids = [player["id"] for player in generator.players_feed()["data"]["value"]["playerList"]]
+    METRICS.reset()
+
+    with generator.replay_server() as server:
+        client = server.api_client()
+        client.enable_hedging(max_rate=0.5)
+        for player_id in player_ids:
+            assert client.fetch_player_fantasy_data(player_id) is not None
+
+        # Only the next request straggles; its duplicate is answered at once
+        delays = itertools.chain([(0.5, False)], itertools.repeat((0.0, False)))
+        server._delay_and_fail = lambda: next(delays)
+        start = time.perf_counter()
+        assert client.fetch_player_fantasy_data(player_ids[0]) is not None
+        assert time.perf_counter() - start < 0.4
+        client.close()
+
+        assert server.request_count == len(player_ids) + 2
+    assert METRICS.counter_value("http_hedges", endpoint="popupstats") == 1
+    assert METRICS.counter_value("http_hedge_wins", endpoint="popupstats") == 1
+
+
+def test_hedges_beyond_the_budget_are_not_sent():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=10)
+    player_ids = [player["id"] for player in generator.players_feed()["data"]["value"]["playerList"]]
+    METRICS.reset()
+
+    with generator.replay_server() as server:
+        client = server.api_client()
+        client.enable_hedging(max_rate=0.0)
+        for player_id in player_ids:
+            client.fetch_player_fantasy_data(player_id)
+
+        server.latency = 0.05
+        assert client.fetch_player_fantasy_data(player_ids[0]) is not None
+        client.close()
+
+        assert server.request_count == len(player_ids) + 1
+    assert METRICS.counter_value("http_hedges", endpoint="popupstats") == 0
+    assert METRICS.counter_value("http_hedges_capped", endpoint="popupstats") == 1
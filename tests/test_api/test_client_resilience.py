@@ -0,0 +1,67 @@
+"""
+Tests for request timeouts, the run deadline and stale-while-revalidate
+"""
+
+import time
+
+from src.api.response_cache import CachedPayload
+from src.core.metrics import METRICS
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_hung_request_times_out():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=2)
+    METRICS.reset()
+
+    with generator.replay_server(latency=1.0) as server:
+        client = server.api_client()
+        client.read_timeout = 0.1
+        start = time.perf_counter()
+        assert client.fetch_fixtures_data() is None
+        assert time.perf_counter() - start < 0.5
+        client.close()
+
+    assert METRICS.counter_value("http_timeouts", endpoint="fixtures") == 1
+
+
+def test_no_request_starts_after_the_deadline():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=2)
+    METRICS.reset()
+
+    with generator.replay_server() as server:
+        client = server.api_client()
+        client.set_deadline(0.001)
+        time.sleep(0.01)
+        assert client.fetch_fixtures_data() is None
+        client.close()
+
+        assert server.request_count == 0
+    assert METRICS.counter_value("http_deadline_exceeded", endpoint="fixtures") == 1
+
+
+def test_slow_or_failing_api_serves_cached_payload_and_revalidates(tmp_path):
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=2)
+    METRICS.reset()
+
+    with generator.replay_server() as server:
+        client = server.api_client()
+        client.enable_response_cache(str(tmp_path), stale_after=0.05)
+        fresh = client.fetch_fixtures_data()
+        assert not isinstance(fresh, CachedPayload)
+        fetched_at = client.response_cache.load(client.competition.fixtures_endpoint).fetched_at
+
+        server.latency = 0.5
+        start = time.perf_counter()
+        stale = client.fetch_fixtures_data()
+        assert time.perf_counter() - start < 0.3
+        assert stale.stale and stale == fresh
+
+        server.latency = 0.0
+        server.error_rate = 1.0
+        assert client.fetch_fixtures_data() == fresh
+        # Waits for the background revalidation of the slow request
+        client.close()
+
+    refreshed = client.response_cache.load(client.competition.fixtures_endpoint)
+    assert refreshed.fetched_at > fetched_at
+    assert METRICS.counter_value("http_stale_served", endpoint="fixtures") == 2
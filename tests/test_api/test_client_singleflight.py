@@ -0,0 +1,41 @@
+"""
+Tests for coalescing concurrent identical requests in the API client
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.metrics import METRICS
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_concurrent_players_requests_share_one_http_call():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=3)
+    METRICS.reset()
+
+    with generator.replay_server(latency=0.1) as server:
+        client = server.api_client()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: client.fetch_players_data(), range(4)))
+        client.close()
+
+        assert server.request_count == 1
+    assert all(result == generator.players_feed() for result in results)
+    assert METRICS.counter_value("singleflight_shared", flight="http_request", endpoint="players") == 3
+
+
+def test_async_requests_are_coalesced():
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=3)
+
+    with generator.replay_server(latency=0.1) as server:
+        client = server.api_client()
+        endpoint = client.competition.fixtures_endpoint
+
+        async def main():
+            return await asyncio.gather(*(client.request_async(endpoint) for _ in range(5)))
+
+        results = asyncio.run(main())
+        client.close()
+
+        assert server.request_count == 1
+    assert results == [generator.fixtures_feed()] * 5
@@ -0,0 +1,48 @@
+"""
+Tests for competition-parameterized feed endpoints
+"""
+
+import pytest
+
+from src.api.client import UEFAApiClient
+from src.api.competitions import COMPETITIONS, Competition
+
+
+def test_default_competition_keeps_ucl_endpoints():
+    client = UEFAApiClient()
+
+    assert client.competition is COMPETITIONS["ucl"]
+    assert client.competition.fixtures_endpoint == (
+        "/en/uclfantasy/services/feeds/fixtures/fixtures_80_en.json"
+    )
+    assert client.competition.players_endpoint == (
+        "/en/uclfantasy/services/feeds/players/players_80_en_2.json"
+    )
+    assert client.competition.popupstats_endpoint(7) == (
+        "/en/uclfantasy/services/feeds/popupstats/popupstats_80_7.json"
+    )
+
+
+def test_parse_custom_competition():
+    competition = Competition.parse("uelfantasy:81:de")
+
+    assert competition == Competition("uelfantasy", 81, "de", 2)
+    assert competition.key == "uelfantasy-81-de"
+    assert competition.players_endpoint == (
+        "/de/uelfantasy/services/feeds/players/players_81_de_2.json"
+    )
+    assert Competition.parse("ucl") is COMPETITIONS["ucl"]
+
+    with pytest.raises(ValueError):
+        Competition.parse("uelfantasy")
+    with pytest.raises(ValueError):
+        Competition.parse("uelfantasy:abc")
+
+
+def test_for_competition_shares_connection_pool():
+    client = UEFAApiClient()
+    other = client.for_competition(Competition.parse("uelfantasy:81"))
+
+    assert other.competition.game == "uelfantasy"
+    assert client.competition.game == "uclfantasy"
+    assert other._pool is client._pool
@@ -0,0 +1,83 @@
+"""
+Tests for the read-only query API and its hot reload
+"""
+
+import json
+import time
+import urllib.request
+from urllib.error import HTTPError
+
+from src.api.query_server import QueryServer
+from src.cli.app import CLIApp
+from src.core.query_index import IndexLoader
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def get(server, path):
+    try:
+        with urllib.request.urlopen(f"http://{server.host}:{server.port}{path}") as response:
+            return response.status, json.loads(response.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def run_players(tmp_path, monkeypatch, generator):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    with generator.replay_server() as replay:
+        app = CLIApp()
+        app.api_client = replay.api_client()
+        assert app.run(["players", "csv", "-o", str(tmp_path / "players.csv")]) == 0
+        assert app.run(["fixtures", "-o", str(tmp_path / "opponents.csv")]) == 0
+        app.api_client.close()
+
+
+def test_queries_over_http(tmp_path, monkeypatch):
+    generator = SyntheticFeedGenerator(teams=4, players_per_team=5)
+    run_players(tmp_path, monkeypatch, generator)
+    loader = IndexLoader(str(tmp_path / "players.csv"), str(tmp_path / "opponents.csv"))
+
+    with QueryServer(loader, port=0, reload_interval=0) as server:
+        status, health = get(server, "/health")
+        assert status == 200 and health["players"] == generator.player_count
+        assert health["opponents"] == 4
+
+        status, page = get(server, "/players?team=T0001&sort=total%20points&limit=2&fields=name,total%20points")
+        assert status == 200 and page["total"] == 5
+        points = [player["total points"] for player in page["players"]]
+        assert len(points) == 2 and points == sorted(points, reverse=True)
+
+        status, top = get(server, "/players/top?k=3")
+        best = max(server.index.players, key=lambda player: player["total points"])
+        assert top["players"][0]["total points"] == best["total points"]
+
+        status, player = get(server, f"/players/{best['playerId']}")
+        assert status == 200 and player["name"] == best["name"]
+
+        status, teams = get(server, "/teams")
+        assert [team["players"] for team in teams["teams"]] == [5, 5, 5, 5]
+
+        status, similar = get(server, f"/players/{best['playerId']}/similar?k=2")
+        assert status == 200 and len(similar["players"]) == 2
+        assert all(p["position"] == best["position"] for p in similar["players"])
+        assert get(server, "/players/0/similar")[0] == 404
+        assert get(server, f"/players/{best['playerId']}/similar?max_value=x")[0] == 400
+
+        assert get(server, "/players/0")[0] == 404
+        assert get(server, "/players?sort=nope")[0] == 400
+        assert get(server, "/players?limit=x")[0] == 400
+
+
+def test_new_run_is_picked_up_without_restart(tmp_path, monkeypatch):
+    run_players(tmp_path, monkeypatch, SyntheticFeedGenerator(teams=2, players_per_team=2))
+    loader = IndexLoader(str(tmp_path / "players.csv"), str(tmp_path / "opponents.csv"))
+
+    with QueryServer(loader, port=0, reload_interval=0.05) as server:
+        assert get(server, "/health")[1]["players"] == 4
+
+        run_players(tmp_path, monkeypatch, SyntheticFeedGenerator(teams=2, players_per_team=3))
+        deadline = time.monotonic() + 5
+        while server.generation < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        status, health = get(server, "/health")
+        assert health["generation"] == 2 and health["players"] == 6
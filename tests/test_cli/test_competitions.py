@@ -0,0 +1,53 @@
+"""
+Tests for processing several competitions in one CLI run
+"""
+
+import csv
+
+from src.cli.app import CLIApp
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_players_for_two_competitions_write_separate_outputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=4, players_per_team=3)
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        output = tmp_path / "players.csv"
+
+        assert app.run(
+            [
+                "--competition", "ucl",
+                "--competition", "uelfantasy:81",
+                "players", "csv", "-o", str(output),
+            ]
+        ) == 0
+        app.api_client.close()
+
+    for key in ("ucl", "uelfantasy-81"):
+        with open(tmp_path / f"players_{key}.csv", encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == generator.player_count
+    assert not output.exists()
+
+
+def test_fixtures_load_team_list_from_feed(tmp_path, monkeypatch):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=4, players_per_team=3)
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        assert app.process_fixtures_command(str(tmp_path / "opponents.csv"))
+        app.api_client.close()
+
+    assert sorted(app.team_mapper.get_all_teams()) == sorted(
+        generator.team_name(i) for i in range(4)
+    )
+    with open(tmp_path / "opponents.csv", encoding="utf-8") as f:
+        assert len(list(csv.reader(f))) == 4 + 1
+
+    # A later run starts from the cached team indexes without the fixtures feed
+    cached = CLIApp().team_mapper
+    assert cached.teams_by_id == app.team_mapper.teams_by_id
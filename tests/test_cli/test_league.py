@@ -0,0 +1,39 @@
+"""
+Tests for the league command
+"""
+
+import csv
+
+from src.cli.app import CLIApp
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_league_standings_from_a_guids_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=8)
+    guids_file = tmp_path / "league.txt"
+    guids_file.write_text("\n".join(f"{i:08d}-manager" for i in range(12)) + "\n")
+    output = tmp_path / "standings.csv"
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        assert app.run(
+            [
+                "league", "--guids-file", str(guids_file), "-m", "3", "--from-matchday", "2",
+                "-o", str(output), "--ownership", str(tmp_path / "ownership.csv"),
+            ]
+        ) == 0
+        app.api_client.close()
+        assert server.request_count == 24
+
+    with open(output, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 12
+    assert [int(row["rank"]) for row in rows] == sorted(int(row["rank"]) for row in rows)
+    assert all(row["previous_rank"] for row in rows)
+    assert "dynamodb_exporter" not in app.__dict__
+
+    with open(tmp_path / "ownership.csv", encoding="utf-8") as f:
+        ownership = list(csv.DictReader(f))
+    assert sum(int(row["owners"]) for row in ownership) == 12 * 15
@@ -0,0 +1,37 @@
+"""
+Tests for exporting players to several formats in one CLI run
+"""
+
+import csv
+import sqlite3
+
+from src.cli.app import CLIApp
+from src.core.metrics import METRICS
+from src.testing.local_dynamodb import LocalDynamoDBResource
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_players_to_several_formats_fetches_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=4, players_per_team=3)
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        app.dynamodb_exporter._dynamodb = LocalDynamoDBResource()
+
+        assert app.run(
+            ["players", "csv", "sqlite", "ddb", "-o", str(tmp_path / "players")]
+        ) == 0
+        app.api_client.close()
+
+    assert METRICS.histogram("http_request_seconds", endpoint="players").count == 1
+    with open(tmp_path / "players.csv", encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == generator.player_count
+    with sqlite3.connect(tmp_path / "players.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM players").fetchone() == (
+            generator.player_count,
+        )
+    assert len(app.dynamodb_exporter.dynamodb.tables[str(tmp_path / "players")]) == (
+        generator.player_count
+    )
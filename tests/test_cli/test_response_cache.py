@@ -0,0 +1,55 @@
+"""
+Tests for runs answered from the response cache
+"""
+
+from src.cli.app import CLIApp
+from src.core.snapshot_store import SnapshotStore
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_stale_run_is_reported_and_not_snapshotted(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=3)
+    snapshots = str(tmp_path / "snapshots")
+    command = ["players", "csv", "-o", str(tmp_path / "players.csv"), "--snapshot-dir", snapshots]
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        assert app.run(command) == 0
+        assert "STALE" not in capsys.readouterr().out
+
+        # The API now fails: the cached payloads are used, and said to be
+        server.error_rate = 1.0
+        assert app.run(command) == 0
+        assert "STALE: the API was slow or failing, players data" in capsys.readouterr().out
+
+        # Without the response cache the run fails instead
+        assert app.run(["--no-response-cache"] + command) == 1
+        app.api_client.close()
+
+    assert len(SnapshotStore(snapshots).list_snapshots()) == 1
+
+
+def test_stale_fantasy_points_are_reported_and_not_snapshotted(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=2, players_per_team=3)
+    snapshots = str(tmp_path / "snapshots")
+    command = ["players", "csv", "-o", str(tmp_path / "players.csv"), "--snapshot-dir", snapshots]
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        assert app.run(command) == 0
+        capsys.readouterr()
+
+        # A live players feed, but every popupstats comes from the cache
+        server.error_rate = 1.0
+        monkeypatch.setattr(app.api_client, "fetch_players_data", generator.players_feed)
+        assert app.run(command) == 0
+        out = capsys.readouterr().out
+        assert "STALE: the API was slow or failing, players data" not in out
+        assert "fantasy points of 6 players are cached copies" in out
+        app.api_client.close()
+
+    assert len(SnapshotStore(snapshots).list_snapshots()) == 1
@@ -0,0 +1,29 @@
+"""
+Tests for the similar command
+"""
+
+from src.cli.app import CLIApp
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def test_similar_players_from_the_players_csv(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(CLIApp, "CACHE_DIR", str(tmp_path / "cache"))
+    generator = SyntheticFeedGenerator(teams=6)
+    players_csv = str(tmp_path / "players.csv")
+
+    with generator.replay_server() as server:
+        app = CLIApp()
+        app.api_client = server.api_client()
+        assert app.run(["players", "csv", "-o", players_csv]) == 0
+        app.api_client.close()
+
+    player_id = str(generator.player_id(0))
+    capsys.readouterr()
+    assert CLIApp().run(
+        ["similar", player_id, "-k", "3", "--players", players_csv, "--price-band", "2", "--exclude-team"]
+    ) == 0
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("  ")]
+    assert [line.split(".")[0].strip() for line in lines] == ["1", "2", "3"]
+    assert all(f"({generator.team_code(0)}," not in line for line in lines)
+
+    assert CLIApp().run(["similar", "999999999", "--players", players_csv]) == 1
@@ -0,0 +1,55 @@
+"""
+Startup-time benchmark for the CLI: subcommands must not pay for unused components
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Seconds allowed for importing the CLI and building a command's components.
+# Override on slow runners with FAPI_STARTUP_BUDGET.
+STARTUP_BUDGET = float(os.environ.get("FAPI_STARTUP_BUDGET", "0.5"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from src.cli.app import CLIApp
+app = CLIApp()
+app.create_parser().parse_args(sys.argv[1:])
+for component in {components!r}:
+    getattr(app, component)
+print(json.dumps({{
+    "elapsed": time.perf_counter() - start,
+    "boto3": "boto3" in sys.modules,
+}}))
+"""
+
+
+def run_probe(components, args):
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(components=components), *args],
+        cwd=repo_root or ".",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_fixtures_startup_skips_boto3_and_meets_budget():
+    probe = run_probe(
+        ["api_client", "fixtures_processor", "opponents_builder", "csv_exporter"],
+        ["fixtures"],
+    )
+
+    assert not probe["boto3"]
+    assert probe["elapsed"] < STARTUP_BUDGET
+
+
+def test_players_csv_startup_skips_boto3():
+    probe = run_probe(["api_client", "players_processor", "csv_exporter"], ["players", "csv"])
+
+    assert not probe["boto3"]
+    assert probe["elapsed"] < STARTUP_BUDGET
@@ -0,0 +1,47 @@
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.lookup("a") == (True, 1)
+
+    cache.put("c", 3)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1) and cache.lookup("c") == (True, 3)
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return len(loads)
+
+    assert cache.get_or_load("player", load) == 1
+    clock.now = 9.9
+    assert cache.get_or_load("player", load) == 1
+    clock.now = 10.0
+    assert cache.get_or_load("player", load) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_clear_with_predicate_drops_matching_keys():
+    cache = TTLCache()
+    for key in [("players", "1"), ("players", "2"), ("team", "1")]:
+        cache.put(key, {})
+
+    assert cache.clear(lambda key: key[0] == "players") == 2
+    assert len(cache) == 1
@@ -0,0 +1,51 @@
+"""
+Tests for kickoff-time normalization
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.core.kickoff import KickoffClock, parse_local
+from src.core.scheduler import MatchdayScheduler
+
+
+def test_feed_formats_convert_to_utc_across_daylight_saving():
+    clock = KickoffClock()
+
+    # 21:00 CEST in September, 21:00 CET in November
+    assert clock.to_utc("9/17/25 9:00:00 PM") == datetime(2025, 9, 17, 19, 0, tzinfo=timezone.utc)
+    assert clock.to_utc("11/05/2025 21:00:00") == datetime(2025, 11, 5, 20, 0, tzinfo=timezone.utc)
+    assert clock.timestamp("9/17/25 9:00:00 PM") == datetime(2025, 9, 17, 19, 0, tzinfo=timezone.utc).timestamp()
+    assert clock.day_of_week("09/17/2025 21:00:00") == "Wednesday"
+    assert clock.to_utc("") is None
+    assert clock.day_of_week("not a date") == "N/A"
+
+
+def test_parsing_is_memoized():
+    clock = KickoffClock()
+    parse_local.cache_clear()
+
+    first = clock.to_utc("10/01/2025 18:45:00")
+    for _ in range(100):
+        assert clock.to_utc("10/01/2025 18:45:00") is first
+    assert parse_local.cache_info().misses == 1
+
+
+def test_meta_timestamp_sets_offset_without_tz_database():
+    clock = KickoffClock(tz=timezone(timedelta(hours=1)))
+    payload = {"meta": {"timestamp": {"utcTime": "10/3/25 6:35:28 PM", "cestTime": "10/3/25 8:35:28 PM"}}}
+
+    assert clock.observe_meta(payload) == timedelta(hours=2)
+    assert clock.to_utc("10/01/2025 21:00:00") == datetime(2025, 10, 1, 19, 0, tzinfo=timezone.utc)
+    assert clock.observe_meta({}) is None
+
+
+def test_scheduler_accepts_aware_and_feed_local_now():
+    scheduler = MatchdayScheduler(
+        {1: [{"home_team_code": "PSG", "away_team_code": "ATA", "date_time": "10/01/2025 21:00:00", "match_status": "0"}]}
+    )
+
+    assert scheduler.playing_teams(datetime(2025, 10, 1, 21, 30)) == {"PSG", "ATA"}
+    assert scheduler.playing_teams(datetime(2025, 10, 1, 19, 30, tzinfo=timezone.utc)) == {"PSG", "ATA"}
+    assert scheduler.next_window_start(datetime(2025, 10, 1, 12, 0)) == datetime(
+        2025, 10, 1, 18, 55, tzinfo=timezone.utc
+    )
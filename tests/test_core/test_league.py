@@ -0,0 +1,51 @@
+from src.core.league import LeagueStandings, LeagueTracker, TeamEntry
+from src.core.team_analyzer import TeamAnalyzer
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def entry(guid, matchday, points, total):
+    return TeamEntry(guid, f"Team {guid}", guid, matchday, points, total, None)
+
+
+def test_standings_share_ranks_on_ties():
+    standings = LeagueStandings()
+    standings.update([entry("a", 1, 50, 50), entry("b", 1, 60, 60), entry("c", 1, 50, 50)])
+
+    rows = standings.standings()
+    assert [(row["guid"], row["rank"]) for row in rows] == [("b", 1), ("a", 2), ("c", 2)]
+    assert standings.matchday_ranks(1) == {"b": 1, "a": 2, "c": 2}
+
+
+def test_new_matchday_points_update_incrementally_with_movements():
+    standings = LeagueStandings()
+    standings.update([entry("a", 1, 50, 50), entry("b", 1, 60, 60), entry("c", 1, 40, 40)])
+
+    # Live points trickle in: only changed managers are re-applied
+    assert standings.update([entry("a", 2, 20, 70), entry("b", 2, 0, 60), entry("c", 2, 5, 45)]) == ["a", "b", "c"]
+    assert standings.update([entry("a", 2, 20, 70), entry("b", 2, 4, 64), entry("c", 2, 5, 45)]) == ["b"]
+
+    rows = {row["guid"]: row for row in standings.standings()}
+    assert rows["a"]["total_points"] == 70 and rows["a"]["rank"] == 1 and rows["a"]["movement"] == 1
+    assert rows["b"]["total_points"] == 64 and rows["b"]["movement"] == -1
+    assert rows["c"]["matchday_rank"] == 2
+    assert standings.rank_history[1] == {"b": 1, "a": 2, "c": 3}
+
+    # A late correction of matchday 1 changes totals, not matchday 2 points
+    standings.update([entry("c", 1, 70, 70)])
+    assert standings.total("c") == 75 and standings.rank("c") == 1
+    assert standings.standings()[0]["matchday_points"] == 5
+
+
+def test_tracker_fetches_every_team_concurrently():
+    generator = SyntheticFeedGenerator(teams=8)
+    guids = [f"{i:08d}-guid" for i in range(40)]
+    analyzer = TeamAnalyzer(api_client=generator.api_client())
+
+    tracker = LeagueTracker(analyzer, guids, workers=8)
+    assert len(tracker.refresh(generator.played_matchdays)) == 40
+    assert tracker.refresh(generator.played_matchdays) == []
+
+    rows = tracker.standings.standings()
+    assert len(rows) == 40 and not tracker.failed
+    totals = [row["total_points"] for row in rows]
+    assert totals == sorted(totals, reverse=True)
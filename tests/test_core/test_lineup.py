@@ -0,0 +1,62 @@
+import itertools
+
+from src.core.lineup import LineupSelector, SquadPlayer
+from src.core.team_analyzer import TeamAnalyzer
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def make_squad():
+    projections = {1: [4.0, 2.0], 2: [6.0, 5.0, 4.0, 1.0, 0.5], 3: [9.0, 7.0, 3.0, 2.5, 2.0], 4: [8.0, 6.5, 1.5]}
+    squad = []
+    for skill, points in projections.items():
+        for i, projected in enumerate(points):
+            squad.append(SquadPlayer(skill * 10 + i, skill, projected))
+    return squad
+
+
+def brute_force(squad, selector):
+    """Best total over every 11-player subset meeting a formation"""
+    best = 0.0
+    for starters in itertools.combinations(squad, 11):
+        counts = tuple(sum(1 for p in starters if p.skill == skill) for skill in (2, 3, 4))
+        if sum(1 for p in starters if p.skill == 1) != 1 or counts not in selector.formations:
+            continue
+        total = sum(p.projected for p in starters) + max(p.projected for p in starters)
+        best = max(best, total)
+    return best
+
+
+def test_best_lineup_matches_brute_force():
+    selector = LineupSelector()
+    squad = make_squad()
+    lineup = selector.best(squad)
+
+    assert lineup.formation == "3-5-2"
+    assert lineup.projected == brute_force(squad, selector)
+    assert lineup.captain.player_id == 30 and lineup.vice_captain.player_id == 40
+    # Backup keeper first, then outfield bench by projection
+    assert [p.player_id for p in lineup.bench] == [11, 42, 23, 24]
+
+
+def test_alternatives_are_ranked_and_complete():
+    lineups = LineupSelector().rank(make_squad())
+    assert len(lineups) == 7
+    assert [lineup.projected for lineup in lineups] == sorted(
+        (lineup.projected for lineup in lineups), reverse=True
+    )
+    for lineup in lineups:
+        assert len(lineup.starters) == 11 and len(lineup.bench) == 4
+
+    # A squad short of forwards only fits formations with one forward
+    short = [p for p in make_squad() if p.player_id not in (41, 42)]
+    assert {lineup.formation for lineup in LineupSelector().rank(short)} == {"4-5-1", "5-4-1"}
+
+
+def test_every_team_of_a_league_in_a_loop():
+    generator = SyntheticFeedGenerator()
+    analyzer = TeamAnalyzer(api_client=generator.api_client())
+    teams = [generator.team(f"{i:08d}-manager") for i in range(500)]
+
+    lineups = [analyzer.suggest_lineup(team) for team in teams]
+
+    assert all(lineup is not None and len(lineup.starters) == 11 for lineup in lineups)
@@ -0,0 +1,112 @@
+"""
+Tests for per-match stat extraction from popupstats payloads
+"""
+
+import copy
+import json
+import sqlite3
+
+from src.api.response_cache import CachedPayload
+from src.core.match_stats import MatchStatsTable
+from src.core.processors import PlayersDataProcessor
+from src.exporters.sqlite_exporter import SQLiteExporter
+
+
+with open("json/players_data_per_match.json", "r", encoding="utf-8") as f:
+    POPUPSTATS = json.load(f)
+
+
+class StubApiClient:
+    """Returns the sample popupstats payload (or another one) for any player"""
+
+    def __init__(self, payload=POPUPSTATS):
+        self.payload = payload
+
+    def fetch_player_fantasy_data(self, player_id):
+        return self.payload
+
+
+def test_add_popupstats_extracts_stats_and_points():
+    table = MatchStatsTable()
+    table.add_popupstats(250101444, POPUPSTATS["data"]["value"])
+
+    assert table.get("oF", matchday=1) == {(250101444, 1): 90}
+    assert table.get("bR", matchday=1) == {(250101444, 1): 6}
+    assert table.get("tPoints", matchday=1) == {(250101444, 1): 5}
+    assert table.get("pts_cS", matchday=1) == {(250101444, 1): 1}
+    # Zero values are not stored
+    assert table.get("gS") == {}
+
+
+def test_processor_collects_match_stats_from_same_fetch():
+    processor = PlayersDataProcessor(StubApiClient())
+    upcoming = [{"tLoc": "H", "vsCCode": "ATA", "matchDate": "09/17/2025 21:00:00"}]
+    raw = {
+        "data": {
+            "value": {
+                "playerList": [{"id": 1, "skill": 3, "upcomingMatchesList": upcoming}]
+            }
+        }
+    }
+
+    players = processor.process_players(raw)
+
+    assert players[0]["MD1"] == 5
+    pivoted = processor.match_stats.by_player_matchday()
+    assert pivoted[(1, 1)]["tPoints"] == 5
+    assert pivoted[(1, 1)]["oF"] == 90
+
+
+def test_processor_counts_stale_popupstats():
+    processor = PlayersDataProcessor(StubApiClient(CachedPayload(POPUPSTATS, fetched_at=0)))
+    raw = {"data": {"value": {"playerList": [{"id": 1}, {"id": 2}]}}}
+
+    players = processor.process_players(raw)
+
+    assert [player["MD1"] for player in players] == [5, 5]
+    assert processor.stale_players == 2
+    processor.api_client = StubApiClient()
+    processor.process_players(raw)
+    assert processor.stale_players == 0
+
+
+def test_extend_recodes_stat_names():
+    first = MatchStatsTable()
+    first.add(1, 1, "gS", 2)
+    second = MatchStatsTable()
+    second.add(2, 1, "bR", 4)
+    second.add(2, 1, "gS", 1)
+
+    first.extend(second)
+
+    assert list(first.rows()) == [(1, 1, "gS", 2), (2, 1, "bR", 4), (2, 1, "gS", 1)]
+
+
+def test_malformed_stats_keep_md_points_and_leave_no_rows():
+    payload = copy.deepcopy(POPUPSTATS)
+    payload["data"]["value"]["stats"].append({"mdId": "not a matchday", "gS": 1})
+    processor = PlayersDataProcessor(StubApiClient(payload))
+
+    points = processor._get_player_fantasy_points("1")
+
+    assert points["MD1"] == 5
+    assert len(processor.match_stats) == 0
+
+
+def test_repeated_stats_are_stored_once(tmp_path):
+    payload = copy.deepcopy(POPUPSTATS["data"]["value"])
+    payload["stats"].append(dict(payload["stats"][0], bR=9))
+    table = MatchStatsTable()
+    table.add_popupstats(1, payload)
+    assert table.get("bR", matchday=1) == {(1, 1): 9}
+
+    # Rows merged from several tables may still repeat a key
+    repeated = MatchStatsTable()
+    repeated.add(1, 1, "bR", 9)
+    table.extend(repeated)
+    database = str(tmp_path / "stats.db")
+    assert SQLiteExporter(database).export_match_stats(table)
+    with sqlite3.connect(database) as conn:
+        assert conn.execute(
+            "SELECT COUNT(*), MAX(value) FROM match_stats WHERE stat = 'bR' AND matchday = 1"
+        ).fetchone() == (1, 9)
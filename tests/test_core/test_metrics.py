@@ -0,0 +1,64 @@
+"""
+Tests for the run metrics registry
+"""
+
+import json
+
+import pytest
+
+from src.core.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.total == 5050
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(95) == 95
+    assert histogram.percentile(99) == 99
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_span_and_timed_record_latency_errors_and_failures():
+    metrics = MetricsRegistry()
+
+    @metrics.timed("export", sink="csv")
+    def export(ok):
+        return ok
+
+    export(True)
+    export(False)
+    with pytest.raises(ValueError):
+        with metrics.span("fetch", endpoint="players"):
+            raise ValueError("boom")
+
+    assert metrics.histogram("export_seconds", sink="csv").count == 2
+    assert metrics.counter_value("export_failures", sink="csv") == 1
+    assert metrics.histogram("fetch_seconds", endpoint="players").count == 1
+    assert metrics.counter_value("fetch_errors", endpoint="players") == 1
+
+
+def test_json_and_prometheus_output(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.incr("http_retries", endpoint="popupstats")
+    metrics.observe("http_response_bytes", 2048, endpoint="players")
+
+    json_path = tmp_path / "metrics.json"
+    prom_path = tmp_path / "fapi.prom"
+    metrics.write_json(str(json_path))
+    metrics.write_prometheus(str(prom_path))
+
+    data = json.loads(json_path.read_text())
+    assert data["counters"]["http_retries"] == [
+        {"labels": {"endpoint": "popupstats"}, "value": 1}
+    ]
+    assert data["histograms"]["http_response_bytes"][0]["p50"] == 2048
+
+    prom = prom_path.read_text()
+    assert 'fapi_http_retries_total{endpoint="popupstats"} 1' in prom
+    assert 'fapi_http_response_bytes{endpoint="players",quantile="0.95"} 2048' in prom
+    assert 'fapi_http_response_bytes_count{endpoint="players"} 1' in prom
+    assert "http_retries" in metrics.summary()
@@ -0,0 +1,75 @@
+from src.core.ownership import OwnershipMatrix
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def team(*squad):
+    """squad: (player_id, 'C' captain / 'B' bench / '' starter)"""
+    players = [
+        {"id": player_id, "iscaptain": int(role == "C"), "benchposition": 1 if role == "B" else 0}
+        for player_id, role in squad
+    ]
+    return {"data": {"value": {"playerid": players}}}
+
+
+def make_matrix():
+    return OwnershipMatrix.from_teams(
+        {
+            "a": team((10, "C"), (11, ""), (12, "B")),
+            "b": team((10, ""), (11, "C"), (13, "")),
+            "c": team((10, "C"), (14, ""), (12, "")),
+            "d": team((15, ""), (16, "B")),
+        }
+    )
+
+
+def test_ownership_captaincy_and_effective_ownership():
+    matrix = make_matrix()
+    assert matrix.shape == (4, 7) and matrix.nnz == 11
+
+    assert matrix.ownership()[10] == 75.0
+    assert matrix.captaincy() == {10: 50.0, 11: 25.0}
+    # 10: captain twice + starter once = 5 weight over 4 managers
+    assert matrix.effective_ownership()[10] == 125.0
+    # Benched for a, started by c
+    assert matrix.effective_ownership()[12] == 25.0
+    assert sorted(matrix.owners(12)) == ["a", "c"]
+    assert matrix.summary()[0]["playerId"] == 10
+
+
+def test_differentials_versus_the_league():
+    matrix = make_matrix()
+    rows = matrix.differentials("b")
+    assert [row["playerId"] for row in rows] == [11, 13, 10]
+    assert rows[0]["differential"] == 2.0 - 0.75
+
+    assert [row["playerId"] for row in matrix.differentials("b", max_ownership=50)] == [11, 13]
+
+
+def test_overlaps_match_pairwise_row_merges():
+    matrix = make_matrix()
+    assert matrix.overlap("a", "c") == 2
+    assert matrix.overlaps("a") == {"b": 2, "c": 2}
+
+    dense = matrix.overlap_matrix()
+    for i, a in enumerate(matrix.managers):
+        for j, b in enumerate(matrix.managers):
+            expected = len(matrix.row(a)) if i == j else matrix.overlap(a, b)
+            assert dense[i][j] == expected
+
+
+def test_matvec_gives_weighted_team_totals():
+    matrix = make_matrix()
+    points = [float(player_id) for player_id in matrix.players]
+    assert matrix.matvec(points) == [31.0, 45.0, 46.0, 15.0]
+    assert matrix.matvec(points, weighted=False) == [33.0, 34.0, 36.0, 31.0]
+
+
+def test_hundreds_of_synthetic_teams():
+    generator = SyntheticFeedGenerator()
+    teams = {f"{i:08d}-manager": generator.team(f"{i:08d}-manager") for i in range(500)}
+    matrix = OwnershipMatrix.from_teams(teams)
+
+    assert matrix.nnz == 500 * 15
+    assert abs(sum(matrix.ownership().values()) - 1500.0) < 1e-6
+    assert abs(sum(matrix.effective_ownership().values()) - 100.0 * sum(matrix.data) / 500) < 1e-6
+    assert sum(matrix.overlaps("00000000-manager").values()) > 0
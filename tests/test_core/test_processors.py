@@ -0,0 +1,126 @@
+"""
+Tests for joining players to the team x matchday fixture index
+"""
+
+from src.core.processors import (
+    FixturesDataProcessor,
+    OpponentsTableBuilder,
+    PlayersDataProcessor,
+)
+from src.core.team_mapper import TeamMapper
+
+
+def match(md, home, away, status="0", when="10/01/2025 21:00:00"):
+    return {
+        "mId": md * 100 + home[0],
+        "dateTime": when,
+        "matchStatus": status,
+        "htId": home[0], "htName": home[1], "htCCode": home[1][:3].upper(),
+        "atId": away[0], "atName": away[1], "atCCode": away[1][:3].upper(),
+    }
+
+
+PSG, INT, BAR, ATA = (1, "Paris"), (2, "Inter"), (3, "Barcelona"), (4, "Atalanta")
+
+FIXTURES_FEED = {
+    "data": {
+        "value": [
+            {"mdId": 1, "match": [match(1, PSG, INT, status="2"), match(1, BAR, ATA, status="2")]},
+            {"mdId": 2, "match": [match(2, INT, BAR), match(2, ATA, PSG, when="10/22/2025 18:45:00")]},
+            {"mdId": 3, "match": [match(3, PSG, BAR), match(3, ATA, INT)]},
+            {"mdId": 4, "match": [match(4, BAR, PSG), match(4, INT, ATA)]},
+            {"mdId": 5, "match": [match(5, PSG, ATA), match(5, INT, BAR)]},
+        ]
+    }
+}
+
+
+def fixture_index():
+    mapper = TeamMapper()
+    fixtures = FixturesDataProcessor(mapper).process_fixtures(FIXTURES_FEED)
+    return OpponentsTableBuilder(mapper).build_fixture_index(fixtures)
+
+
+def test_fixture_index_skips_finished_matches():
+    slots = fixture_index()[1]
+
+    assert [(slot.matchday, slot.opponent, slot.venue) for slot in slots] == [
+        (2, "ATA", "A"), (3, "BAR", "H"), (4, "BAR", "A"), (5, "ATA", "H")
+    ]
+    assert slots[0].day == "Wednesday"
+    assert slots[0].opponent_id == 4
+
+
+def test_players_join_next_fixtures_by_team_id():
+    processor = PlayersDataProcessor(fixture_index=fixture_index())
+    raw_players = {
+        "data": {"value": {"playerList": [
+            # Stale per-player list is ignored in favour of the index
+            {"id": 10, "tId": 1, "cCode": "PAR", "upcomingMatchesList": [{"tLoc": "H", "vsCCode": "XXX"}]},
+            {"id": 11, "tId": 99, "cCode": "UNK"},
+        ]}}
+    }
+
+    psg_player, unknown_player = processor.process_players(raw_players, with_fantasy_points=False)
+
+    assert psg_player["opponent"] == "ATA"
+    assert psg_player["home or away"] == "A"
+    assert psg_player["match date"] == "Wednesday"
+    assert psg_player["fixture 1"] == "MD2 ATA (A)"
+    assert psg_player["fixture 3"] == "MD4 BAR (A)"
+    # Feed times are Central European; 18:45 CEST is 16:45 UTC
+    assert psg_player["fixture 1 kickoff"] == "2025-10-22T16:45:00+00:00"
+    # No fixtures and no upcomingMatchesList no longer raises
+    assert unknown_player["opponent"] is None
+    assert unknown_player["fixture 1"] == ""
+    assert unknown_player["fixture 1 kickoff"] == ""
+
+
+def test_fallback_uses_next_upcoming_match_not_last():
+    processor = PlayersDataProcessor()
+    raw_players = {
+        "data": {"value": {"playerList": [
+            {"id": 10, "upcomingMatchesList": [
+                {"mdId": 2, "tLoc": "H", "vsCCode": "INT", "matchDate": "10/01/2025 21:00:00"},
+                {"mdId": 3, "tLoc": "A", "vsCCode": "BAR", "matchDate": "10/22/2025 21:00:00"},
+            ]},
+        ]}}
+    }
+
+    (player,) = processor.process_players(raw_players, with_fantasy_points=False)
+
+    assert (player["opponent"], player["home or away"]) == ("INT", "H")
+    assert player["fixture 2"] == "MD3 BAR (A)"
+
+
+def test_players_feed_completes_the_team_mapper():
+    mapper = TeamMapper()
+    FixturesDataProcessor(mapper).process_fixtures(FIXTURES_FEED)
+    processor = PlayersDataProcessor(team_mapper=mapper)
+    raw_players = {
+        "data": {"value": {"playerList": [
+            {"id": 10, "tId": 5, "tName": "Benfica", "cCode": "BEN"},
+            {"id": 11, "tId": 5, "tName": "Benfica"},
+            {"id": 12, "tId": 1, "tName": "Paris"},
+        ]}}
+    }
+
+    players = processor.process_players(raw_players, with_fantasy_points=False)
+
+    # A club missing from the fixtures feed is mapped by its team ID
+    assert mapper.get_team(5).name == "Benfica"
+    assert len(mapper.get_all_teams()) == 5
+    assert [player["team"] for player in players] == ["BEN", "BEN", "PAR"]
+
+
+def test_fixture_index_orders_matchdays_numerically():
+    mapper = TeamMapper()
+    feed = {"data": {"value": [
+        {"mdId": 10, "match": [match(10, PSG, INT)]},
+        {"mdId": 2, "match": [match(2, INT, PSG)]},
+    ]}}
+    fixtures = FixturesDataProcessor(mapper).process_fixtures(feed)
+
+    slots = OpponentsTableBuilder(mapper).build_fixture_index(fixtures)[1]
+
+    assert [slot.matchday for slot in slots] == [2, 10]
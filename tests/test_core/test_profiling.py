@@ -0,0 +1,56 @@
+"""
+Tests for the CLI profiling hooks
+"""
+
+import pstats
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.profiling import profiled
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_cprofile_mode_writes_pstats(tmp_path):
+    path = str(tmp_path / "run.pstats")
+
+    with profiled(path, mode="cprofile"):
+        busy_wait(0.01)
+
+    stats = pstats.Stats(path)
+    assert any(func[2] == "busy_wait" for func in stats.stats)
+
+
+def test_sample_mode_writes_collapsed_stacks(tmp_path):
+    path = tmp_path / "run.folded"
+
+    with profiled(str(path), mode="sample", interval=0.001):
+        busy_wait(0.1)
+
+    lines = path.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("busy_wait" in line for line in lines)
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        with profiled(str(tmp_path / "x"), mode="perf"):
+            pass
+
+
+def test_default_mode_samples_pool_threads(tmp_path):
+    path = tmp_path / "run.folded"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with profiled(str(path), interval=0.001):
+            list(executor.map(busy_wait, [0.1, 0.1]))
+
+    assert any("_worker" in line and "busy_wait" in line for line in path.read_text().splitlines())
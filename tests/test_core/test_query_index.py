@@ -0,0 +1,57 @@
+import pytest
+
+from src.core.query_index import QueryError, QueryIndex
+
+
+def make_index():
+    players = [
+        {"playerId": "1", "name": "A", "team": "ARS", "position": "forwards", "total points": "30", "value": "9.5"},
+        {"playerId": "2", "name": "B", "team": "ARS", "position": "defenders", "total points": "12", "value": "5.0"},
+        {"playerId": "3", "name": "C", "team": "BAR", "position": "forwards", "total points": "41", "value": "10.5"},
+        {"playerId": "4", "name": "D", "team": "BAR", "position": "goal keepers", "total points": "", "value": "4.5"},
+        {"playerId": "5", "name": "E", "team": "INT", "position": "forwards", "total points": "18", "value": "7.0"},
+    ]
+    return QueryIndex(players)
+
+
+def test_csv_values_are_typed_and_indexed_by_id():
+    index = make_index()
+    player = index.get_player(3)
+    assert player["total points"] == 41 and player["value"] == 10.5
+    assert index.get_player("4")["total points"] is None
+    assert index.get_player("99") is None
+
+
+def test_filters_sort_and_paginate():
+    index = make_index()
+
+    result = index.find_players(
+        {"position": ["Forwards"]}, sort_by="total points", limit=2, fields=["name"]
+    )
+    assert result["total"] == 3
+    assert result["players"] == [{"name": "C"}, {"name": "A"}]
+
+    page = index.find_players({"position": ["forwards"]}, sort_by="total points", offset=2, limit=2)
+    assert [p["name"] for p in page["players"]] == ["E"]
+
+    # Players without a value sort last in both directions
+    ascending = index.find_players(sort_by="total points", descending=False)
+    assert [p["name"] for p in ascending["players"]] == ["B", "E", "A", "C", "D"]
+
+    ranged = index.find_players({"team": ["ars", "bar"]}, {"value": (5.0, 10.0)})
+    assert [p["name"] for p in ranged["players"]] == ["A", "B"]
+
+
+def test_top_k_with_and_without_filters():
+    index = make_index()
+    assert [p["name"] for p in index.top_players(k=2)] == ["C", "A"]
+    assert [p["name"] for p in index.top_players(k=5, equals={"team": ["BAR"]})] == ["C"]
+    assert [p["name"] for p in index.top_players(by="value", k=1, equals={"name": ["e", "b"]})] == ["E"]
+
+
+def test_unknown_fields_are_rejected():
+    index = make_index()
+    with pytest.raises(QueryError):
+        index.find_players(sort_by="nope")
+    with pytest.raises(QueryError):
+        index.top_players(equals={"nope": ["x"]})
@@ -0,0 +1,57 @@
+"""
+Tests for the fixture-driven matchday scheduler
+"""
+
+from datetime import datetime
+
+from src.core.scheduler import MatchdayScheduler
+
+
+def fixture(home, away, date_time, status="0"):
+    return {
+        "home_team_code": home,
+        "away_team_code": away,
+        "date_time": date_time,
+        "match_status": status,
+    }
+
+
+FIXTURES = {
+    1: [
+        fixture("PSG", "ATA", "10/01/2025 18:45:00"),
+        fixture("BAR", "NEW", "10/01/2025 21:00:00"),
+        fixture("INT", "AJA", "10/02/2025 21:00:00"),
+    ]
+}
+
+
+def test_playing_teams_follow_kickoff_windows():
+    scheduler = MatchdayScheduler(FIXTURES)
+
+    assert scheduler.playing_teams(datetime(2025, 10, 1, 19, 30)) == {"PSG", "ATA"}
+    assert scheduler.playing_teams(datetime(2025, 10, 1, 22, 0)) == {"BAR", "NEW"}
+    assert scheduler.playing_teams(datetime(2025, 10, 2, 12, 0)) == set()
+
+
+def test_live_status_overrides_kickoff_time():
+    scheduler = MatchdayScheduler({1: [fixture("PSG", "ATA", "", status="1")]})
+
+    assert scheduler.playing_teams(datetime(2025, 10, 5)) == {"PSG", "ATA"}
+
+
+def test_idle_interval_is_capped_at_next_window():
+    scheduler = MatchdayScheduler(FIXTURES)
+
+    # 10 minutes before the 18:45 window opens (5 minute lead time)
+    interval = scheduler.next_interval(60, 3600, datetime(2025, 10, 1, 18, 30))
+    assert interval == 600
+    assert scheduler.next_interval(60, 3600, datetime(2025, 10, 1, 19, 0)) == 60
+
+
+def test_players_to_refresh_only_includes_playing_teams():
+    scheduler = MatchdayScheduler(FIXTURES)
+    players = [{"playerId": 1, "team": "PSG"}, {"playerId": 2, "team": "INT"}]
+
+    selected = scheduler.players_to_refresh(players, datetime(2025, 10, 1, 19, 0))
+
+    assert [p["playerId"] for p in selected] == [1]
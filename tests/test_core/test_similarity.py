@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from src.core.processors import PlayersDataProcessor
+from src.core.query_index import QueryIndex
+from src.core.similarity import SimilarityIndex
+from src.testing.synthetic import SyntheticFeedGenerator
+
+
+def player(player_id, position, team, points, value, goals=0, minutes=90):
+    return {
+        "playerId": player_id, "name": f"P{player_id}", "team": team, "position": position,
+        "total points": points, "value": value, "goals": goals, "minutes played": minutes,
+        "MD1": points // 2, "MD2": points - points // 2,
+    }
+
+
+def make_index():
+    return SimilarityIndex([
+        player(1, "forwards", "ARS", 30, 9.5, goals=6),
+        player(2, "forwards", "BAR", 29, 9.0, goals=6),
+        player(3, "forwards", "INT", 8, 5.5, goals=1, minutes=40),
+        player(4, "forwards", "ARS", 28, 9.5, goals=5),
+        player(5, "midfielders", "BAR", 30, 9.5, goals=6),
+        player(6, "defenders", "INT", 5, 4.0, minutes=20),
+    ])
+
+
+def test_nearest_players_closest_first():
+    index = make_index()
+    matches = index.similar(1, k=3)
+    assert [match["playerId"] for match in matches] == [2, 4, 3]
+    assert [match["distance"] for match in matches] == sorted(match["distance"] for match in matches)
+
+    # Other positions are only considered on request, and rank behind
+    # equally good players of the same position
+    anywhere = [match["playerId"] for match in index.similar(1, k=5, same_position=False)]
+    assert set(anywhere) == {2, 3, 4, 5, 6} and anywhere.index(5) > anywhere.index(2)
+
+
+def test_filters_and_unknown_player():
+    index = make_index()
+    assert [m["playerId"] for m in index.similar(1, exclude_team=True)] == [2, 3]
+    assert [m["playerId"] for m in index.similar(1, max_value=9.2)] == [2, 3]
+    assert [m["playerId"] for m in index.similar(1, min_value=9.2)] == [4]
+    assert index.similar(6) == []
+    with pytest.raises(KeyError):
+        index.similar(99)
+
+
+def test_query_index_builds_similarity_once():
+    index = QueryIndex([
+        {"playerId": "1", "position": "forwards", "total points": "30", "value": "9.5"},
+        {"playerId": "2", "position": "forwards", "total points": "12", "value": "5.0"},
+    ])
+    assert index.similarity is index.similarity
+    assert index.similarity.similar("1")[0]["playerId"] == 2
+
+
+def test_full_roster_queries_in_milliseconds():
+    generator = SyntheticFeedGenerator()
+    players = PlayersDataProcessor().process_players(generator.players_feed())
+    index = QueryIndex(players).similarity
+    ids = [p["playerId"] for p in index.players[:50]]
+
+    start = time.perf_counter()
+    results = [index.similar(player_id, k=5, max_value=10.0) for player_id in ids]
+    per_query = (time.perf_counter() - start) / len(ids)
+
+    assert all(len(result) == 5 for result in results)
+    assert per_query < 0.02
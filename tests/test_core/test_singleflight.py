@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.singleflight import SingleFlight
+
+
+def wait_for_waiters(flight, key, count):
+    while True:
+        with flight._lock:
+            call = flight._calls.get(key)
+            if call is not None and call.waiters >= count:
+                return
+        threading.Event().wait(0.001)
+
+
+def test_concurrent_threads_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait()
+        return {"value": 42}
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [executor.submit(flight.do, "players", fetch) for _ in range(6)]
+        wait_for_waiters(flight, "players", 5)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+    # Finished calls are not cached
+    assert flight.do("players", lambda: "fresh") == "fresh"
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait()
+        raise ConnectionError("reset")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(flight.do, "fixtures", fail) for _ in range(3)]
+        wait_for_waiters(flight, "fixtures", 2)
+        release.set()
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result()
+
+
+def test_asyncio_tasks_join_a_call_started_by_a_thread():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait()
+        return "payload"
+
+    async def main():
+        leader = asyncio.get_running_loop().run_in_executor(None, flight.do, "players", fetch)
+        while flight.in_flight() == 0:
+            await asyncio.sleep(0.001)
+        tasks = [asyncio.ensure_future(flight.do_async("players", fetch)) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(leader, *tasks)
+
+    assert asyncio.run(main()) == ["payload"] * 5
+    assert len(calls) == 1
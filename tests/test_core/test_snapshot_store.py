@@ -0,0 +1,72 @@
+"""
+Tests for the append-only snapshot store
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.core.snapshot_store import SnapshotStore
+
+
+def make_players(values):
+    return [
+        {"playerId": player_id, "name": f"P{player_id}", "value": value, "MD1": 2}
+        for player_id, value in values.items()
+    ]
+
+
+def test_record_load_and_diff(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    t0 = datetime(2025, 10, 1, tzinfo=timezone.utc)
+
+    first = store.record(make_players({1: 5.0, 2: 6.0, 3: 7.0}), timestamp=t0)
+    second = store.record(
+        make_players({1: 5.5, 2: 6.0, 4: 4.5}), timestamp=t0 + timedelta(days=1)
+    )
+
+    loaded = store.load(first)
+    assert loaded["meta"]["matchday"] == 1
+    assert sorted(p["playerId"] for p in loaded["players"]) == [1, 2, 3]
+
+    changes = store.diff(first, second)
+    assert changes["changed"] == {"1": {"value": (5.0, 5.5)}}
+    assert [p["playerId"] for p in changes["added"]] == [4]
+    assert [p["playerId"] for p in changes["removed"]] == [3]
+
+
+def test_unchanged_buckets_are_deduplicated(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    players = make_players({i: 5.0 for i in range(200)})
+
+    first = store.get_entry(store.record(players))
+    players[0]["value"] = 5.5
+    second = store.get_entry(store.record(players))
+
+    differing = [a != b for a, b in zip(first["players"], second["players"])]
+    assert sum(differing) == 1
+
+
+def test_time_travel_and_player_history(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    t0 = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    store.record(make_players({1: 5.0}), timestamp=t0)
+    store.record(make_players({1: 5.5}), timestamp=t0 + timedelta(days=2))
+
+    as_of = store.latest(at=t0 + timedelta(days=1))
+    assert store.load(as_of["id"])["players"][0]["value"] == 5.0
+
+    history = store.player_history(1, fields=("value",))
+    assert [point["value"] for point in history] == [5.0, 5.5]
+
+
+def test_decoded_blobs_are_bounded(tmp_path):
+    store = SnapshotStore(str(tmp_path), blob_cache_size=10)
+    t0 = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    ids = [
+        store.record(make_players({i: 5.0 + run for i in range(100)}), timestamp=t0 + timedelta(hours=run))
+        for run in range(5)
+    ]
+
+    for snapshot_id in ids:
+        assert len(store.load(snapshot_id)["players"]) == 100
+    assert len(store._blob_cache) == 10
+    assert store.load(ids[0])["players"][0]["value"] == 5.0
@@ -0,0 +1,58 @@
+"""
+Tests for the feed-driven team mapper
+"""
+
+from src.core.team_mapper import TeamInfo, TeamMapper
+
+
+FIXTURES_FEED = {
+    "data": {
+        "value": [
+            {
+                "mdId": 1,
+                "match": [
+                    {"htId": 50, "htName": "Paris", "htCCode": "PSG", "atId": "51", "atName": "Atalanta", "atCCode": "ATA"},
+                    {"htId": 52, "htName": "Inter", "htCCode": "INT", "atId": 53, "atName": "New Club", "atCCode": ""},
+                ],
+            }
+        ]
+    }
+}
+
+PLAYERS_FEED = {
+    "data": {"value": {"playerList": [{"id": 1, "tId": 53, "tName": "New Club", "cCode": "NEW"}]}}
+}
+
+
+def test_indexes_are_built_from_fixtures_feed():
+    mapper = TeamMapper.from_fixtures(FIXTURES_FEED)
+
+    assert mapper.get_all_teams() == ("Paris Saint-Germain", "Atalanta", "Inter", "New Club")
+    assert mapper.is_valid_team("New Club")
+    assert not mapper.is_valid_team("Liverpool")
+    assert mapper.get_team("51") == TeamInfo(51, "Atalanta", "Atalanta", "ATA")
+    assert mapper.team_id("Paris") == mapper.team_id("Paris Saint-Germain") == mapper.team_id("PSG") == 50
+    assert mapper.team_name(50) == "Paris Saint-Germain"
+    assert mapper.team_code(52) == "INT"
+    assert mapper.get_team(None) is None
+
+
+def test_players_feed_fills_missing_codes():
+    mapper = TeamMapper.from_fixtures(FIXTURES_FEED)
+
+    assert mapper.load_from_players(PLAYERS_FEED) == 1
+    assert mapper.team_code(53) == "NEW"
+    assert mapper.team_id("NEW") == 53
+    assert len(mapper.get_all_teams()) == 4
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache" / "teams.json")
+    mapper = TeamMapper.from_fixtures(FIXTURES_FEED)
+
+    assert mapper.save_cache(path)
+    cached = TeamMapper()
+    assert cached.load_cache(path)
+    assert cached.teams_by_id == mapper.teams_by_id
+    assert cached.get_all_teams() == mapper.get_all_teams()
+    assert not TeamMapper().load_cache(str(tmp_path / "missing.json"))
@@ -0,0 +1,130 @@
+"""
+Tests for the delta-pushing feed watcher
+"""
+
+import time
+from datetime import datetime
+
+from src.api.response_cache import CachedPayload
+from src.core.processors import FixturesDataProcessor, PlayersDataProcessor
+from src.core.team_mapper import TeamMapper
+from src.core.watcher import FeedWatcher
+
+
+UPCOMING = [{"tLoc": "H", "vsCCode": "INT", "matchDate": "10/01/2025 21:00:00"}]
+
+
+def players_feed(points_by_id):
+    return {
+        "data": {
+            "value": {
+                "playerList": [
+                    {"id": player_id, "skill": 2, "totPts": points, "upcomingMatchesList": UPCOMING}
+                    for player_id, points in points_by_id.items()
+                ]
+            }
+        }
+    }
+
+
+FIXTURES_FEED = {
+    "data": {
+        "value": [
+            {
+                "mdId": 1,
+                "match": [
+                    {
+                        "mId": 1,
+                        "htName": "Paris",
+                        "atName": "Inter",
+                        "dateTime": "10/01/2025 21:00:00",
+                        "matchStatus": "0",
+                    }
+                ],
+            }
+        ]
+    }
+}
+
+
+class StubApiClient:
+    def __init__(self, feeds):
+        self.feeds = list(feeds)
+        self.popupstats_calls = []
+
+    def fetch_fixtures_data(self):
+        return FIXTURES_FEED
+
+    def fetch_players_data(self):
+        return self.feeds.pop(0)
+
+    def fetch_player_fantasy_data(self, player_id):
+        self.popupstats_calls.append(player_id)
+        return None
+
+
+def make_watcher(api_client, pushed):
+    def on_changes(changed, all_players):
+        pushed.append(([p["playerId"] for p in changed], len(all_players)))
+        return True
+
+    return FeedWatcher(
+        api_client,
+        PlayersDataProcessor(api_client),
+        FixturesDataProcessor(TeamMapper()),
+        on_changes,
+    )
+
+
+def test_only_changed_players_are_refetched_and_pushed():
+    api_client = StubApiClient(
+        [players_feed({1: 5, 2: 3}), players_feed({1: 5, 2: 7}), players_feed({1: 5, 2: 7})]
+    )
+    pushed = []
+    watcher = make_watcher(api_client, pushed)
+
+    watcher.run(max_polls=3, sleep=lambda seconds: None)
+
+    assert pushed == [([1, 2], 2), ([2], 2)]
+    assert api_client.popupstats_calls == [1, 2, 2]
+
+
+def test_stale_players_feed_is_not_pushed():
+    api_client = StubApiClient(
+        [CachedPayload(players_feed({1: 5}), time.time() - 600), players_feed({1: 5})]
+    )
+    pushed = []
+    watcher = make_watcher(api_client, pushed)
+
+    watcher.run(max_polls=2, sleep=lambda seconds: None)
+
+    # The cached copy is skipped; the next live feed is pushed as new
+    assert pushed == [([1], 1)]
+
+
+def test_players_of_playing_teams_are_refetched_every_poll():
+    feed = {"data": {"value": {"playerList": [
+        {"id": 1, "skill": 2, "cCode": "PAR"}, {"id": 2, "skill": 2, "cCode": "BAR"},
+    ]}}}
+    fixtures = {"data": {"value": [{"mdId": 1, "match": [{
+        "mId": 1, "htName": "Paris", "htCCode": "PAR", "atName": "Inter", "atCCode": "INT",
+        "dateTime": "10/01/2025 21:00:00", "matchStatus": "0",
+    }]}]}}
+    api_client = StubApiClient([feed, feed])
+    api_client.fetch_fixtures_data = lambda: fixtures
+    watcher = make_watcher(api_client, [])
+
+    during_match = datetime(2025, 10, 1, 21, 30)
+    watcher.poll_once(during_match)
+    watcher.poll_once(during_match)
+
+    # Both are new on the first poll; only the playing team's player after that
+    assert api_client.popupstats_calls == [1, 2, 1]
+
+
+def test_polls_faster_during_match_window():
+    watcher = make_watcher(StubApiClient([]), [])
+    watcher.refresh_fixtures(force=True)
+
+    assert watcher.next_interval(datetime(2025, 10, 1, 22, 0)) == watcher.live_interval
+    assert watcher.next_interval(datetime(2025, 10, 2, 12, 0)) == watcher.idle_interval
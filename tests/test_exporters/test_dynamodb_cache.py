@@ -0,0 +1,65 @@
+from botocore.exceptions import ClientError
+
+from src.core.metrics import METRICS
+from src.exporters.dynamodb_exporter import DynamoDBExporter
+from src.testing.local_dynamodb import LocalDynamoDBResource
+
+
+def make_exporter():
+    exporter = DynamoDBExporter()
+    exporter._dynamodb = LocalDynamoDBResource()
+    assert exporter.export_players_data(
+        [{"playerId": str(i), "name": f"Player {i}", "value": 5.0} for i in range(3)],
+        "players",
+    )
+    return exporter
+
+
+def test_repeated_lookups_hit_the_cache():
+    exporter = make_exporter()
+    METRICS.reset()
+
+    for _ in range(10):
+        assert exporter.get_player_by_id("1", "players")["name"] == "Player 1"
+    assert exporter.get_player_by_id("99", "players") is None
+    assert exporter.get_player_by_id("99", "players") is None
+
+    assert exporter._dynamodb.read_count == 2
+    assert METRICS.counter_value("cache_hits", cache="dynamodb_players") == 10
+    assert METRICS.counter_value("cache_misses", cache="dynamodb_players") == 2
+
+
+def test_export_invalidates_written_players():
+    exporter = make_exporter()
+    assert exporter.get_player_by_id("1", "players")["value"] == "5.0"
+    exporter.get_player_by_id("2", "players")["value"] = "tampered"
+
+    assert exporter.export_players_data([{"playerId": "1", "value": 6.5}], "players")
+
+    assert exporter.get_player_by_id("1", "players")["value"] == "6.5"
+    # Untouched players stay cached, and callers only ever modify copies
+    assert exporter.get_player_by_id("2", "players")["value"] == "5.0"
+    assert exporter._dynamodb.read_count == 3
+
+
+def test_failed_lookups_are_not_cached(monkeypatch):
+    exporter = make_exporter()
+    table = exporter._dynamodb.Table("players")
+    get_item = table.get_item
+    calls = []
+
+    def flaky_get_item(Key):
+        calls.append(Key)
+        if len(calls) == 1:
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}},
+                "GetItem",
+            )
+        return get_item(Key=Key)
+
+    monkeypatch.setattr(table, "get_item", flaky_get_item)
+    monkeypatch.setattr(exporter._dynamodb, "Table", lambda name: table)
+
+    assert exporter.get_player_by_id("1", "players") is None
+    assert exporter.get_player_by_id("1", "players")["name"] == "Player 1"
+    assert len(calls) == 2
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from src.core.match_stats import MatchStatsTable
+from src.core.metrics import METRICS
+from src.exporters.dynamodb_exporter import DynamoDBExporter
+from src.exporters.dynamodb_writer import ParallelBatchWriter
+from src.testing.local_dynamodb import LocalDynamoDBResource
+
+
+def make_resource(*tables):
+    resource = LocalDynamoDBResource()
+    for name, keys in tables:
+        resource.create_table(
+            TableName=name, KeySchema=[{"AttributeName": key} for key in keys]
+        )
+    return resource
+
+
+def test_write_shards_into_25_item_batches():
+    resource = make_resource(("players", ["playerId"]))
+    writer = ParallelBatchWriter(resource.meta.client, workers=4)
+
+    result = writer.write("players", ({"playerId": str(i), "value": 5.5} for i in range(110)))
+
+    assert (result.items, result.written, result.failed) == (110, 110, 0)
+    assert resource.meta.client.batch_calls == 5
+    assert len(resource.tables["players"]) == 110
+    assert resource.tables["players"][("7",)]["value"] == Decimal("5.5")
+
+
+def test_unprocessed_items_are_retried_with_backoff():
+    resource = make_resource(("players", ["playerId"]))
+    resource.meta.client.unprocessed_every = 3
+    delays = []
+    writer = ParallelBatchWriter(resource.meta.client, workers=2, sleep=delays.append)
+    METRICS.reset()
+
+    result = writer.write("players", ({"playerId": str(i)} for i in range(60)))
+
+    assert result.written == 60 and result.failed == 0
+    assert result.retries > 0 and delays
+    assert len(resource.tables["players"]) == 60
+    assert METRICS.counter_value("dynamodb_unprocessed_retries") == result.retries
+
+
+def test_items_still_unprocessed_after_max_attempts_count_as_failed():
+    resource = make_resource(("players", ["playerId"]))
+    resource.meta.client.unprocessed_every = 1
+    writer = ParallelBatchWriter(resource.meta.client, max_attempts=3, sleep=lambda _: None)
+
+    result = writer.write("players", [{"playerId": "1"}, {"playerId": "2"}])
+
+    assert (result.written, result.failed, result.retries) == (0, 2, 3)
+
+
+def test_export_all_writes_tables_in_one_pass():
+    exporter = DynamoDBExporter(workers=3)
+    exporter._dynamodb = LocalDynamoDBResource()
+    players = [{"playerId": i, "name": f"Player {i}", "price": 6.0} for i in range(30)]
+    stats = MatchStatsTable()
+    for i in range(30):
+        stats.add(i, 1, "gS", 1)
+
+    assert exporter.export_all(
+        players_data=players,
+        players_table="players",
+        match_stats=stats,
+        match_stats_table="stats",
+        team_players=players[:15],
+        team_table="team",
+    )
+
+    tables = exporter._dynamodb.tables
+    assert (len(tables["players"]), len(tables["stats"]), len(tables["team"])) == (30, 30, 15)
+    assert tables["players"][("3",)]["price"] == "6.0"
+    assert tables["stats"][("3", 1)]["gS"] == 1
+    # 75 items pack into exactly 3 mixed-table batches
+    assert exporter._dynamodb.meta.client.batch_calls == 3
@@ -0,0 +1,90 @@
+import csv
+import sqlite3
+import sys
+
+import pytest
+
+from src.core.metrics import METRICS
+from src.core.team_mapper import TeamMapper
+from src.exporters.csv_exporter import CSVExporter
+from src.exporters.dynamodb_exporter import DynamoDBExporter
+from src.exporters.parquet_exporter import ParquetSink
+from src.exporters.pipeline import ExportPipeline, ExportSink
+from src.exporters.sqlite_exporter import SQLiteSink
+from src.testing.local_dynamodb import LocalDynamoDBResource
+
+
+def players(count):
+    for i in range(count):
+        player = {"playerId": i, "name": f"Player {i}", "team": "Team", "MD1": i}
+        if i >= count // 2:
+            # Later matchdays only show up halfway through the stream
+            player["MD2"] = 2 * i
+        yield player
+
+
+class FailingSink(ExportSink):
+    name = "failing"
+
+    def write(self, record):
+        raise ValueError("disk full")
+
+
+def test_fan_out_consumes_the_stream_once(tmp_path):
+    exporter = DynamoDBExporter()
+    exporter._dynamodb = LocalDynamoDBResource()
+    sinks = [
+        CSVExporter(TeamMapper()).sink(str(tmp_path / "players.csv")),
+        SQLiteSink(str(tmp_path / "players.db")),
+        exporter.sink("players"),
+    ]
+    METRICS.reset()
+
+    pipeline = ExportPipeline(sinks)
+    assert pipeline.run(players(40))
+
+    assert [(r.sink, r.records, r.success) for r in pipeline.results] == [
+        ("csv", 40, True), ("sqlite", 40, True), ("dynamodb", 40, True),
+    ]
+    with open(tmp_path / "players.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 40 and rows[-1]["MD2"] == "78"
+    with sqlite3.connect(tmp_path / "players.db") as conn:
+        assert conn.execute("SELECT COUNT(*), MAX(MD2) FROM players").fetchone() == (40, 78)
+    assert len(exporter._dynamodb.tables["players"]) == 40
+    assert METRICS.counter_value("export_records", sink="sqlite", data="players") == 40
+
+
+def test_failing_sink_does_not_stop_the_others(tmp_path):
+    sqlite_sink = SQLiteSink(str(tmp_path / "players.db"))
+    pipeline = ExportPipeline([FailingSink(), sqlite_sink])
+
+    assert not pipeline.run(players(10))
+
+    assert [r.success for r in pipeline.results] == [False, True]
+    with sqlite3.connect(tmp_path / "players.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM players").fetchone() == (10,)
+
+
+def test_parquet_sink_without_pyarrow_fails_cleanly(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    pipeline = ExportPipeline([ParquetSink(str(tmp_path / "players.parquet"))])
+
+    assert not pipeline.run(players(3))
+    assert not (tmp_path / "players.parquet").exists()
+
+
+def test_fixture_columns_keep_their_kickoff_next_to_them():
+    fields = ["MD2", "fixture 2 kickoff", "fixture 10", "fixture 1", "MD1", "fixture 2", "fixture 1 kickoff"]
+    columns = CSVExporter.players_fieldnames(fields)
+    assert columns[len(CSVExporter.PLAYER_BASE_FIELDS):] == [
+        "fixture 1", "fixture 1 kickoff", "fixture 2", "fixture 2 kickoff", "fixture 10", "MD1", "MD2",
+    ]
+
+
+def test_sink_without_write_cannot_be_created():
+    class IncompleteSink(ExportSink):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteSink()